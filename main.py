@@ -4,6 +4,7 @@ Fichier principal du projet.
 import sys
 
 from rich.console import Console
+from rich.prompt import Confirm, IntPrompt
 
 from src.classes.settings import Settings
 
@@ -12,7 +13,12 @@ from src.utils.prompt import (
     prompt_options,
     prompt_files_to_load,
 )
-from src.utils.files import list_save_files, load_save_file
+from src.utils.files import (
+    list_save_files,
+    load_save_file,
+    load_checkpoint,
+    load_replay,
+)
 from src.utils.run_simulation import run_simulation
 
 
@@ -45,15 +51,29 @@ def main(no_saves=False, error_message: str = None):
         if file == "back":
             return main()
 
-        raw_settings = load_save_file(file)
         try:
-            settings = Settings(**raw_settings)
+            settings = Settings(**load_save_file(file))
+        except FileNotFoundError as error:
+            return main(error_message=str(error))
         except ValueError as error:
             return main(error_message=str(error))
         except TypeError as error:
             return main(error_message=str(error))
 
-        if run_simulation(console, settings):
+        colony = None
+        if Confirm.ask("Resume from where the simulation was saved?"):
+            try:
+                colony = load_checkpoint(file)
+            except (FileNotFoundError, ValueError) as error:
+                return main(error_message=str(error))
+        elif Confirm.ask("Jump to a day of the recorded simulation?"):
+            try:
+                replay = load_replay(file)
+                colony = replay.colony_at(IntPrompt.ask("Day", default=replay.last_day))
+            except (FileNotFoundError, ValueError) as error:
+                return main(error_message=str(error))
+
+        if run_simulation(console, settings, colony):
             return main()
         return sys.exit()
     if user_choice == "3":
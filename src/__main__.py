@@ -0,0 +1,327 @@
+"""
+Interface en ligne de commande pour lancer des simulations sans affichage.
+
+Exemples :
+    python -m src run --settings settings.json --max-days 3650
+    python -m src ensemble --runs 200 --max-days 3650 --workers 8
+    python -m src run --max-days 3650 --replay run.replay
+    python -m src replay run.replay --day 1500
+    python -m src drive --speed 0.05 --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from src.classes.settings import Settings
+from src.utils.files import load_settings_file
+from src.utils.headless import ENGINES, create_colony, simulate
+from src.utils.driver import CONTROL_PORT, SimulationDriver, drive as drive_colony
+from src.utils.ensemble import run_ensemble
+from src.utils.autosave import Autosaver
+from src.utils.compression import COMPRESSIONS
+from src.utils.replay import REPLAY_EVERY, Replay
+
+
+def run(arguments: argparse.Namespace) -> int:
+    """
+    Lance une simulation et affiche (ou écrit) ses métriques
+    """
+    settings = (
+        load_settings_file(arguments.settings) if arguments.settings else Settings()
+    )
+
+    autosaver = (
+        Autosaver(
+            arguments.autosave_days,
+            arguments.autosave_seconds,
+            compression=arguments.compression,
+            level=arguments.compression_level,
+        )
+        if arguments.autosave_days or arguments.autosave_seconds
+        else None
+    )
+
+    replay = Replay(settings, arguments.replay_every) if arguments.replay else None
+
+    start = time.perf_counter()
+    series = simulate(settings, arguments.max_days, arguments.engine, autosaver, replay)
+    elapsed = time.perf_counter() - start
+
+    if replay:
+        replay.save(
+            arguments.replay, arguments.compression, arguments.compression_level
+        )
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf8") as file:
+            json.dump(series.to_dict(), file)
+
+    days = len(series)
+    print(
+        f"{days} days in {elapsed:.2f}s ({days / elapsed if elapsed else 0:.0f} days/s)"
+    )
+    if days:
+        print(
+            f"Final day {series.days[-1]}: {series.ants[-1]} ants, "
+            f"{series.eggs[-1]} eggs, {series.workers[-1]} workers, "
+            f"{round(series.food[-1], 2)} food, "
+            f"queen {'alive' if series.queen_alive[-1] else 'deceased'}, "
+            f"{series.dead_ants[-1]} dead ants"
+        )
+    return 0
+
+
+def replay(arguments: argparse.Namespace) -> int:
+    """
+    Affiche l'état d'une simulation enregistrée à un jour donné (ou à
+    plusieurs jours avec --to et --step)
+    """
+    recorded = Replay.load(arguments.file)
+    stop = arguments.day + 1 if arguments.to is None else arguments.to + 1
+    for colony in recorded.iter_days(arguments.day, stop, arguments.step):
+        print(
+            f"Day {colony.day}: {colony.ant_count()} ants, "
+            f"{colony.egg_count()} eggs, {colony.worker_count()} workers, "
+            f"{round(colony.food.quantity, 2)} food, "
+            f"queen {'alive' if colony.queen.is_alive else 'deceased'}, "
+            f"{colony.dead_ant_count()} dead ants"
+        )
+    return 0
+
+
+def drive(arguments: argparse.Namespace) -> int:
+    """
+    Lance une simulation contrôlable pendant qu'elle tourne, depuis le clavier
+    (une commande par ligne) ou un socket local
+    """
+    settings = (
+        load_settings_file(arguments.settings) if arguments.settings else Settings()
+    )
+    driver = SimulationDriver(
+        create_colony(settings, arguments.engine),
+        arguments.speed,
+        arguments.max_days,
+    )
+    print(
+        "Commands: pause (p), resume (r), step [days] (s), speed <seconds>, "
+        "ff <x10|x100|adaptive|queen-death|extinction|population N|off>, "
+        "stop (q), status"
+    )
+    if arguments.port is not None:
+        print(f"Listening for commands on 127.0.0.1:{arguments.port}")
+
+    asyncio.run(
+        drive_colony(
+            driver,
+            port=arguments.port,
+            keyboard=not arguments.no_keyboard,
+            report=print,
+            report_every=arguments.report_every,
+        )
+    )
+    return 0
+
+
+def ensemble(arguments: argparse.Namespace) -> int:
+    """
+    Lance un ensemble de simulations et affiche (ou écrit) leurs statistiques
+    """
+    settings = (
+        load_settings_file(arguments.settings) if arguments.settings else Settings()
+    )
+    finished = []
+
+    def on_result(seed, series):
+        finished.append(seed)
+        print(
+            f"[{len(finished)}/{arguments.runs}] seed {seed}: "
+            f"{len(series)} days, {series.ants[-1] if len(series) else 0} ants"
+        )
+
+    start = time.perf_counter()
+    summary = run_ensemble(
+        settings,
+        arguments.runs,
+        arguments.max_days,
+        arguments.engine,
+        arguments.workers,
+        on_result=on_result,
+    )
+    elapsed = time.perf_counter() - start
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf8") as file:
+            json.dump(
+                {
+                    "days": summary["days"].tolist(),
+                    "runs": summary["runs"],
+                    **{
+                        metric: {
+                            "mean": summary[metric]["mean"].tolist(),
+                            "variance": summary[metric]["variance"].tolist(),
+                            "quantiles": {
+                                str(quantile): values.tolist()
+                                for quantile, values in summary[metric][
+                                    "quantiles"
+                                ].items()
+                            },
+                        }
+                        for metric in ("ants", "food")
+                    },
+                },
+                file,
+            )
+
+    print(
+        f"{arguments.runs} runs in {elapsed:.2f}s, "
+        f"final mean population {summary['ants']['mean'][-1]:.1f}, "
+        f"final mean food {summary['food']['mean'][-1]:.1f}"
+    )
+    return 0
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """
+    Crée le parseur des arguments de la ligne de commande
+    """
+    parser = argparse.ArgumentParser(prog="python -m src")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run a headless simulation")
+    run_parser.add_argument(
+        "--settings", help="JSON file in the shape of Settings.to_dict()"
+    )
+    run_parser.add_argument(
+        "--max-days", type=int, default=None, help="Stop after this many days"
+    )
+    run_parser.add_argument(
+        "--engine", choices=list(ENGINES), default="object", help="Colony engine"
+    )
+    run_parser.add_argument(
+        "--output", help="Write the per-day time series to this JSON file"
+    )
+    run_parser.add_argument(
+        "--autosave-days", type=int, default=None, help="Autosave every N days"
+    )
+    run_parser.add_argument(
+        "--autosave-seconds",
+        type=float,
+        default=None,
+        help="Autosave every M seconds of wall-clock time",
+    )
+    run_parser.add_argument(
+        "--compression",
+        choices=list(COMPRESSIONS),
+        default=None,
+        help="Compress autosaves and the replay file with this codec",
+    )
+    run_parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=None,
+        help="Compression level (default: the codec's own default)",
+    )
+    run_parser.add_argument(
+        "--replay", help="Record sparse checkpoints to this file (object engine)"
+    )
+    run_parser.add_argument(
+        "--replay-every",
+        type=int,
+        default=REPLAY_EVERY,
+        help="Days between two replay checkpoints",
+    )
+    run_parser.set_defaults(handler=run)
+
+    replay_parser = commands.add_parser(
+        "replay", help="Show a recorded simulation at any day"
+    )
+    replay_parser.add_argument("file", help="Replay file written by run --replay")
+    replay_parser.add_argument("--day", type=int, required=True, help="Day to show")
+    replay_parser.add_argument(
+        "--to", type=int, default=None, help="Show every day up to this one"
+    )
+    replay_parser.add_argument(
+        "--step", type=int, default=1, help="Days between two lines with --to"
+    )
+    replay_parser.set_defaults(handler=replay)
+
+    drive_parser = commands.add_parser(
+        "drive", help="Run a simulation that can be paused, stepped and sped up"
+    )
+    drive_parser.add_argument(
+        "--settings", help="JSON file in the shape of Settings.to_dict()"
+    )
+    drive_parser.add_argument(
+        "--max-days", type=int, default=None, help="Stop after this many days"
+    )
+    drive_parser.add_argument(
+        "--engine", choices=list(ENGINES), default="object", help="Colony engine"
+    )
+    drive_parser.add_argument(
+        "--speed",
+        type=float,
+        default=None,
+        help="Seconds between two days (default: simulation_speed, 0 for max speed)",
+    )
+    drive_parser.add_argument(
+        "--port",
+        type=int,
+        nargs="?",
+        const=CONTROL_PORT,
+        default=None,
+        help=f"Accept commands on this local port (default: {CONTROL_PORT})",
+    )
+    drive_parser.add_argument(
+        "--no-keyboard", action="store_true", help="Ignore commands typed on stdin"
+    )
+    drive_parser.add_argument(
+        "--report-every",
+        type=float,
+        default=1.0,
+        help="Seconds between two status lines",
+    )
+    drive_parser.set_defaults(handler=drive)
+
+    ensemble_parser = commands.add_parser(
+        "ensemble", help="Run one simulation per seed and aggregate them"
+    )
+    ensemble_parser.add_argument(
+        "--settings", help="JSON file in the shape of Settings.to_dict()"
+    )
+    ensemble_parser.add_argument(
+        "--runs", type=int, default=100, help="Number of seeds to simulate"
+    )
+    ensemble_parser.add_argument(
+        "--max-days", type=int, required=True, help="Days simulated per run"
+    )
+    ensemble_parser.add_argument(
+        "--engine", choices=list(ENGINES), default="object", help="Colony engine"
+    )
+    ensemble_parser.add_argument(
+        "--workers", type=int, default=None, help="Processes (default: CPU count)"
+    )
+    ensemble_parser.add_argument(
+        "--output", help="Write the per-day statistics to this JSON file"
+    )
+    ensemble_parser.set_defaults(handler=ensemble)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    Point d'entrée de la ligne de commande
+    """
+    arguments = create_parser().parse_args(argv)
+    try:
+        return arguments.handler(arguments)
+    except (ValueError, TypeError, FileNotFoundError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,348 @@
+"""
+Ce module contient les benchmarks des chemins critiques de la simulation.
+
+Utilisation :
+    python -m src.benchmarks.bench_simulation --sizes 100 1000 --output bench.json
+    python -m src.benchmarks.bench_simulation --output new.json --compare old.json
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from src.classes.ant import Ant
+from src.classes.context import Context
+from src.classes.egg import Egg
+from src.classes.food import Food
+from src.classes.settings import Settings
+from src.utils.files import SAVE_FORMATS, create_save_file
+from src.utils.headless import ENGINES, create_colony
+
+SIZES = (100, 1_000, 10_000, 100_000, 1_000_000)
+DAYS = 10
+
+
+def __settings(size: int, days: int) -> Settings:
+    """
+    Paramètres d'une colonie de `size` fourmis qui ne manque pas de nourriture
+    pendant `days` jours
+    """
+    return Settings(
+        initial_ant_quantity=size,
+        initial_food_quantity=float(max(size, 1_000) * (days + 1) * 10),
+    )
+
+
+def __agents(colony) -> int:
+    """
+    Nombre d'agents mis à jour par une évolution de la colonie
+    """
+    return colony.ant_count() + colony.egg_count()
+
+
+def ant_evolve_case(size: int, days: int) -> Tuple[Callable, Callable]:
+    """
+    `size` fourmis qui évoluent `days` jours
+    """
+
+    def setup():
+        settings = __settings(size, days)
+        context = Context(settings, Food(settings))
+        return [
+            Ant(settings, context.food, max_age=days + 1, context=context)
+            for _ in range(size)
+        ]
+
+    def run(ants) -> int:
+        for _ in range(days):
+            for ant in ants:
+                ant.evolve()
+        return size * days
+
+    return setup, run
+
+
+def egg_evolve_case(size: int, days: int) -> Tuple[Callable, Callable]:
+    """
+    `size` oeufs qui évoluent `days` jours sans éclore
+    """
+
+    def setup():
+        settings = __settings(size, days)
+        context = Context(settings, Food(settings))
+        return [
+            Egg(settings, context.food, max_age=days + 1, context=context)
+            for _ in range(size)
+        ]
+
+    def run(eggs) -> int:
+        for _ in range(days):
+            for egg in eggs:
+                egg.evolve()
+        return size * days
+
+    return setup, run
+
+
+def colony_evolve_case(size: int, days: int, engine: str) -> Tuple[Callable, Callable]:
+    """
+    Une colonie de `size` fourmis qui évolue `days` jours
+    """
+
+    def setup():
+        return create_colony(__settings(size, days), engine)
+
+    def run(colony) -> int:
+        updates = 0
+        for _ in range(days):
+            updates += __agents(colony)
+            colony.evolve()
+        return updates
+
+    return setup, run
+
+
+def to_dict_case(size: int, engine: str) -> Tuple[Callable, Callable]:
+    """
+    Conversion en dictionnaire d'une colonie de `size` fourmis
+    """
+
+    def setup():
+        return create_colony(__settings(size, 0), engine)
+
+    def run(colony) -> int:
+        colony.to_dict()
+        return __agents(colony)
+
+    return setup, run
+
+
+def save_file_case(
+    size: int, engine: str, file_format: str = "json"
+) -> Tuple[Callable, Callable]:
+    """
+    Sauvegarde sur disque d'une colonie de `size` fourmis
+    """
+
+    def setup():
+        return create_colony(__settings(size, 0), engine)
+
+    def run(colony) -> int:
+        with tempfile.TemporaryDirectory() as directory:
+            create_save_file(colony, directory, file_format)
+        return __agents(colony)
+
+    return setup, run
+
+
+def measure(setup: Callable, run: Callable, repeat: int = 1) -> dict:
+    """
+    Mesure le meilleur temps de `run` sur `repeat` essais, puis le pic de
+    mémoire (setup compris) dans une passe séparée : tracemalloc ralentit
+    l'exécution et fausserait les temps.
+    """
+    best = None
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        updates = run(state)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+        del state
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(setup())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds": best,
+        "updates": updates,
+        "updates_per_second": updates / best if best else None,
+        "peak_memory": peak,
+    }
+
+
+def __cases(sizes: List[int], engines: List[str], days: int):
+    """
+    Génère (nom, moteur, taille, jours, setup, run) pour chaque benchmark
+    """
+    for size in sizes:
+        yield ("ant.evolve", None, size, days, *ant_evolve_case(size, days))
+        yield ("egg.evolve", None, size, days, *egg_evolve_case(size, days))
+        for engine in engines:
+            yield (
+                "colony.evolve",
+                engine,
+                size,
+                days,
+                *colony_evolve_case(size, days, engine),
+            )
+            yield ("colony.to_dict", engine, size, None, *to_dict_case(size, engine))
+            for file_format in SAVE_FORMATS:
+                yield (
+                    "create_save_file"
+                    if file_format == "json"
+                    else f"create_save_file.{file_format}",
+                    engine,
+                    size,
+                    None,
+                    *save_file_case(size, engine, file_format),
+                )
+
+
+def run_benchmarks(
+    sizes: List[int] = SIZES,
+    engines: List[str] = tuple(ENGINES),
+    days: int = DAYS,
+    repeat: int = 1,
+    on_result=None,
+) -> List[dict]:
+    """
+    Lance tous les benchmarks et renvoie leurs résultats.
+    `on_result(result)` est appelé après chaque benchmark.
+    """
+    results = []
+    for name, engine, size, case_days, setup, run in __cases(sizes, engines, days):
+        result = {"name": name, "engine": engine, "size": size, "days": case_days}
+        result.update(measure(setup, run, repeat))
+        result["days_per_second"] = (
+            case_days / result["seconds"] if case_days and result["seconds"] else None
+        )
+        results.append(result)
+        if on_result:
+            on_result(result)
+    return results
+
+
+def __commit() -> str:
+    """
+    Commit courant du dépôt, s'il est disponible
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def create_report(results: List[dict]) -> dict:
+    """
+    Rapport lisible par une machine, pour comparer des commits entre eux
+    """
+    return {
+        "commit": __commit(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def __key(result: dict) -> tuple:
+    return result["name"], result["engine"], result["size"]
+
+
+def compare(old_report: dict, new_report: dict) -> List[dict]:
+    """
+    Compare deux rapports : le rapport de vitesse est > 1 si le nouveau
+    commit est plus rapide
+    """
+    old_results = {__key(result): result for result in old_report["results"]}
+    comparison = []
+    for result in new_report["results"]:
+        old = old_results.get(__key(result))
+        if old is None or not result["seconds"]:
+            continue
+        comparison.append(
+            {
+                "name": result["name"],
+                "engine": result["engine"],
+                "size": result["size"],
+                "speedup": old["seconds"] / result["seconds"],
+                "memory_ratio": (
+                    result["peak_memory"] / old["peak_memory"]
+                    if old["peak_memory"]
+                    else None
+                ),
+            }
+        )
+    return comparison
+
+
+def __format_result(result: dict) -> str:
+    days_per_second = (
+        f"{result['days_per_second']:>10.1f} days/s"
+        if result["days_per_second"]
+        else " " * 17
+    )
+    return (
+        f"{result['name']:<26}{result['engine'] or '-':<8}{result['size']:>9} "
+        f"{result['seconds']:>9.4f}s {days_per_second} "
+        f"{result['updates_per_second'] or 0:>14.0f} updates/s "
+        f"{result['peak_memory'] / 2**20:>9.1f} MiB"
+    )
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Point d'entrée des benchmarks
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.benchmarks.bench_simulation",
+        description="Benchmark the simulation hot paths.",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument(
+        "--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES)
+    )
+    parser.add_argument("--days", type=int, default=DAYS)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--output", help="JSON file to write the report to")
+    parser.add_argument("--compare", help="JSON report of a previous run")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.sizes,
+        args.engines,
+        args.days,
+        args.repeat,
+        on_result=lambda result: print(__format_result(result), flush=True),
+    )
+    report = create_report(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf8") as file:
+            old_report = json.load(file)
+        print(f"\nCompared with {old_report.get('commit')}:")
+        for line in compare(old_report, report):
+            print(
+                f"{line['name']:<26}{line['engine'] or '-':<8}{line['size']:>9} "
+                f"x{line['speedup']:.2f}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,28 +7,49 @@ import random
 from src.classes.food import Food
 from src.classes.settings import Settings
 from src.classes.enums import State, Job
+from src.classes.context import Context
 
 
 class Ant:
     """
-    Classe représentant une fourmi
+    Classe représentant une fourmi.
+
+    Les attributs sont déclarés dans __slots__ et les paramètres et la
+    nourriture sont partagés via un Context : une fourmi occupe environ
+    72 octets, contre environ 128 avec un __dict__ et deux références.
+    La validation n'a lieu que dans les setters publics.
     """
 
-    def __init__(self, settings: Settings, food: Food):
+    __slots__ = ("__age", "__max_age", "__state", "__profession", "__context")
+
+    def __init__(
+        self,
+        settings: Settings,
+        food: Food,
+        max_age=None,
+        profession=None,
+        context: Context = None,
+    ):
         self.__age = 0
-        self.__max_age = random.randint(
-            settings.ant_avg_age - settings.ant_avg_age_variation,
-            settings.ant_avg_age + settings.ant_avg_age_variation,
+        self.__max_age = (
+            max_age
+            if max_age is not None
+            else random.randint(
+                settings.ant_avg_age - settings.ant_avg_age_variation,
+                settings.ant_avg_age + settings.ant_avg_age_variation,
+            )
         )
         self.__state = State.ALIVE
-        self.__profession = (
-            Job.WORKER
-            if random.random() < settings.ant_worker_chance
-            else Job.NOT_WORKER
-        )
+        if profession is not None:
+            self.__profession = profession
+        else:
+            self.__profession = (
+                Job.WORKER
+                if random.random() < settings.ant_worker_chance
+                else Job.NOT_WORKER
+            )
 
-        self.__settings = settings
-        self.__food = food
+        self.__context = context if context is not None else Context(settings, food)
 
     def __validate_value(
         self,
@@ -110,14 +131,14 @@ class Ant:
         """
         Paramètres de la simulation
         """
-        return self.__settings
+        return self.__context.settings
 
     @property
     def food(self) -> Food:
         """
         Nourriture de la fourmi
         """
-        return self.__food
+        return self.__context.food
 
     @property
     def is_alive(self) -> bool:
@@ -141,16 +162,30 @@ class Ant:
         self.__validate_value(value, Job, "Le job doit être un Job")
         self.__profession = value
 
+    def grow(self, days: int = 1):
+        """
+        Fait vieillir la fourmi de `days` jours, sans validation
+        """
+        self.__age += days
+
+    def kill(self):
+        """
+        Tue la fourmi, sans validation
+        """
+        self.__state = State.DEAD
+
     def evolve(self):
         """
         Fait évoluer la fourmi
         """
-        if self.is_alive and self.__food.quantity >= self.__settings.ant_hunger:
+        settings = self.__context.settings
+        food = self.__context.food
+        if self.__state is State.ALIVE and food.quantity >= settings.ant_hunger:
             self.__age += 1
-            self.__food.remove(self.__settings.ant_hunger)
+            food.remove(settings.ant_hunger)
             if (
                 self.__age > self.__max_age
-                or random.random() < self.__settings.ant_random_death_chance
+                or random.random() < settings.ant_random_death_chance
             ):
                 self.__state = State.DEAD
         else:
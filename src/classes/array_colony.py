@@ -0,0 +1,556 @@
+"""
+Ce module contient la classe ArrayColony, une colonie dont les fourmis et les
+oeufs sont stockés dans des tableaux NumPy contigus
+"""
+
+import numpy as np
+
+from src.classes.food import Food
+from src.classes.settings import Settings
+from src.classes.enums import State, Job
+
+from src.classes.queen import Queen
+from src.classes.random_streams import RandomStreams
+
+
+class AntView:
+    """
+    Vue d'une fourmi stockée dans les tableaux d'une ArrayColony.
+    La vue n'est valable que jusqu'au prochain appel à ArrayColony.evolve.
+    """
+
+    __slots__ = ("__colony", "__index")
+
+    def __init__(self, colony: "ArrayColony", index: int):
+        self.__colony = colony
+        self.__index = index
+
+    def __validate_value(
+        self,
+        value,
+        value_type,
+        error_message="Invalid value",
+        min_value=None,
+        max_value=None,
+    ):
+        """
+        Valide une valeur. Vérifie le type et la plage de la valeur si c'est numérique.
+        """
+        if not isinstance(value, value_type):
+            raise TypeError(
+                f"{error_message}: Expected type {value_type}, got {type(value)} instead."
+            )
+
+        if isinstance(value, (int, float)):
+            if min_value is not None and value < min_value:
+                raise ValueError(
+                    f"{error_message}: Value {value} is less than minimum allowed {min_value}."
+                )
+            if max_value is not None and value > max_value:
+                raise ValueError(
+                    f"{error_message}: Value {value} is greater than maximum allowed {max_value}."
+                )
+
+    @property
+    def age(self) -> int:
+        """
+        Age de la fourmi
+        """
+        return int(self.__colony.ant_arrays["age"][self.__index])
+
+    @age.setter
+    def age(self, value: int):
+        """
+        Modifie l'age de la fourmi
+        """
+        self.__validate_value(
+            value, int, min_value=0, error_message="L'age doit être un entier"
+        )
+        self.__colony.ant_arrays["age"][self.__index] = value
+
+    @property
+    def max_age(self) -> int:
+        """
+        Age maximal de la fourmi
+        """
+        return int(self.__colony.ant_arrays["max_age"][self.__index])
+
+    @max_age.setter
+    def max_age(self, value: int):
+        """
+        Modifie l'age maximal de la fourmi
+        """
+        self.__validate_value(
+            value, int, min_value=0, error_message="L'age maximal doit être un entier"
+        )
+        self.__colony.ant_arrays["max_age"][self.__index] = value
+
+    @property
+    def state(self) -> State:
+        """
+        Etat de la fourmi
+        """
+        return State(int(self.__colony.ant_arrays["alive"][self.__index]))
+
+    @state.setter
+    def state(self, value: State):
+        """
+        Modifie l'état de la fourmi
+        """
+        self.__validate_value(value, State, "L'état doit être un State")
+        self.__colony.ant_arrays["alive"][self.__index] = value == State.ALIVE
+
+    @property
+    def settings(self) -> Settings:
+        """
+        Paramètres de la simulation
+        """
+        return self.__colony.settings
+
+    @property
+    def food(self) -> Food:
+        """
+        Nourriture de la fourmi
+        """
+        return self.__colony.food
+
+    @property
+    def is_alive(self) -> bool:
+        """
+        Si la fourmi est vivante ou non
+        """
+        return bool(self.__colony.ant_arrays["alive"][self.__index])
+
+    @property
+    def profession(self) -> Job:
+        """
+        Job de la fourmi
+        """
+        return Job(int(self.__colony.ant_arrays["profession"][self.__index]))
+
+    @profession.setter
+    def profession(self, value: Job):
+        """
+        Modifie le job de la fourmi
+        """
+        self.__validate_value(value, Job, "Le job doit être un Job")
+        self.__colony.ant_arrays["profession"][self.__index] = value.value
+
+    def to_dict(self):
+        """
+        Convertit la fourmi en dictionnaire
+        """
+        return {
+            "age": self.age,
+            "max_age": self.max_age,
+            "state": self.state.value,
+            "profession": "worker" if self.profession else "not_worker",
+        }
+
+
+class EggView:
+    """
+    Vue d'un oeuf stocké dans les tableaux d'une ArrayColony.
+    La vue n'est valable que jusqu'au prochain appel à ArrayColony.evolve.
+    """
+
+    __slots__ = ("__colony", "__index")
+
+    def __init__(self, colony: "ArrayColony", index: int):
+        self.__colony = colony
+        self.__index = index
+
+    def __validate_value(
+        self,
+        value,
+        value_type,
+        error_message="Invalid value",
+        min_value=None,
+        max_value=None,
+    ):
+        """
+        Valide une valeur. Vérifie le type et la plage de la valeur si c'est numérique.
+        """
+        if not isinstance(value, value_type):
+            raise TypeError(
+                f"{error_message}: Expected type {value_type}, got {type(value)} instead."
+            )
+
+        if isinstance(value, (int, float)):
+            if min_value is not None and value < min_value:
+                raise ValueError(
+                    f"{error_message}: Value {value} is less than minimum allowed {min_value}."
+                )
+            if max_value is not None and value > max_value:
+                raise ValueError(
+                    f"{error_message}: Value {value} is greater than maximum allowed {max_value}."
+                )
+
+    @property
+    def age(self) -> int:
+        """
+        Age de l'oeuf
+        """
+        return int(self.__colony.egg_arrays["age"][self.__index])
+
+    @age.setter
+    def age(self, value: int):
+        """
+        Modifie l'age de l'oeuf
+        """
+        self.__validate_value(
+            value,
+            int,
+            min_value=0,
+            error_message="L'age ne peut pas être négatif",
+        )
+        self.__colony.egg_arrays["age"][self.__index] = value
+
+    @property
+    def max_age(self) -> int:
+        """
+        Age maximum de l'oeuf
+        """
+        return int(self.__colony.egg_arrays["max_age"][self.__index])
+
+    @max_age.setter
+    def max_age(self, value: int):
+        """
+        Modifie l'age maximum de l'oeuf
+        """
+        self.__validate_value(
+            value,
+            int,
+            min_value=0,
+            error_message="L'age maximum ne peut pas être négatif",
+        )
+        self.__colony.egg_arrays["max_age"][self.__index] = value
+
+    @property
+    def state(self) -> State:
+        """
+        Etat de l'oeuf
+        """
+        return State(int(self.__colony.egg_arrays["alive"][self.__index]))
+
+    @state.setter
+    def state(self, value: State):
+        """
+        Modifie l'etat de l'oeuf
+        """
+        self.__validate_value(value, State, "L'etat doit être un State")
+        self.__colony.egg_arrays["alive"][self.__index] = value == State.ALIVE
+
+    @property
+    def is_queen_egg(self) -> bool:
+        """
+        Si l'oeuf est une reine ou non
+        """
+        return bool(self.__colony.egg_arrays["is_queen_egg"][self.__index])
+
+    @is_queen_egg.setter
+    def is_queen_egg(self, value: bool):
+        """
+        Modifie si l'oeuf est une reine ou non
+        """
+        self.__validate_value(value, bool, "is_queen_egg doit être un booléen")
+        self.__colony.egg_arrays["is_queen_egg"][self.__index] = value
+
+    @property
+    def is_alive(self) -> bool:
+        """
+        Si l'oeuf est vivant ou non
+        """
+        return bool(self.__colony.egg_arrays["alive"][self.__index])
+
+    def to_dict(self):
+        """
+        Convertit l'oeuf en dictionnaire
+        """
+        return {
+            "age": self.age,
+            "max_age": self.max_age,
+            "state": self.state.value,
+            "is_queen_egg": self.is_queen_egg,
+        }
+
+
+class ArrayColony:
+    """
+    Classe représentant une colonie dont les fourmis et les oeufs sont stockés
+    en colonnes (un tableau NumPy par attribut). Une journée se résume à
+    quelques opérations vectorisées au lieu d'un appel à evolve par agent.
+    """
+
+    def __init__(self, settings: Settings, food: Food):
+        self.__settings = settings
+        self.__food = food
+        self.__streams = RandomStreams(settings)
+
+        self.__day = 0
+        self.__ants = self.__new_ants(settings.initial_ant_quantity)
+        self.__born_ants = settings.initial_ant_quantity + 1
+        self.__queen = self.__new_queen()
+        self.__eggs = self.__new_eggs(0, is_queen_egg=False)
+
+    def __new_ants(self, quantity: int) -> dict:
+        """
+        Crée les colonnes de `quantity` nouvelles fourmis
+        """
+        return {
+            "age": np.zeros(quantity, dtype=np.int32),
+            "max_age": self.__streams.ant_max_ages(quantity),
+            "profession": self.__streams.professions(quantity),
+            "alive": np.ones(quantity, dtype=bool),
+        }
+
+    def __new_eggs(self, quantity: int, is_queen_egg: bool) -> dict:
+        """
+        Crée les colonnes de `quantity` nouveaux oeufs
+        """
+        return {
+            "age": np.zeros(quantity, dtype=np.int32),
+            "max_age": self.__streams.egg_max_ages(quantity, is_queen_egg),
+            "is_queen_egg": np.full(quantity, is_queen_egg, dtype=bool),
+            "alive": np.ones(quantity, dtype=bool),
+        }
+
+    def __new_queen(self) -> Queen:
+        """
+        Crée une reine dont l'age maximal est tiré par le générateur de la colonie
+        """
+        return Queen(
+            self.__settings, self.__food, max_age=self.__streams.queen_max_age()
+        )
+
+    @staticmethod
+    def __concatenate(columns: dict, new_columns: dict) -> dict:
+        """
+        Ajoute de nouvelles lignes à des colonnes
+        """
+        return {
+            key: np.concatenate((column, new_columns[key]))
+            for key, column in columns.items()
+        }
+
+    @staticmethod
+    def __compact(columns: dict) -> dict:
+        """
+        Retire les lignes mortes des colonnes
+        """
+        alive = columns["alive"]
+        if alive.all():
+            return columns
+        return {key: column[alive] for key, column in columns.items()}
+
+    def __feed(self, costs: np.ndarray, threshold: float) -> np.ndarray:
+        """
+        Nourrit les agents dans l'ordre des colonnes, comme le ferait une boucle
+        d'appels à evolve. Renvoie le masque des agents qui ont pu manger.
+        """
+        spent = np.cumsum(costs)
+        before = np.maximum(self.__food.quantity - (spent - costs), 0)
+        fed = before >= threshold
+        self.__food.remove(float(costs[fed].sum()))
+        return fed
+
+    @property
+    def day(self) -> int:
+        """
+        Jour de la colonie
+        """
+        return self.__day
+
+    @property
+    def queen(self) -> Queen:
+        """
+        Reine de la colonie
+        """
+        return self.__queen
+
+    @property
+    def food(self) -> Food:
+        """
+        Nourriture de la colonie
+        """
+        return self.__food
+
+    @property
+    def settings(self) -> Settings:
+        """
+        Paramètres de la colonie
+        """
+        return self.__settings
+
+    @property
+    def ant_arrays(self) -> dict:
+        """
+        Colonnes des fourmis (age, max_age, profession, alive)
+        """
+        return self.__ants
+
+    @property
+    def egg_arrays(self) -> dict:
+        """
+        Colonnes des oeufs (age, max_age, is_queen_egg, alive)
+        """
+        return self.__eggs
+
+    @property
+    def ants(self) -> [AntView]:
+        """
+        Fourmis de la colonie, sous forme de vues sur les colonnes
+        """
+        return [AntView(self, index) for index in range(len(self.__ants["age"]))]
+
+    @property
+    def eggs(self) -> [EggView]:
+        """
+        Oeufs de la colonie, sous forme de vues sur les colonnes
+        """
+        return [EggView(self, index) for index in range(len(self.__eggs["age"]))]
+
+    def iter_ant_dicts(self):
+        """
+        Génère les dictionnaires des fourmis un par un, sans créer de liste
+        """
+        for index in range(len(self.__ants["age"])):
+            yield AntView(self, index).to_dict()
+
+    def iter_egg_dicts(self):
+        """
+        Génère les dictionnaires des oeufs un par un, sans créer de liste
+        """
+        for index in range(len(self.__eggs["age"])):
+            yield EggView(self, index).to_dict()
+
+    def ant_count(self) -> int:
+        """
+        Nombre de fourmis
+        """
+        return len(self.__ants["age"]) + int(self.__queen.is_alive)
+
+    def dead_ant_count(self) -> int:
+        """
+        Nombre de fourmis mortes
+        """
+        return self.__born_ants - self.ant_count()
+
+    def worker_count(self) -> int:
+        """
+        Nombre d'ouvrières
+        """
+        return int(np.count_nonzero(self.__ants["profession"] == Job.WORKER.value))
+
+    def egg_count(self) -> int:
+        """
+        Nombre d'oeufs
+        """
+        return len(self.__eggs["age"])
+
+    def __update_food(self):
+        self.__food.add(self.__streams.food_gain(self.worker_count()))
+
+    def __update_ants(self):
+        self.__queen.evolve()
+        if self.__queen.is_alive and self.__queen.age >= self.__queen.max_age - 1:
+            self.__lay_successor_egg()
+
+        ants = self.__ants
+        quantity = len(ants["age"])
+        fed = ants["alive"] & self.__feed(
+            np.full(quantity, self.__settings.ant_hunger),
+            self.__settings.ant_hunger,
+        )
+        ants["age"][fed] += 1
+        ants["alive"] = fed & (ants["age"] <= ants["max_age"])
+        ants["alive"] &= ~self.__streams.random_deaths(quantity)
+        self.__ants = self.__compact(ants)
+
+    def __lay_successor_egg(self):
+        if self.__queen.is_alive and self.food.quantity >= self.settings.queen_hunger:
+            self.food.remove(self.settings.queen_hunger)
+            self.__eggs = self.__concatenate(
+                self.__eggs, self.__new_eggs(1, is_queen_egg=True)
+            )
+
+    def __lay_eggs(self):
+        if self.__day % self.__settings.queen_laying_rate == 0:
+            if self.queen.is_alive and self.food.quantity >= self.settings.queen_hunger:
+                self.food.remove(self.settings.queen_hunger)
+                quantity = self.__streams.clutch_size()
+                self.__eggs = self.__concatenate(
+                    self.__eggs, self.__new_eggs(quantity, is_queen_egg=False)
+                )
+
+    def __update_eggs(self):
+        eggs = self.__eggs
+        is_queen_egg = eggs["is_queen_egg"]
+        fed = eggs["alive"] & self.__feed(
+            np.where(
+                is_queen_egg,
+                self.__settings.queen_egg_hunger,
+                self.__settings.egg_hunger,
+            ),
+            self.__settings.egg_hunger,
+        )
+        eggs["age"][fed] += 1
+        hatched = fed & (eggs["age"] > eggs["max_age"])
+        evolved = hatched & self.__streams.hatched(is_queen_egg)
+        eggs["alive"] = fed & ~hatched
+        self.__eggs = self.__compact(eggs)
+
+        new_ants = int(np.count_nonzero(evolved & ~is_queen_egg))
+        if new_ants:
+            self.__ants = self.__concatenate(self.__ants, self.__new_ants(new_ants))
+            self.__born_ants += new_ants
+
+        if np.any(evolved & is_queen_egg) and not self.__queen.is_alive:
+            self.__queen = self.__new_queen()
+
+    def evolve(self):
+        """
+        Fait évoluer la colonie d'un jour
+        """
+        self.__update_food()
+        self.__update_ants()
+        self.__update_eggs()
+        self.__lay_eggs()
+        self.__day += 1
+
+    def to_columns(self) -> dict:
+        """
+        Convertit la colonie en dictionnaire de colonnes typées, dans le même
+        ordre que to_dict
+        """
+        ants = self.__ants
+        eggs = self.__eggs
+        return {
+            "day": self.day,
+            "queen": self.queen.to_dict(),
+            "food": self.food.to_dict(),
+            "ants": {
+                "age": ants["age"],
+                "max_age": ants["max_age"],
+                "state": ants["alive"].astype(np.int8),
+                "profession": ants["profession"],
+            },
+            "eggs": {
+                "age": eggs["age"],
+                "max_age": eggs["max_age"],
+                "state": eggs["alive"].astype(np.int8),
+                "is_queen_egg": eggs["is_queen_egg"],
+            },
+        }
+
+    def to_dict(self):
+        """
+        Convertit la colonie en dictionnaire
+        """
+        return {
+            "day": self.day,
+            "queen": self.queen.to_dict(),
+            "food": self.food.to_dict(),
+            "ants": list(self.iter_ant_dicts()),
+            "eggs": list(self.iter_egg_dicts()),
+        }
@@ -0,0 +1,342 @@
+"""
+Ce module contient la classe CohortColony, une colonie représentée par des
+cohortes d'agents identiques plutôt que par un objet par agent
+"""
+
+import numpy as np
+
+from src.classes.food import Food
+from src.classes.settings import Settings
+from src.classes.enums import State, Job
+
+from src.classes.queen import Queen
+from src.classes.random_streams import RandomStreams
+
+
+class CohortColony:
+    """
+    Classe représentant une colonie sous forme de cohortes.
+
+    Une fourmi ne dépend que de son age, de son age maximal et de son job :
+    toutes les fourmis qui partagent ces valeurs forment une cohorte, stockée
+    comme un simple compteur. Une cohorte est identifiée par son jour de
+    départ (le jour de sa première évolution), ce qui évite de modifier les
+    clés chaque jour : l'age se déduit du jour courant. Le coût d'une journée
+    est proportionnel au nombre de cohortes et non au nombre de fourmis.
+    """
+
+    def __init__(self, settings: Settings, food: Food):
+        self.__settings = settings
+        self.__food = food
+        self.__streams = RandomStreams(settings)
+
+        self.__day = 0
+        self.__ants = self.__new_ant_cohorts(settings.initial_ant_quantity, 0)
+        self.__born_ants = settings.initial_ant_quantity + 1
+        self.__queen = self.__new_queen()
+        self.__eggs = self.__new_egg_cohorts(0, 0, is_queen_egg=False)
+
+    def __new_ant_cohorts(self, quantity: int, start_day: int) -> dict:
+        """
+        Crée les cohortes de `quantity` nouvelles fourmis
+        """
+        max_ages, counts = self.__streams.ant_max_age_counts(quantity)
+        workers = self.__streams.worker_counts(counts)
+        return {
+            "start_day": np.full(2 * len(counts), start_day, dtype=np.int32),
+            "max_age": np.concatenate((max_ages, max_ages)),
+            "profession": np.repeat(
+                np.array([Job.WORKER.value, Job.NOT_WORKER.value], dtype=np.int8),
+                len(counts),
+            ),
+            "count": np.concatenate((workers, counts - workers)),
+        }
+
+    def __new_egg_cohorts(
+        self, quantity: int, start_day: int, is_queen_egg: bool
+    ) -> dict:
+        """
+        Crée les cohortes de `quantity` nouveaux oeufs
+        """
+        max_ages, counts = self.__streams.egg_max_age_counts(quantity, is_queen_egg)
+        return {
+            "start_day": np.full(len(counts), start_day, dtype=np.int32),
+            "max_age": max_ages,
+            "is_queen_egg": np.full(len(counts), is_queen_egg, dtype=bool),
+            "count": counts,
+        }
+
+    def __new_queen(self) -> Queen:
+        """
+        Crée une reine dont l'age maximal est tiré par le générateur de la colonie
+        """
+        return Queen(
+            self.__settings, self.__food, max_age=self.__streams.queen_max_age()
+        )
+
+    @staticmethod
+    def __concatenate(cohorts: dict, new_cohorts: dict) -> dict:
+        """
+        Ajoute de nouvelles cohortes
+        """
+        return {
+            key: np.concatenate((column, new_cohorts[key]))
+            for key, column in cohorts.items()
+        }
+
+    @staticmethod
+    def __compact(cohorts: dict) -> dict:
+        """
+        Retire les cohortes vides
+        """
+        remaining = cohorts["count"] > 0
+        if remaining.all():
+            return cohorts
+        return {key: column[remaining] for key, column in cohorts.items()}
+
+    def __feed(
+        self, counts: np.ndarray, costs: np.ndarray, threshold: float
+    ) -> np.ndarray:
+        """
+        Nourrit les cohortes dans l'ordre, comme le ferait une boucle d'appels à
+        evolve sur chaque agent. Renvoie le nombre d'agents nourris par cohorte.
+        """
+        spent = np.cumsum(counts * costs)
+        before = np.maximum(self.__food.quantity - (spent - counts * costs), 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            affordable = np.where(
+                costs > 0, np.floor((before - threshold) / costs) + 1, counts
+            )
+        fed = np.where(before >= threshold, np.clip(affordable, 0, counts), 0).astype(
+            np.int64
+        )
+        self.__food.remove(float((fed * costs).sum()))
+        return fed
+
+    @property
+    def day(self) -> int:
+        """
+        Jour de la colonie
+        """
+        return self.__day
+
+    @property
+    def queen(self) -> Queen:
+        """
+        Reine de la colonie
+        """
+        return self.__queen
+
+    @property
+    def food(self) -> Food:
+        """
+        Nourriture de la colonie
+        """
+        return self.__food
+
+    @property
+    def settings(self) -> Settings:
+        """
+        Paramètres de la colonie
+        """
+        return self.__settings
+
+    @property
+    def ant_cohorts(self) -> dict:
+        """
+        Cohortes de fourmis (start_day, max_age, profession, count)
+        """
+        return self.__ants
+
+    @property
+    def egg_cohorts(self) -> dict:
+        """
+        Cohortes d'oeufs (start_day, max_age, is_queen_egg, count)
+        """
+        return self.__eggs
+
+    @property
+    def ants(self) -> [dict]:
+        """
+        Fourmis de la colonie, développées une par une en dictionnaires
+        """
+        return list(self.iter_ant_dicts())
+
+    @property
+    def eggs(self) -> [dict]:
+        """
+        Oeufs de la colonie, développés un par un en dictionnaires
+        """
+        return list(self.iter_egg_dicts())
+
+    def iter_ant_dicts(self):
+        """
+        Génère les dictionnaires des fourmis un par un, sans créer de liste
+        """
+        ants = self.__ants
+        for start_day, max_age, profession, count in zip(
+            ants["start_day"], ants["max_age"], ants["profession"], ants["count"]
+        ):
+            for _ in range(count):
+                yield {
+                    "age": int(self.__day - start_day),
+                    "max_age": int(max_age),
+                    "state": State.ALIVE.value,
+                    "profession": "worker" if Job(int(profession)) else "not_worker",
+                }
+
+    def iter_egg_dicts(self):
+        """
+        Génère les dictionnaires des oeufs un par un, sans créer de liste
+        """
+        eggs = self.__eggs
+        for start_day, max_age, is_queen_egg, count in zip(
+            eggs["start_day"], eggs["max_age"], eggs["is_queen_egg"], eggs["count"]
+        ):
+            for _ in range(count):
+                yield {
+                    "age": int(self.__day - start_day),
+                    "max_age": int(max_age),
+                    "state": State.ALIVE.value,
+                    "is_queen_egg": bool(is_queen_egg),
+                }
+
+    def ant_count(self) -> int:
+        """
+        Nombre de fourmis
+        """
+        return int(self.__ants["count"].sum()) + int(self.__queen.is_alive)
+
+    def dead_ant_count(self) -> int:
+        """
+        Nombre de fourmis mortes
+        """
+        return self.__born_ants - self.ant_count()
+
+    def worker_count(self) -> int:
+        """
+        Nombre d'ouvrières
+        """
+        ants = self.__ants
+        return int(ants["count"][ants["profession"] == Job.WORKER.value].sum())
+
+    def egg_count(self) -> int:
+        """
+        Nombre d'oeufs
+        """
+        return int(self.__eggs["count"].sum())
+
+    def __update_food(self):
+        self.__food.add(self.__streams.food_gain(self.worker_count()))
+
+    def __update_ants(self):
+        self.__queen.evolve()
+        if self.__queen.is_alive and self.__queen.age >= self.__queen.max_age - 1:
+            self.__lay_successor_egg()
+
+        ants = self.__ants
+        fed = self.__feed(
+            ants["count"],
+            np.full(len(ants["count"]), self.__settings.ant_hunger),
+            self.__settings.ant_hunger,
+        )
+        too_old = self.__day - ants["start_day"] + 1 > ants["max_age"]
+        ants["count"] = np.where(
+            too_old,
+            0,
+            fed - self.__streams.random_death_counts(fed),
+        )
+        self.__ants = self.__compact(ants)
+
+    def __lay_successor_egg(self):
+        if self.__queen.is_alive and self.food.quantity >= self.settings.queen_hunger:
+            self.food.remove(self.settings.queen_hunger)
+            self.__eggs = self.__concatenate(
+                self.__eggs, self.__new_egg_cohorts(1, self.__day, is_queen_egg=True)
+            )
+
+    def __lay_eggs(self):
+        if self.__day % self.__settings.queen_laying_rate == 0:
+            if self.queen.is_alive and self.food.quantity >= self.settings.queen_hunger:
+                self.food.remove(self.settings.queen_hunger)
+                quantity = self.__streams.clutch_size()
+                self.__eggs = self.__concatenate(
+                    self.__eggs,
+                    self.__new_egg_cohorts(
+                        quantity, self.__day + 1, is_queen_egg=False
+                    ),
+                )
+
+    def __update_eggs(self):
+        eggs = self.__eggs
+        is_queen_egg = eggs["is_queen_egg"]
+        fed = self.__feed(
+            eggs["count"],
+            np.where(
+                is_queen_egg,
+                self.__settings.queen_egg_hunger,
+                self.__settings.egg_hunger,
+            ),
+            self.__settings.egg_hunger,
+        )
+        hatched = self.__day - eggs["start_day"] + 1 > eggs["max_age"]
+        evolved = self.__streams.hatched_counts(np.where(hatched, fed, 0), is_queen_egg)
+        eggs["count"] = np.where(hatched, 0, fed)
+        self.__eggs = self.__compact(eggs)
+
+        new_ants = int(evolved[~is_queen_egg].sum())
+        if new_ants:
+            self.__ants = self.__concatenate(
+                self.__ants, self.__new_ant_cohorts(new_ants, self.__day + 1)
+            )
+            self.__born_ants += new_ants
+
+        if evolved[is_queen_egg].any() and not self.__queen.is_alive:
+            self.__queen = self.__new_queen()
+
+    def evolve(self):
+        """
+        Fait évoluer la colonie d'un jour
+        """
+        self.__update_food()
+        self.__update_ants()
+        self.__update_eggs()
+        self.__lay_eggs()
+        self.__day += 1
+
+    def to_columns(self) -> dict:
+        """
+        Convertit la colonie en dictionnaire de colonnes typées, dans le même
+        ordre que to_dict
+        """
+        ants = self.__ants
+        eggs = self.__eggs
+        return {
+            "day": self.day,
+            "queen": self.queen.to_dict(),
+            "food": self.food.to_dict(),
+            "ants": {
+                "age": np.repeat(self.__day - ants["start_day"], ants["count"]),
+                "max_age": np.repeat(ants["max_age"], ants["count"]),
+                "state": np.full(ants["count"].sum(), State.ALIVE.value, np.int8),
+                "profession": np.repeat(ants["profession"], ants["count"]),
+            },
+            "eggs": {
+                "age": np.repeat(self.__day - eggs["start_day"], eggs["count"]),
+                "max_age": np.repeat(eggs["max_age"], eggs["count"]),
+                "state": np.full(eggs["count"].sum(), State.ALIVE.value, np.int8),
+                "is_queen_egg": np.repeat(eggs["is_queen_egg"], eggs["count"]),
+            },
+        }
+
+    def to_dict(self):
+        """
+        Convertit la colonie en dictionnaire
+        """
+        return {
+            "day": self.day,
+            "queen": self.queen.to_dict(),
+            "food": self.food.to_dict(),
+            "ants": list(self.iter_ant_dicts()),
+            "eggs": list(self.iter_egg_dicts()),
+        }
@@ -2,16 +2,25 @@
 Ce module contient la classe Colony
 """
 
-import random
+import math
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Iterator
 
+import numpy as np
 
 from src.classes.food import Food
 from src.classes.settings import Settings
-from src.classes.enums import Job
+from src.classes.enums import State, Job
 
 from src.classes.ant import Ant
 from src.classes.egg import Egg
 from src.classes.queen import Queen
+from src.classes.random_streams import RandomStreams
+from src.classes.context import Context
+
+CHECKPOINT_CHUNK_SIZE = 10_000
+ANT_COLUMNS = ("serial", "start_day", "death_day", "max_age", "profession")
 
 
 class Colony:
@@ -19,16 +28,42 @@ class Colony:
     Classe représentant une colonie
     """
 
-    def __init__(self, settings: Settings, food: Food):
+    def __init__(self, settings: Settings, food: Food, debug: bool = False):
         self.__day = 0
-        self.__ants = [
-            Ant(settings, food) for _ in range(settings.initial_ant_quantity)
-        ]
-        self.__born_ants = settings.initial_ant_quantity + 1
-        self.__queen = Queen(settings, food)
-        self.__eggs = []
         self.__settings = settings
         self.__food = food
+        self.__debug = debug
+        self.__streams = RandomStreams(settings)
+        self.__context = Context(settings, food)
+
+        # Compteurs tenus à jour à chaque naissance, mort, ponte et éclosion
+        # pour que les statistiques de la colonie coûtent O(1).
+        self.__worker_quantity = 0
+        self.__egg_quantity = 0
+
+        # Les fourmis sont indexées par numéro de naissance : l'ordre
+        # d'insertion est l'ordre dans lequel elles mangent, et une fourmi
+        # peut être retirée en O(1) le jour de sa mort.
+        self.__ants = {}
+        self.__start_days = {}
+        self.__calendar = {}
+        self.__born_ants = 1
+        self.__journal = None
+        self.__add_ants(settings.initial_ant_quantity, start_day=0)
+        self.__queen = Queen(
+            settings,
+            food,
+            max_age=self.__streams.queen_max_age(),
+            context=self.__context,
+        )
+
+        # Les oeufs ordinaires ne sont que des compteurs rangés par jour
+        # d'éclosion, modulo la durée de vie maximale d'un oeuf. Chaque case
+        # associe le premier jour d'évolution des oeufs à leur nombre.
+        self.__egg_ring = [
+            {} for _ in range(settings.egg_avg_age + settings.egg_avg_age_variation + 2)
+        ]
+        self.__queen_eggs = []
 
     @property
     def day(self) -> int:
@@ -54,16 +89,33 @@ class Colony:
     @property
     def ants(self) -> [Ant]:
         """
-        Fourmis de la colonie
+        Fourmis de la colonie. Leur age n'est mis à jour que lors de cet appel.
         """
-        return self.__ants
+        for serial, ant in self.__ants.items():
+            ant.grow(self.__day - self.__start_days[serial] - ant.age)
+        return list(self.__ants.values())
 
     @property
     def eggs(self) -> [Egg]:
         """
-        Oeufs de la colonie
+        Oeufs de la colonie. Les oeufs ordinaires sont recréés à partir des
+        compteurs à chaque appel.
         """
-        return self.__eggs
+        eggs = []
+        size = len(self.__egg_ring)
+        for slot, bucket in enumerate(self.__egg_ring):
+            hatch_day = self.__day + (slot - self.__day) % size
+            for start_day, quantity in bucket.items():
+                for _ in range(quantity):
+                    egg = Egg(
+                        self.__settings,
+                        self.__food,
+                        max_age=hatch_day - start_day,
+                        context=self.__context,
+                    )
+                    egg.grow(self.__day - start_day)
+                    eggs.append(egg)
+        return eggs + self.__queen_eggs
 
     @property
     def settings(self) -> Settings:
@@ -72,6 +124,33 @@ class Colony:
         """
         return self.__settings
 
+    def iter_ant_dicts(self):
+        """
+        Génère les dictionnaires des fourmis un par un, sans créer de liste
+        """
+        for serial, ant in self.__ants.items():
+            ant.grow(self.__day - self.__start_days[serial] - ant.age)
+            yield ant.to_dict()
+
+    def iter_egg_dicts(self):
+        """
+        Génère les dictionnaires des oeufs un par un, directement à partir des
+        compteurs, sans créer d'objet Egg
+        """
+        size = len(self.__egg_ring)
+        for slot, bucket in enumerate(self.__egg_ring):
+            hatch_day = self.__day + (slot - self.__day) % size
+            for start_day, quantity in bucket.items():
+                for _ in range(quantity):
+                    yield {
+                        "age": self.__day - start_day,
+                        "max_age": hatch_day - start_day,
+                        "state": State.ALIVE.value,
+                        "is_queen_egg": False,
+                    }
+        for egg in self.__queen_eggs:
+            yield egg.to_dict()
+
     def ant_count(self) -> int:
         """
         Nombre de fourmis
@@ -88,63 +167,228 @@ class Colony:
         """
         Nombre d'ouvrières
         """
-        return len(
-            [worker for worker in self.__ants if worker.profession == Job.WORKER]
-        )
+        return self.__worker_quantity
 
     def egg_count(self) -> int:
         """
         Nombre d'oeufs
         """
-        return len(self.__eggs)
+        return self.__egg_quantity + len(self.__queen_eggs)
 
-    def __update_food(self):
-        self.__food.add(
-            random.randint(
-                round(self.worker_count() * self.__settings.min_food_multiplier),
-                round(self.worker_count() * self.__settings.max_food_multiplier),
-            )
+    def queen_egg_count(self) -> int:
+        """
+        Nombre d'oeufs de reine
+        """
+        return len(self.__queen_eggs)
+
+    def check_counters(self):
+        """
+        Recompte toute la colonie et vérifie que les compteurs sont corrects
+        """
+        workers = len(
+            [
+                worker
+                for worker in self.__ants.values()
+                if worker.profession == Job.WORKER
+            ]
         )
+        if workers != self.__worker_quantity:
+            raise RuntimeError(
+                f"Worker counter is {self.__worker_quantity}, recounted {workers}"
+            )
+        eggs = sum(sum(bucket.values()) for bucket in self.__egg_ring)
+        if eggs != self.__egg_quantity:
+            raise RuntimeError(
+                f"Egg counter is {self.__egg_quantity}, recounted {eggs}"
+            )
+        if len(self.__start_days) != len(self.__ants):
+            raise RuntimeError(
+                f"{len(self.__ants)} ants but {len(self.__start_days)} start days"
+            )
+        if any(not ant.is_alive for ant in self.__ants.values()):
+            raise RuntimeError("A dead ant is still counted in the colony")
+
+        if any(not egg.is_queen_egg or not egg.is_alive for egg in self.__queen_eggs):
+            raise RuntimeError("An ordinary or dead egg is counted as a queen egg")
+
+        # Chaque fourmi vivante a un numéro déjà attribué et un seul jour de
+        # mort à venir dans le calendrier : le nombre de fourmis mortes se
+        # déduit alors des numéros attribués.
+        if self.__ants and max(self.__ants) >= self.__born_ants:
+            raise RuntimeError(
+                f"Birth counter is {self.__born_ants} "
+                f"({self.dead_ant_count()} dead ants), "
+                f"but ant {max(self.__ants)} is alive"
+            )
+        scheduled = {}
+        for day, serials in self.__calendar.items():
+            for serial in serials:
+                if serial not in self.__ants:
+                    continue
+                if day < self.__day:
+                    raise RuntimeError(f"Ant {serial} should have died on day {day}")
+                scheduled[serial] = scheduled.get(serial, 0) + 1
+        if len(scheduled) != len(self.__ants) or any(
+            count != 1 for count in scheduled.values()
+        ):
+            raise RuntimeError("Each living ant must have exactly one death day")
+
+        if self.__journal is not None:
+            if any(serial not in self.__ants for serial in self.__journal["births"]):
+                raise RuntimeError("An ant born since the last delta is missing")
+            if any(serial in self.__ants for serial in self.__journal["deaths"]):
+                raise RuntimeError("An ant that died since the last delta is alive")
+
+    def __add_ants(self, quantity: int, start_day: int):
+        """
+        Ajoute `quantity` fourmis et inscrit le jour de leur mort dans le
+        calendrier. `start_day` est le premier jour où elles évoluent.
+        """
+        max_ages = self.__streams.ant_max_ages(quantity)
+        professions = self.__streams.professions(quantity)
+        lifetimes = self.__streams.ant_lifetimes(max_ages)
+        for max_age, profession, lifetime in zip(
+            max_ages.tolist(), professions.tolist(), lifetimes.tolist()
+        ):
+            serial = self.__born_ants
+            self.__born_ants += 1
+            ant = Ant(
+                self.__settings,
+                self.__food,
+                max_age=max_age,
+                profession=Job(profession),
+                context=self.__context,
+            )
+            self.__ants[serial] = ant
+            self.__start_days[serial] = start_day
+            if ant.profession == Job.WORKER:
+                self.__worker_quantity += 1
+            self.__calendar.setdefault(start_day + lifetime - 1, []).append(serial)
+            if self.__journal is not None:
+                self.__journal["births"][serial] = start_day + lifetime - 1
+
+    def __remove_ant(self, serial: int):
+        ant = self.__ants.pop(serial)
+        ant.kill()
+        del self.__start_days[serial]
+        if ant.profession == Job.WORKER:
+            self.__worker_quantity -= 1
+        # Une fourmi née et morte depuis le dernier delta n'y apparaît pas.
+        if self.__journal is not None:
+            if serial in self.__journal["births"]:
+                del self.__journal["births"][serial]
+            else:
+                self.__journal["deaths"].append(serial)
+
+    def __update_food(self):
+        self.__food.add(self.__streams.food_gain(self.worker_count()))
 
     def __update_ants(self):
         self.__queen.evolve()
         if self.__queen.is_alive and self.__queen.age >= self.__queen.max_age - 1:
             self.__lay_successor_egg()
 
-        for ant in self.__ants:
-            ant.evolve()
-        self.__ants = [ant for ant in self.__ants if ant.is_alive]
+        # Les fourmis mangent dans l'ordre : celles qui arrivent après
+        # l'épuisement de la nourriture meurent de faim.
+        quantity = len(self.__ants)
+        hunger = self.__settings.ant_hunger
+        fed = (
+            min(quantity, math.floor(self.__food.quantity / hunger))
+            if hunger > 0
+            else quantity
+        )
+        self.__food.remove(fed * hunger)
+        for _ in range(quantity - fed):
+            self.__remove_ant(next(reversed(self.__ants)))
+
+        for serial in self.__calendar.pop(self.__day, []):
+            if serial in self.__ants:
+                self.__remove_ant(serial)
 
     def __lay_successor_egg(self):
         if self.__queen.is_alive and self.food.quantity >= self.settings.queen_hunger:
             self.food.remove(self.settings.queen_hunger)
-            self.__eggs.append(Egg(self.settings, self.food, is_queen_egg=True))
+            self.__queen_eggs.append(
+                Egg(
+                    self.settings,
+                    self.food,
+                    is_queen_egg=True,
+                    max_age=int(self.__streams.egg_max_ages(1, is_queen_egg=True)[0]),
+                    context=self.__context,
+                )
+            )
 
     def __lay_eggs(self):
         if self.__day % self.__settings.queen_laying_rate == 0:
             if self.queen.is_alive and self.food.quantity >= self.settings.queen_hunger:
                 self.food.remove(self.settings.queen_hunger)
-                for _ in range(
-                    random.randint(
-                        self.settings.queen_avg_eggs
-                        - self.settings.queen_avg_egg_variation,
-                        self.settings.queen_avg_eggs
-                        + self.settings.queen_avg_egg_variation,
-                    )
-                ):
-                    self.__eggs.append(Egg(self.settings, self.food))
+                quantity = self.__streams.clutch_size()
+                max_ages, counts = self.__streams.egg_max_age_counts(quantity)
+                start_day = self.__day + 1
+                for max_age, count in zip(max_ages.tolist(), counts.tolist()):
+                    bucket = self.__egg_ring[
+                        (start_day + max_age) % len(self.__egg_ring)
+                    ]
+                    bucket[start_day] = bucket.get(start_day, 0) + count
+                self.__egg_quantity += quantity
+
+    def __starve_eggs(self, quantity: int):
+        """
+        Retire `quantity` oeufs ordinaires, en commençant par les plus récents
+        """
+        self.__egg_quantity -= quantity
+        newest_first = sorted(
+            ((start_day, bucket) for bucket in self.__egg_ring for start_day in bucket),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+        for start_day, bucket in newest_first:
+            if quantity == 0:
+                return
+            removed = min(quantity, bucket[start_day])
+            quantity -= removed
+            if removed == bucket[start_day]:
+                del bucket[start_day]
+            else:
+                bucket[start_day] -= removed
 
     def __update_eggs(self):
+        quantity = self.__egg_quantity
+        hunger = self.__settings.egg_hunger
+        fed = (
+            min(quantity, math.floor(self.__food.quantity / hunger))
+            if hunger > 0
+            else quantity
+        )
+        self.__food.remove(fed * hunger)
+        if fed < quantity:
+            self.__starve_eggs(quantity - fed)
+
+        slot = self.__day % len(self.__egg_ring)
+        hatching = sum(self.__egg_ring[slot].values())
+        self.__egg_ring[slot] = {}
+        self.__egg_quantity -= hatching
+        self.__add_ants(
+            int(self.__streams.hatched_counts(hatching, False)), self.__day + 1
+        )
+
         new_queen = None
-        for egg in self.__eggs:
-            new_ant = egg.evolve()
-            if new_ant:
-                if isinstance(new_ant, Queen):
-                    new_queen = new_ant
-                else:
-                    self.__ants.append(new_ant)
-                    self.__born_ants += 1
-        self.__eggs = [egg for egg in self.__eggs if egg.is_alive]
+        for egg in self.__queen_eggs:
+            if self.__food.quantity >= self.__settings.egg_hunger:
+                egg.grow()
+                self.__food.remove(self.__settings.queen_egg_hunger)
+                if egg.age > egg.max_age:
+                    egg.kill()
+                    if self.__streams.hatched_counts(1, True):
+                        new_queen = Queen(
+                            self.__settings,
+                            self.__food,
+                            max_age=self.__streams.queen_max_age(),
+                            context=self.__context,
+                        )
+            else:
+                egg.kill()
+        self.__queen_eggs = [egg for egg in self.__queen_eggs if egg.is_alive]
 
         if new_queen and not self.__queen.is_alive:
             self.__queen = new_queen
@@ -158,6 +402,269 @@ class Colony:
         self.__update_eggs()
         self.__lay_eggs()
         self.__day += 1
+        if self.__debug:
+            self.check_counters()
+
+    def checkpoint(self, with_ants: bool = True) -> dict:
+        """
+        Etat complet de la colonie, sérialisable en JSON. Une colonie
+        restaurée avec from_checkpoint continue exactement comme l'originale.
+        Sans `with_ants`, les colonnes des fourmis ne sont pas construites :
+        elles se lisent par blocs avec iter_checkpoint_ants.
+        """
+        checkpoint = {
+            "day": self.__day,
+            "born_ants": self.__born_ants,
+            "food": self.__food.quantity,
+            "queen": {
+                "age": self.__queen.age,
+                "max_age": self.__queen.max_age,
+                "state": self.__queen.state.value,
+            },
+            "egg_ring": [list(bucket.items()) for bucket in self.__egg_ring],
+            "queen_eggs": [egg.to_dict() for egg in self.__queen_eggs],
+            "random_state": self.__streams.get_state(),
+        }
+        if with_ants:
+            ants = {name: [] for name in ANT_COLUMNS}
+            for chunk in self.iter_checkpoint_ants():
+                for name, column in chunk.items():
+                    ants[name].extend(column)
+            checkpoint["ants"] = ants
+        return checkpoint
+
+    def iter_checkpoint_ants(
+        self, chunk_size: int = CHECKPOINT_CHUNK_SIZE
+    ) -> Iterator[dict]:
+        """
+        Génère les colonnes des fourmis du checkpoint par blocs d'au plus
+        `chunk_size` fourmis, sans copier toutes les fourmis
+        """
+        serials = iter(self.__ants)
+        chunk = list(islice(serials, chunk_size))
+        while chunk:
+            # Les fourmis et chaque liste du calendrier sont rangées par numéro
+            # de naissance : les jours de mort du bloc se trouvent par
+            # dichotomie, sans inverser tout le calendrier.
+            death_days = {}
+            for day, scheduled in self.__calendar.items():
+                start = bisect_left(scheduled, chunk[0])
+                for serial in scheduled[start : bisect_right(scheduled, chunk[-1])]:
+                    death_days[serial] = day
+
+            ants = {name: [] for name in ANT_COLUMNS}
+            for serial in chunk:
+                ant = self.__ants[serial]
+                ants["serial"].append(serial)
+                ants["start_day"].append(self.__start_days[serial])
+                ants["death_day"].append(death_days[serial])
+                ants["max_age"].append(ant.max_age)
+                ants["profession"].append(ant.profession.value)
+            yield ants
+            chunk = list(islice(serials, chunk_size))
+
+    def start_journal(self):
+        """
+        Commence à noter les naissances et les morts des fourmis, pour que
+        checkpoint_delta ne décrive que les changements depuis cet instant
+        """
+        self.__journal = {"births": {}, "deaths": []}
+
+    def checkpoint_delta(self) -> dict:
+        """
+        Changements depuis start_journal ou le delta précédent, sérialisables
+        en JSON : fourmis nées (et toujours en vie), numéros des fourmis
+        mortes, puis l'état complet de ce qui ne dépend pas du nombre de
+        fourmis (jour, nourriture, reine, compteurs d'oeufs, générateurs).
+        Appliqué au checkpoint précédent avec apply_deltas, il donne le
+        checkpoint du jour courant.
+        """
+        if self.__journal is None:
+            raise RuntimeError("start_journal must be called before checkpoint_delta")
+
+        births = {name: [] for name in ANT_COLUMNS}
+        for serial, death_day in self.__journal["births"].items():
+            ant = self.__ants[serial]
+            births["serial"].append(serial)
+            births["start_day"].append(self.__start_days[serial])
+            births["death_day"].append(death_day)
+            births["max_age"].append(ant.max_age)
+            births["profession"].append(ant.profession.value)
+        deaths = self.__journal["deaths"]
+        self.start_journal()
+
+        return {
+            "day": self.__day,
+            "born_ants": self.__born_ants,
+            "food": self.__food.quantity,
+            "queen": {
+                "age": self.__queen.age,
+                "max_age": self.__queen.max_age,
+                "state": self.__queen.state.value,
+            },
+            "births": births,
+            "deaths": deaths,
+            "egg_ring": [list(bucket.items()) for bucket in self.__egg_ring],
+            "queen_eggs": [egg.to_dict() for egg in self.__queen_eggs],
+            "random_state": self.__streams.get_state(),
+        }
+
+    @staticmethod
+    def apply_deltas(checkpoint: dict, deltas: list) -> dict:
+        """
+        Checkpoint obtenu en appliquant dans l'ordre les `deltas` (renvoyés
+        par checkpoint_delta) à `checkpoint`. Le checkpoint d'origine n'est
+        pas modifié.
+        """
+        if not deltas:
+            return checkpoint
+
+        # Les fourmis restent rangées par numéro de naissance : c'est l'ordre
+        # dans lequel elles mangent.
+        ants = checkpoint["ants"]
+        rows = dict(zip(ants["serial"], zip(*ants.values())))
+        for delta in deltas:
+            for serial in delta["deaths"]:
+                del rows[serial]
+            births = delta["births"]
+            rows.update(zip(births["serial"], zip(*(births[name] for name in ants))))
+
+        columns = list(zip(*rows.values())) or [()] * len(ants)
+        last = deltas[-1]
+        return {
+            "day": last["day"],
+            "born_ants": last["born_ants"],
+            "food": last["food"],
+            "queen": last["queen"],
+            "ants": {name: list(column) for name, column in zip(ants, columns)},
+            "egg_ring": last["egg_ring"],
+            "queen_eggs": last["queen_eggs"],
+            "random_state": last["random_state"],
+        }
+
+    @classmethod
+    def from_checkpoint(
+        cls, settings: Settings, checkpoint: dict, debug: bool = False
+    ) -> "Colony":
+        """
+        Recrée une colonie (et sa nourriture) à partir de son checkpoint. Les
+        fourmis du checkpoint sont des colonnes, ou une suite de blocs de
+        colonnes (voir iter_checkpoint_ants) lus au fur et à mesure.
+        """
+        colony = cls.__new__(cls)
+        colony.__restore(settings, checkpoint, debug)
+        return colony
+
+    def __restore(self, settings: Settings, checkpoint: dict, debug: bool):
+        food = Food(settings)
+        food.quantity = checkpoint["food"]
+
+        self.__day = checkpoint["day"]
+        self.__settings = settings
+        self.__food = food
+        self.__debug = debug
+        self.__streams = RandomStreams(settings)
+        self.__streams.set_state(checkpoint["random_state"])
+        self.__context = Context(settings, food)
+
+        queen = checkpoint["queen"]
+        self.__queen = Queen(
+            settings, food, max_age=queen["max_age"], context=self.__context
+        )
+        self.__queen.grow(queen["age"])
+        if State(queen["state"]) is State.DEAD:
+            self.__queen.kill()
+
+        self.__worker_quantity = 0
+        self.__ants = {}
+        self.__start_days = {}
+        self.__calendar = {}
+        self.__journal = None
+        self.__born_ants = checkpoint["born_ants"]
+        ants = checkpoint["ants"]
+        for chunk in [ants] if isinstance(ants, dict) else ants:
+            self.__restore_ants(chunk)
+
+        self.__egg_ring = [dict(bucket) for bucket in checkpoint["egg_ring"]]
+        self.__egg_quantity = sum(sum(bucket.values()) for bucket in self.__egg_ring)
+        self.__queen_eggs = []
+        for raw_egg in checkpoint["queen_eggs"]:
+            egg = Egg(
+                settings,
+                food,
+                is_queen_egg=True,
+                max_age=raw_egg["max_age"],
+                context=self.__context,
+            )
+            egg.grow(raw_egg["age"])
+            self.__queen_eggs.append(egg)
+
+    def __restore_ants(self, ants: dict):
+        for serial, start_day, death_day, max_age, profession in zip(
+            *(ants[name] for name in ANT_COLUMNS)
+        ):
+            ant = Ant(
+                self.__settings,
+                self.__food,
+                max_age=max_age,
+                profession=Job(profession),
+                context=self.__context,
+            )
+            self.__ants[serial] = ant
+            self.__start_days[serial] = start_day
+            if ant.profession == Job.WORKER:
+                self.__worker_quantity += 1
+            self.__calendar.setdefault(death_day, []).append(serial)
+
+    def to_columns(self) -> dict:
+        """
+        Convertit la colonie en dictionnaire de colonnes typées, dans le même
+        ordre que to_dict, sans créer d'objet par oeuf
+        """
+        quantity = len(self.__ants)
+        ants = self.__ants.values()
+
+        # Une ligne par compteur de l'anneau, puis une par oeuf de reine :
+        # les colonnes des oeufs sont ensuite développées avec np.repeat.
+        egg_ages, egg_max_ages, egg_counts, queen_eggs = [], [], [], []
+        size = len(self.__egg_ring)
+        for slot, bucket in enumerate(self.__egg_ring):
+            hatch_day = self.__day + (slot - self.__day) % size
+            for start_day, count in bucket.items():
+                egg_ages.append(self.__day - start_day)
+                egg_max_ages.append(hatch_day - start_day)
+                egg_counts.append(count)
+                queen_eggs.append(False)
+        for egg in self.__queen_eggs:
+            egg_ages.append(egg.age)
+            egg_max_ages.append(egg.max_age)
+            egg_counts.append(1)
+            queen_eggs.append(True)
+
+        return {
+            "day": self.day,
+            "queen": self.queen.to_dict(),
+            "food": self.food.to_dict(),
+            "ants": {
+                "age": self.__day
+                - np.fromiter(self.__start_days.values(), np.int32, quantity),
+                "max_age": np.fromiter(
+                    (ant.max_age for ant in ants), np.int32, quantity
+                ),
+                "state": np.full(quantity, State.ALIVE.value, np.int8),
+                "profession": np.fromiter(
+                    (ant.profession.value for ant in ants), np.int8, quantity
+                ),
+            },
+            "eggs": {
+                "age": np.repeat(np.array(egg_ages, dtype=np.int32), egg_counts),
+                "max_age": np.repeat(
+                    np.array(egg_max_ages, dtype=np.int32), egg_counts
+                ),
+                "state": np.full(sum(egg_counts), State.ALIVE.value, np.int8),
+                "is_queen_egg": np.repeat(np.array(queen_eggs, dtype=bool), egg_counts),
+            },
+        }
 
     def to_dict(self):
         """
@@ -167,6 +674,6 @@ class Colony:
             "day": self.day,
             "queen": self.queen.to_dict(),
             "food": self.food.to_dict(),
-            "ants": [ant.to_dict() for ant in self.ants],
-            "eggs": [egg.to_dict() for egg in self.eggs],
+            "ants": list(self.iter_ant_dicts()),
+            "eggs": list(self.iter_egg_dicts()),
         }
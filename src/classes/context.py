@@ -0,0 +1,34 @@
+"""
+Ce module contient la classe Context
+"""
+
+from src.classes.food import Food
+from src.classes.settings import Settings
+
+
+class Context:
+    """
+    Classe représentant le contexte partagé par tous les agents d'une colonie.
+    Les agents gardent une seule référence vers ce contexte au lieu d'une
+    référence vers les paramètres et une autre vers la nourriture.
+    """
+
+    __slots__ = ("__settings", "__food")
+
+    def __init__(self, settings: Settings, food: Food):
+        self.__settings = settings
+        self.__food = food
+
+    @property
+    def settings(self) -> Settings:
+        """
+        Paramètres de la simulation
+        """
+        return self.__settings
+
+    @property
+    def food(self) -> Food:
+        """
+        Nourriture de la colonie
+        """
+        return self.__food
@@ -7,6 +7,7 @@ import random
 from src.classes.food import Food
 from src.classes.settings import Settings
 from src.classes.enums import State
+from src.classes.context import Context
 
 from src.classes.ant import Ant
 from src.classes.queen import Queen
@@ -14,27 +15,37 @@ from src.classes.queen import Queen
 
 class Egg:
     """
-    Classe représentant un oeuf
+    Classe représentant un oeuf.
+    Comme Ant, un oeuf utilise __slots__ et partage un Context.
     """
 
-    def __init__(self, settings: Settings, food: Food, is_queen_egg=False):
+    __slots__ = ("__age", "__max_age", "__state", "__is_queen_egg", "__context")
+
+    def __init__(
+        self,
+        settings: Settings,
+        food: Food,
+        is_queen_egg=False,
+        max_age=None,
+        context: Context = None,
+    ):
         self.__age = 0
-        self.__max_age = (
-            random.randint(
+        if max_age is not None:
+            self.__max_age = max_age
+        elif is_queen_egg:
+            self.__max_age = random.randint(
                 settings.queen_avg_egg_age - settings.queen_avg_egg_age_variation,
                 settings.queen_avg_egg_age + settings.queen_avg_egg_age_variation,
             )
-            if is_queen_egg
-            else random.randint(
+        else:
+            self.__max_age = random.randint(
                 settings.egg_avg_age - settings.egg_avg_age_variation,
                 settings.egg_avg_age + settings.egg_avg_age_variation,
             )
-        )
         self.__state = State.ALIVE
         self.__is_queen_egg = is_queen_egg
 
-        self.__settings = settings
-        self.__food = food
+        self.__context = context if context is not None else Context(settings, food)
 
     def __validate_value(
         self,
@@ -139,25 +150,39 @@ class Egg:
         """
         return self.__state == State.ALIVE
 
+    def grow(self, days: int = 1):
+        """
+        Fait vieillir l'oeuf de `days` jours, sans validation
+        """
+        self.__age += days
+
+    def kill(self):
+        """
+        Tue l'oeuf, sans validation
+        """
+        self.__state = State.DEAD
+
     def evolve(self) -> Ant or None:
         """
         Fait évoluer l'oeuf
         """
-        if self.is_alive and self.__food.quantity >= self.__settings.egg_hunger:
+        context = self.__context
+        settings = context.settings
+        if self.__state is State.ALIVE and context.food.quantity >= settings.egg_hunger:
             self.__age += 1
-            self.__food.remove(
-                self.__settings.queen_egg_hunger
+            context.food.remove(
+                settings.queen_egg_hunger
                 if self.__is_queen_egg
-                else self.__settings.egg_hunger
+                else settings.egg_hunger
             )
             if self.__age > self.__max_age:
                 self.__state = State.DEAD
                 if self.__is_queen_egg:
-                    if random.random() < self.__settings.queen_egg_evolve_chance:
-                        return Queen(self.__settings, self.__food)
+                    if random.random() < settings.queen_egg_evolve_chance:
+                        return Queen(settings, context.food, context=context)
                 else:
-                    if random.random() < self.__settings.egg_evolve_chance:
-                        return Ant(self.__settings, self.__food)
+                    if random.random() < settings.egg_evolve_chance:
+                        return Ant(settings, context.food, context=context)
         else:
             self.__state = State.DEAD
         return None
@@ -0,0 +1,140 @@
+"""
+Ce module contient la classe History
+"""
+
+import threading
+
+HISTORY_METRICS = ("ants", "eggs", "workers", "food")
+HISTORY_WIDTH = 32
+
+
+class History:
+    """
+    Classe représentant l'historique résumé d'une simulation, pour un
+    graphique de largeur fixe.
+
+    Les jours sont regroupés en au plus 2 * `width` seaux de même taille,
+    chacun gardant le minimum et le maximum de chaque métrique. Quand tous
+    les seaux sont pleins, ils sont fusionnés deux à deux et leur taille
+    double : ajouter un jour coûte O(1) en moyenne et lire l'historique
+    coûte O(width), quelle que soit la durée de la simulation.
+    """
+
+    def __init__(self, width: int = HISTORY_WIDTH, metrics=HISTORY_METRICS):
+        if width < 1:
+            raise ValueError("The history must be at least one bucket wide")
+
+        self.__width = width
+        self.__metrics = tuple(metrics)
+        self.__lock = threading.Lock()
+        self.__days = 0
+        self.__bucket_days = 1
+        self.__filled = 0
+        self.__minimums = {name: [] for name in self.__metrics}
+        self.__maximums = {name: [] for name in self.__metrics}
+        self.__last = {}
+
+    def __len__(self) -> int:
+        return self.__days
+
+    @property
+    def width(self) -> int:
+        """
+        Nombre de colonnes du graphique
+        """
+        return self.__width
+
+    @property
+    def metrics(self) -> tuple:
+        """
+        Métriques de l'historique
+        """
+        return self.__metrics
+
+    @property
+    def bucket_days(self) -> int:
+        """
+        Nombre de jours par seau
+        """
+        return self.__bucket_days
+
+    def append(self, values: dict):
+        """
+        Ajoute les métriques d'un jour
+        """
+        with self.__lock:
+            minimums, maximums = self.__minimums, self.__maximums
+            if self.__filled == 0:
+                if len(minimums[self.__metrics[0]]) == 2 * self.__width:
+                    self.__halve()
+                for name in self.__metrics:
+                    minimums[name].append(values[name])
+                    maximums[name].append(values[name])
+            else:
+                for name in self.__metrics:
+                    value = values[name]
+                    if value < minimums[name][-1]:
+                        minimums[name][-1] = value
+                    elif value > maximums[name][-1]:
+                        maximums[name][-1] = value
+            self.__filled = (self.__filled + 1) % self.__bucket_days
+            self.__days += 1
+            self.__last = values
+
+    def record(self, colony):
+        """
+        Ajoute les métriques du jour courant d'une colonie
+        """
+        self.append(
+            {
+                "ants": colony.ant_count(),
+                "eggs": colony.egg_count(),
+                "workers": colony.worker_count(),
+                "food": colony.food.quantity,
+            }
+        )
+
+    def __halve(self):
+        """
+        Fusionne les seaux deux à deux
+        """
+        for name in self.__metrics:
+            minimums, maximums = self.__minimums[name], self.__maximums[name]
+            self.__minimums[name] = [
+                min(minimums[index], minimums[index + 1])
+                for index in range(0, len(minimums), 2)
+            ]
+            self.__maximums[name] = [
+                max(maximums[index], maximums[index + 1])
+                for index in range(0, len(maximums), 2)
+            ]
+        self.__bucket_days *= 2
+
+    def buckets(self) -> dict:
+        """
+        Copie de l'historique en au plus `width` colonnes : le nombre de
+        jours, le nombre de jours par colonne et, pour chaque métrique, les
+        listes "min" et "max" par colonne et la valeur "last" du dernier jour
+        """
+        with self.__lock:
+            minimums = {name: list(self.__minimums[name]) for name in self.__metrics}
+            maximums = {name: list(self.__maximums[name]) for name in self.__metrics}
+            last = dict(self.__last)
+            days = self.__days
+            column_days = self.__bucket_days
+
+        merge = len(minimums[self.__metrics[0]]) > self.__width
+        if merge:
+            column_days *= 2
+
+        columns = {}
+        for name in self.__metrics:
+            low, high = minimums[name], maximums[name]
+            if merge:
+                # Regroupe les seaux par paires pour ne pas dépasser `width`
+                low = [min(low[index : index + 2]) for index in range(0, len(low), 2)]
+                high = [
+                    max(high[index : index + 2]) for index in range(0, len(high), 2)
+                ]
+            columns[name] = {"min": low, "max": high, "last": last.get(name)}
+        return {"days": days, "column_days": column_days, "metrics": columns}
@@ -6,7 +6,8 @@ import random
 
 from src.classes.food import Food
 from src.classes.settings import Settings
-from src.classes.enums import State, Job
+from src.classes.enums import Job
+from src.classes.context import Context
 
 from src.classes.ant import Ant
 
@@ -16,22 +17,34 @@ class Queen(Ant):
     Classe représentant une reine
     """
 
-    def __init__(self, settings: Settings, food: Food):
-        super().__init__(settings, food)
-        self.max_age = random.randint(
-            settings.queen_avg_age - settings.queen_avg_age_variation,
-            settings.queen_avg_age + settings.queen_avg_age_variation,
+    __slots__ = ()
+
+    def __init__(
+        self, settings: Settings, food: Food, max_age=None, context: Context = None
+    ):
+        super().__init__(
+            settings,
+            food,
+            max_age=(
+                max_age
+                if max_age is not None
+                else random.randint(
+                    settings.queen_avg_age - settings.queen_avg_age_variation,
+                    settings.queen_avg_age + settings.queen_avg_age_variation,
+                )
+            ),
+            profession=Job.NOT_WORKER,
+            context=context,
         )
-        self.is_worker = Job.NOT_WORKER
 
     def evolve(self):
         """
         Fait évoluer la reine
         """
         if self.is_alive and self.food.quantity >= self.settings.queen_hunger:
-            self.age += 1
+            self.grow()
             self.food.remove(self.settings.queen_hunger)
             if self.age >= self.max_age:
-                self.state = State.DEAD
+                self.kill()
         else:
-            self.state = State.DEAD
+            self.kill()
@@ -0,0 +1,240 @@
+"""
+Ce module contient la classe RandomStreams
+"""
+
+import numpy as np
+
+from src.classes.settings import Settings
+from src.classes.enums import Job
+
+STREAMS = (
+    "ant_ages",
+    "professions",
+    "deaths",
+    "clutches",
+    "egg_ages",
+    "hatching",
+    "food",
+    "queens",
+)
+
+
+class RandomStreams:
+    """
+    Classe représentant les générateurs aléatoires d'une colonie.
+
+    Chaque sous-système (durées de vie, métiers, morts, pontes, éclosions,
+    nourriture, reines) tire dans son propre générateur NumPy, dérivé de
+    simulation_seed. Ajouter ou déplacer des tirages dans un sous-système ne
+    change donc pas les résultats des autres, et chaque tirage peut être fait
+    en une fois pour un lot d'agents.
+
+    Les trois moteurs utilisent les mêmes sous-systèmes, mais ne tirent pas
+    sous la même forme (tirages par agent pour ArrayColony, lois
+    multinomiales et binomiales par cohorte pour CohortColony, durées de vie
+    géométriques pour Colony). Une même graine redonne exactement la même
+    simulation avec un même moteur, mais d'un moteur à l'autre les résultats
+    diffèrent : ils ne sont équivalents qu'en moyenne.
+    """
+
+    def __init__(self, settings: Settings):
+        self.__settings = settings
+        children = np.random.SeedSequence(settings.simulation_seed).spawn(len(STREAMS))
+        self.__generators = {
+            name: np.random.Generator(np.random.PCG64(child))
+            for name, child in zip(STREAMS, children)
+        }
+
+    def generator(self, name: str) -> np.random.Generator:
+        """
+        Générateur d'un sous-système
+        """
+        return self.__generators[name]
+
+    def get_state(self) -> dict:
+        """
+        Etat de tous les générateurs, sérialisable en JSON
+        """
+        return {
+            name: generator.bit_generator.state
+            for name, generator in self.__generators.items()
+        }
+
+    def set_state(self, state: dict):
+        """
+        Restaure l'état de tous les générateurs
+        """
+        for name, generator in self.__generators.items():
+            generator.bit_generator.state = state[name]
+
+    def ant_max_ages(self, quantity: int) -> np.ndarray:
+        """
+        Ages maximaux de `quantity` nouvelles fourmis
+        """
+        return self.__generators["ant_ages"].integers(
+            self.__settings.ant_avg_age - self.__settings.ant_avg_age_variation,
+            self.__settings.ant_avg_age + self.__settings.ant_avg_age_variation,
+            size=quantity,
+            endpoint=True,
+            dtype=np.int32,
+        )
+
+    def ant_max_age_counts(self, quantity: int) -> tuple:
+        """
+        Répartit `quantity` nouvelles fourmis entre les ages maximaux possibles.
+        Renvoie les ages tirés au moins une fois et leur nombre de fourmis.
+        """
+        return self.__spread(
+            "ant_ages",
+            quantity,
+            self.__settings.ant_avg_age - self.__settings.ant_avg_age_variation,
+            self.__settings.ant_avg_age + self.__settings.ant_avg_age_variation,
+        )
+
+    def professions(self, quantity: int) -> np.ndarray:
+        """
+        Jobs (valeurs de Job) de `quantity` nouvelles fourmis
+        """
+        return np.where(
+            self.__generators["professions"].random(quantity)
+            < self.__settings.ant_worker_chance,
+            Job.WORKER.value,
+            Job.NOT_WORKER.value,
+        ).astype(np.int8)
+
+    def worker_counts(self, counts: np.ndarray) -> np.ndarray:
+        """
+        Nombre d'ouvrières dans chaque groupe de `counts` nouvelles fourmis
+        """
+        return self.__generators["professions"].binomial(
+            counts, self.__settings.ant_worker_chance
+        )
+
+    def ant_lifetimes(self, max_ages: np.ndarray) -> np.ndarray:
+        """
+        Nombre de jours que vivront des fourmis : leur mort aléatoire suit une
+        loi géométrique, bornée par leur age maximal
+        """
+        lifetimes = np.asarray(max_ages, dtype=np.int64) + 1
+        chance = self.__settings.ant_random_death_chance
+        if chance > 0:
+            lifetimes = np.minimum(
+                lifetimes,
+                self.__generators["deaths"].geometric(chance, size=len(lifetimes)),
+            )
+        return lifetimes
+
+    def random_deaths(self, quantity: int) -> np.ndarray:
+        """
+        Masque des fourmis mortes aléatoirement aujourd'hui
+        """
+        return (
+            self.__generators["deaths"].random(quantity)
+            < self.__settings.ant_random_death_chance
+        )
+
+    def random_death_counts(self, counts: np.ndarray) -> np.ndarray:
+        """
+        Nombre de morts aléatoires aujourd'hui dans chaque groupe de fourmis
+        """
+        return self.__generators["deaths"].binomial(
+            counts, self.__settings.ant_random_death_chance
+        )
+
+    def clutch_size(self) -> int:
+        """
+        Nombre d'oeufs d'une ponte
+        """
+        return int(
+            self.__generators["clutches"].integers(
+                self.__settings.queen_avg_eggs
+                - self.__settings.queen_avg_egg_variation,
+                self.__settings.queen_avg_eggs
+                + self.__settings.queen_avg_egg_variation,
+                endpoint=True,
+            )
+        )
+
+    def egg_max_ages(self, quantity: int, is_queen_egg: bool = False) -> np.ndarray:
+        """
+        Ages maximaux de `quantity` nouveaux oeufs
+        """
+        return self.__generators["egg_ages"].integers(
+            *self.__egg_age_range(is_queen_egg),
+            size=quantity,
+            endpoint=True,
+            dtype=np.int32,
+        )
+
+    def egg_max_age_counts(self, quantity: int, is_queen_egg: bool = False) -> tuple:
+        """
+        Répartit `quantity` nouveaux oeufs entre les ages maximaux possibles.
+        Renvoie les ages tirés au moins une fois et leur nombre d'oeufs.
+        """
+        return self.__spread("egg_ages", quantity, *self.__egg_age_range(is_queen_egg))
+
+    def hatched(self, is_queen_egg: np.ndarray) -> np.ndarray:
+        """
+        Masque des oeufs qui donnent une fourmi en éclosant
+        """
+        return self.__generators["hatching"].random(len(is_queen_egg)) < np.where(
+            is_queen_egg,
+            self.__settings.queen_egg_evolve_chance,
+            self.__settings.egg_evolve_chance,
+        )
+
+    def hatched_counts(self, counts, is_queen_egg) -> np.ndarray:
+        """
+        Nombre d'oeufs qui donnent une fourmi dans chaque groupe d'oeufs éclos
+        """
+        return self.__generators["hatching"].binomial(
+            counts,
+            np.where(
+                is_queen_egg,
+                self.__settings.queen_egg_evolve_chance,
+                self.__settings.egg_evolve_chance,
+            ),
+        )
+
+    def food_gain(self, workers: int) -> int:
+        """
+        Nourriture rapportée par `workers` ouvrières
+        """
+        return int(
+            self.__generators["food"].integers(
+                round(workers * self.__settings.min_food_multiplier),
+                round(workers * self.__settings.max_food_multiplier),
+                endpoint=True,
+            )
+        )
+
+    def queen_max_age(self) -> int:
+        """
+        Age maximal d'une nouvelle reine
+        """
+        return int(
+            self.__generators["queens"].integers(
+                self.__settings.queen_avg_age - self.__settings.queen_avg_age_variation,
+                self.__settings.queen_avg_age + self.__settings.queen_avg_age_variation,
+                endpoint=True,
+            )
+        )
+
+    def __egg_age_range(self, is_queen_egg: bool) -> tuple:
+        if is_queen_egg:
+            avg_age = self.__settings.queen_avg_egg_age
+            variation = self.__settings.queen_avg_egg_age_variation
+        else:
+            avg_age = self.__settings.egg_avg_age
+            variation = self.__settings.egg_avg_age_variation
+        return avg_age - variation, avg_age + variation
+
+    def __spread(
+        self, name: str, quantity: int, min_value: int, max_value: int
+    ) -> tuple:
+        values = np.arange(min_value, max_value + 1, dtype=np.int32)
+        counts = self.__generators[name].multinomial(
+            quantity, np.full(len(values), 1 / len(values))
+        )
+        drawn = counts > 0
+        return values[drawn], counts[drawn]
@@ -1,6 +1,11 @@
 """
-Ce module contient la classe Settings.
+Ce module contient les classes Settings et FrozenSettings.
 """
+import hashlib
+import inspect
+import struct
+from collections import namedtuple
+
 YEAR = 365
 MONTH = YEAR // 12
 WEEK = MONTH // 4
@@ -627,3 +632,86 @@ class Settings:
             "queen_egg_hunger": self.queen_egg_hunger,
             "queen_egg_evolve_chance": self.queen_egg_evolve_chance,
         }
+
+    def freeze(self) -> "FrozenSettings":
+        """
+        Copie immuable et hachable des paramètres, déjà validés
+        """
+        return FrozenSettings.from_trusted_dict(self.to_dict())
+
+
+# Champs de Settings dans l'ordre du constructeur, avec leur valeur par défaut
+# et leur format binaire (entier ou flottant sur 8 octets).
+FIELDS = {
+    name: parameter.default
+    for name, parameter in inspect.signature(Settings).parameters.items()
+}
+FIELD_FORMAT = "<" + "".join(
+    "q" if parameter.annotation is int else "d"
+    for parameter in inspect.signature(Settings).parameters.values()
+)
+
+# Champs d'affichage, sans effet sur les résultats d'une simulation
+PRESENTATION_FIELDS = ("simulation_speed",)
+
+
+class FrozenSettings(namedtuple("FrozenSettings", FIELDS, defaults=FIELDS.values())):
+    """
+    Classe représentant des paramètres de simulation immuables.
+
+    Les champs sont ceux de Settings et se lisent de la même façon, mais ne
+    sont pas validés à la construction : une instance s'obtient avec
+    Settings.freeze ou, pour un dictionnaire déjà validé (par exemple
+    Settings.to_dict), avec from_trusted_dict. Les paramètres sont hachables,
+    peuvent servir de clé de cache et tiennent sur 200 octets (to_bytes).
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_trusted_dict(cls, settings: dict) -> "FrozenSettings":
+        """
+        Crée les paramètres à partir d'un dictionnaire, sans les valider
+        """
+        return cls(**settings)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "FrozenSettings":
+        """
+        Recrée les paramètres écrits par to_bytes
+        """
+        return cls._make(struct.unpack(FIELD_FORMAT, data))
+
+    def to_bytes(self) -> bytes:
+        """
+        Représentation binaire compacte des paramètres
+        """
+        return struct.pack(FIELD_FORMAT, *self)
+
+    @property
+    def content_hash(self) -> str:
+        """
+        Empreinte des paramètres, identique d'un processus et d'une exécution
+        à l'autre. Les champs d'affichage (PRESENTATION_FIELDS) n'y entrent
+        pas : deux simulations de même empreinte donnent les mêmes résultats.
+        """
+        hashed = self._replace(**{name: FIELDS[name] for name in PRESENTATION_FIELDS})
+        return hashlib.sha256(hashed.to_bytes()).hexdigest()[:16]
+
+    def to_dict(self) -> dict:
+        """
+        Convertit les paramètres en dictionnaire
+        """
+        return dict(zip(self._fields, self))
+
+    def freeze(self) -> "FrozenSettings":
+        """
+        Les paramètres eux-mêmes, déjà immuables
+        """
+        return self
+
+    def thaw(self) -> Settings:
+        """
+        Copie modifiable (et validée) des paramètres
+        """
+        return Settings(**self.to_dict())
@@ -0,0 +1,119 @@
+"""
+Ce module contient la classe TimeSeries
+"""
+
+from array import array
+
+METRICS = (
+    ("days", "l"),
+    ("eggs", "q"),
+    ("ants", "q"),
+    ("workers", "q"),
+    ("food", "d"),
+    ("queen_alive", "b"),
+    ("dead_ants", "q"),
+)
+
+
+class TimeSeries:
+    """
+    Classe représentant l'évolution jour par jour d'une colonie.
+    Chaque métrique est stockée dans un tableau typé compact.
+    """
+
+    def __init__(self):
+        self.__columns = {name: array(typecode) for name, typecode in METRICS}
+
+    def __len__(self) -> int:
+        return len(self.__columns["days"])
+
+    @property
+    def days(self) -> array:
+        """
+        Jours enregistrés
+        """
+        return self.__columns["days"]
+
+    @property
+    def eggs(self) -> array:
+        """
+        Nombre d'oeufs par jour
+        """
+        return self.__columns["eggs"]
+
+    @property
+    def ants(self) -> array:
+        """
+        Nombre de fourmis par jour
+        """
+        return self.__columns["ants"]
+
+    @property
+    def workers(self) -> array:
+        """
+        Nombre d'ouvrières par jour
+        """
+        return self.__columns["workers"]
+
+    @property
+    def food(self) -> array:
+        """
+        Quantité de nourriture par jour
+        """
+        return self.__columns["food"]
+
+    @property
+    def queen_alive(self) -> array:
+        """
+        Si la reine est vivante, par jour
+        """
+        return self.__columns["queen_alive"]
+
+    @property
+    def dead_ants(self) -> array:
+        """
+        Nombre de fourmis mortes par jour
+        """
+        return self.__columns["dead_ants"]
+
+    def append(
+        self,
+        day: int,
+        eggs: int,
+        ants: int,
+        workers: int,
+        food: float,
+        queen_alive: bool,
+        dead_ants: int,
+    ):
+        """
+        Ajoute les métriques d'un jour
+        """
+        columns = self.__columns
+        columns["days"].append(day)
+        columns["eggs"].append(eggs)
+        columns["ants"].append(ants)
+        columns["workers"].append(workers)
+        columns["food"].append(food)
+        columns["queen_alive"].append(queen_alive)
+        columns["dead_ants"].append(dead_ants)
+
+    def record(self, colony):
+        """
+        Ajoute les métriques du jour courant d'une colonie
+        """
+        self.append(
+            colony.day,
+            colony.egg_count(),
+            colony.ant_count(),
+            colony.worker_count(),
+            colony.food.quantity,
+            colony.queen.is_alive,
+            colony.dead_ant_count(),
+        )
+
+    def to_dict(self):
+        """
+        Convertit la série en dictionnaire de listes
+        """
+        return {name: column.tolist() for name, column in self.__columns.items()}
@@ -12,6 +12,7 @@ from src.classes.ant import Ant
 from src.classes.food import Food
 from src.classes.settings import Settings
 from src.classes.enums import State, Job
+from src.classes.context import Context
 
 
 class TestAnt(unittest.TestCase):
@@ -66,6 +67,22 @@ class TestAnt(unittest.TestCase):
         )
         self.assertEqual(self.ant.state, expected_state)
 
+    def test_compact_agent(self):
+        """Test si la fourmi n'a pas de __dict__ et partage son contexte."""
+        self.assertFalse(hasattr(self.ant, "__dict__"))
+        context = Context(self.settings, self.food)
+        first = Ant(self.settings, self.food, context=context)
+        second = Ant(self.settings, self.food, context=context)
+        self.assertIs(first.settings, second.settings)
+        self.assertIs(first.food, self.food)
+
+    def test_setters_still_validate(self):
+        """Test si les setters publics valident toujours les valeurs."""
+        with self.assertRaises(ValueError):
+            self.ant.age = -1
+        with self.assertRaises(TypeError):
+            self.ant.state = "dead"
+
 
 if __name__ == "__main__":
     unittest.main()
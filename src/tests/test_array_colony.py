@@ -0,0 +1,82 @@
+"""
+Ce module test la classe ArrayColony
+"""
+import unittest
+
+from src.classes.food import Food
+from src.classes.settings import Settings
+from src.classes.enums import State, Job
+
+from src.classes.array_colony import ArrayColony
+
+
+class TestArrayColony(unittest.TestCase):
+    def setUp(self):
+        """Set up la colonie et la nourriture pour les tests."""
+        self.settings = Settings()
+        self.food = Food(self.settings)
+        self.colony = ArrayColony(self.settings, self.food)
+
+    def test_initial_state(self):
+        """Test si la colonie est créée avec les bons attributs."""
+        self.assertEqual(self.colony.day, 0)
+        self.assertEqual(
+            self.colony.ant_count(), self.settings.initial_ant_quantity + 1
+        )
+        self.assertEqual(self.colony.egg_count(), 0)
+        self.assertEqual(self.colony.dead_ant_count(), 0)
+
+    def test_views_write_through(self):
+        """Test si les vues modifient bien les colonnes de la colonie."""
+        ant = self.colony.ants[0]
+        ant.age = 3
+        ant.profession = Job.NOT_WORKER
+        self.assertEqual(self.colony.ant_arrays["age"][0], 3)
+        self.assertEqual(self.colony.ants[0].profession, Job.NOT_WORKER)
+        with self.assertRaises(ValueError):
+            ant.age = -1
+
+    def test_evolve_ages_ants(self):
+        """Test si une journée fait vieillir les fourmis et consomme de la nourriture."""
+        initial_food_quantity = self.food.quantity
+        self.colony.evolve()
+        self.assertEqual(self.colony.day, 1)
+        self.assertTrue(all(ant.age == 1 for ant in self.colony.ants))
+        self.assertTrue(all(ant.state == State.ALIVE for ant in self.colony.ants))
+        self.assertNotEqual(self.food.quantity, initial_food_quantity)
+
+    def test_evolve_death_by_starvation(self):
+        """Test si les fourmis meurent quand il n'y a plus de nourriture."""
+        self.settings.min_food_multiplier = 0.0
+        self.settings.max_food_multiplier = 0.0
+        self.food.quantity = 0
+        self.colony.evolve()
+        self.assertEqual(self.colony.ants, [])
+        self.assertFalse(self.colony.queen.is_alive)
+
+    def test_evolve_is_reproducible(self):
+        """Test si deux colonies avec la même seed évoluent de la même façon."""
+        other_food = Food(self.settings)
+        other = ArrayColony(self.settings, other_food)
+        for _ in range(30):
+            self.colony.evolve()
+            other.evolve()
+        self.assertEqual(self.colony.ant_count(), other.ant_count())
+        self.assertEqual(self.colony.egg_count(), other.egg_count())
+        self.assertEqual(self.food.quantity, other_food.quantity)
+
+    def test_to_dict(self):
+        """Test si to_dict renvoie la même forme que Colony.to_dict."""
+        for _ in range(6):
+            self.colony.evolve()
+        data = self.colony.to_dict()
+        self.assertEqual(set(data), {"day", "queen", "food", "ants", "eggs"})
+        self.assertEqual(len(data["ants"]), len(self.colony.ant_arrays["age"]))
+        self.assertEqual(len(data["eggs"]), self.colony.egg_count())
+        self.assertEqual(
+            set(data["eggs"][0]), {"age", "max_age", "state", "is_queen_egg"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
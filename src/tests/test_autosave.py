@@ -0,0 +1,129 @@
+"""
+Ce module test la sauvegarde automatique
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from src.classes.settings import Settings
+
+from src.classes.colony import Colony
+from src.utils.autosave import Autosaver
+from src.utils.columnar import read_columnar_header
+from src.utils.files import load_checkpoint, load_colony, parse_save_name
+from src.utils.headless import create_colony, simulate
+
+
+class TestAutosave(unittest.TestCase):
+    def setUp(self):
+        """Set up un dossier temporaire pour les sauvegardes."""
+        self.settings = Settings(initial_ant_quantity=200)
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def __autosaves(self) -> list:
+        return sorted(
+            file for file in os.listdir(self.directory.name) if file.startswith("sim_")
+        )
+
+    def test_rotation(self):
+        """Test si seules les sauvegardes les plus récentes sont gardées."""
+        autosaver = Autosaver(10, None, keep=2, directory=self.directory.name)
+        colony = create_colony(self.settings)
+        for _ in range(55):
+            colony.evolve()
+            if autosaver.maybe_save(colony):
+                autosaver.pending.result()
+        autosaver.close()
+        files = self.__autosaves()
+        self.assertEqual(len(files), 2)
+        self.assertTrue(any(file.endswith("_day50.json") for file in files))
+        self.assertTrue(any(file.endswith("_day40.json") for file in files))
+
+    def test_saves_on_due_days(self):
+        """Test si une écriture lente ne décale pas les jours sauvegardés."""
+        autosaver = Autosaver(3, None, keep=100, directory=self.directory.name)
+        colony = create_colony(self.settings)
+        # Aucune attente : les copies arrivent pendant les écritures
+        for _ in range(200):
+            colony.evolve()
+            autosaver.maybe_save(colony)
+        autosaver.close()
+        days = [
+            int(parse_save_name(file)[0].rsplit("_day", 1)[1])
+            for file in self.__autosaves()
+        ]
+        self.assertTrue(days)
+        self.assertTrue(all(day % 3 == 0 for day in days))
+        self.assertIn(198, days)
+
+    def test_write_error_is_raised(self):
+        """Test si l'erreur d'une écriture est levée à l'appel suivant."""
+        directory = os.path.join(self.directory.name, "file")
+        open(directory, "w").close()
+        autosaver = Autosaver(1, None, directory=directory)
+        colony = create_colony(self.settings)
+        for _ in range(2):
+            colony.evolve()
+            autosaver.maybe_save(colony)
+        with self.assertRaises(OSError):
+            autosaver.close()
+
+    def test_autosave_is_resumable(self):
+        """Test si une sauvegarde automatique reprend au bon jour."""
+        autosaver = Autosaver(30, None, directory=self.directory.name)
+        colony = create_colony(self.settings)
+        for _ in range(30):
+            colony.evolve()
+            autosaver.maybe_save(colony)
+        expected = colony.checkpoint()
+        for _ in range(5):
+            colony.evolve()
+            autosaver.maybe_save(colony)
+        autosaver.close()
+
+        (file,) = self.__autosaves()
+        with open(os.path.join(self.directory.name, file), encoding="utf8") as save:
+            data = json.load(save)
+        resumed = Colony.from_checkpoint(
+            Settings(**data["settings"]), data["checkpoint"]
+        )
+        self.assertEqual(resumed.day, 30)
+        self.assertEqual(
+            json.loads(json.dumps(resumed.checkpoint())),
+            json.loads(json.dumps(expected)),
+        )
+
+    def test_load_autosave(self):
+        """Test si une sauvegarde automatique se charge comme une sauvegarde."""
+        autosaver = Autosaver(10, None, directory=self.directory.name)
+        colony = create_colony(self.settings)
+        for _ in range(10):
+            colony.evolve()
+            autosaver.maybe_save(colony)
+        autosaver.close()
+
+        (file,) = self.__autosaves()
+        unique_id, _ = parse_save_name(file)
+        self.assertEqual(load_colony(unique_id, self.directory.name), colony.to_dict())
+        self.assertEqual(load_checkpoint(unique_id, self.directory.name).day, 10)
+
+    def test_columnar_engines(self):
+        """Test si les autres moteurs sont sauvegardés en colonnes."""
+        autosaver = Autosaver(10, None, directory=self.directory.name)
+        simulate(self.settings, max_days=15, engine="array", autosaver=autosaver)
+        (file,) = self.__autosaves()
+        header = read_columnar_header(os.path.join(self.directory.name, file))
+        self.assertEqual(header["colony"]["day"], 10)
+
+    def test_keep_must_be_positive(self):
+        """Test si garder zéro sauvegarde est refusé."""
+        with self.assertRaises(ValueError):
+            Autosaver(keep=0, directory=self.directory.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Ce module test les benchmarks de la simulation
+"""
+import json
+import unittest
+
+from src.benchmarks.bench_simulation import run_benchmarks, create_report, compare
+
+
+class TestBenchmarks(unittest.TestCase):
+    def setUp(self):
+        """Set up des résultats sur une petite colonie."""
+        self.results = run_benchmarks(sizes=[50], engines=["object"], days=2)
+
+    def test_results(self):
+        """Test si chaque chemin critique est mesuré."""
+        names = {result["name"] for result in self.results}
+        self.assertEqual(
+            names,
+            {
+                "ant.evolve",
+                "egg.evolve",
+                "colony.evolve",
+                "colony.to_dict",
+                "create_save_file",
+                "create_save_file.jsonl",
+                "create_save_file.columnar",
+            },
+        )
+        for result in self.results:
+            self.assertGreater(result["seconds"], 0)
+            self.assertGreater(result["updates_per_second"], 0)
+            self.assertGreater(result["peak_memory"], 0)
+
+    def test_report_is_comparable(self):
+        """Test si un rapport est sérialisable et comparable à un autre."""
+        report = json.loads(json.dumps(create_report(self.results)))
+        comparison = compare(report, report)
+        self.assertEqual(len(comparison), len(self.results))
+        for line in comparison:
+            self.assertAlmostEqual(line["speedup"], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
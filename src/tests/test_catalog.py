@@ -0,0 +1,188 @@
+"""
+Ce module test l'index des sauvegardes
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.classes.settings import Settings
+
+from src.utils.catalog import SaveCatalog
+from src.utils.files import (
+    create_save_file,
+    list_save_files,
+    list_saves,
+    load_save_file,
+    rebuild_catalog,
+)
+from src.utils.autosave import Autosaver
+from src.utils.headless import create_colony
+
+
+class TestCatalog(unittest.TestCase):
+    def setUp(self):
+        """Set up un dossier de sauvegardes temporaire."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.settings = Settings(initial_ant_quantity=100)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def __save(self, seed: int, days: int, file_format: str, unique_id: str) -> str:
+        settings = Settings(**{**self.settings.to_dict(), "simulation_seed": seed})
+        colony = create_colony(settings, "object" if file_format == "json" else "array")
+        for _ in range(days):
+            colony.evolve()
+        return create_save_file(colony, self.directory.name, file_format, unique_id)
+
+    def __write(self, data: dict, unique_id: str):
+        with open(
+            os.path.join(self.directory.name, f"sim_{unique_id}.json"),
+            "w",
+            encoding="utf8",
+        ) as file:
+            json.dump(data, file)
+
+    def test_settings_hash(self):
+        """Test si l'empreinte ne dépend que des paramètres de simulation."""
+        self.__save(1, 5, "json", "a")
+        with open(
+            os.path.join(self.directory.name, "sim_a.json"), encoding="utf8"
+        ) as file:
+            data = json.load(file)
+        # Seule la vitesse d'affichage diffère : même empreinte
+        data["settings"]["simulation_speed"] = 0.0
+        self.__write(data, "b")
+        # Des paramètres invalides ne sont pas indexés
+        data["settings"]["initial_food_quantity"] = 30000
+        self.__write(data, "invalid")
+        self.__save(2, 5, "json", "c")
+
+        rows = {
+            row["unique_id"]: row for row in rebuild_catalog(self.directory.name).list()
+        }
+        self.assertNotIn("invalid", rows)
+        self.assertEqual(rows["a"]["settings_hash"], rows["b"]["settings_hash"])
+        self.assertEqual(
+            rows["a"]["settings_hash"],
+            Settings(**json.loads(rows["a"]["settings"])).freeze().content_hash,
+        )
+        self.assertNotEqual(rows["a"]["settings_hash"], rows["c"]["settings_hash"])
+
+    def test_saves_are_indexed(self):
+        """Test si create_save_file ajoute chaque sauvegarde à l'index."""
+        self.__save(1, 10, "json", "a")
+        self.__save(2, 30, "columnar", "b")
+        self.__save(1, 20, "jsonl", "c")
+        catalog = SaveCatalog(self.directory.name)
+
+        rows = catalog.list(order_by="final_day", descending=True)
+        self.assertEqual([row["unique_id"] for row in rows], ["b", "c", "a"])
+        self.assertEqual([row["format"] for row in rows], ["columnar", "jsonl", "json"])
+        self.assertEqual(
+            [row["unique_id"] for row in catalog.list(seed=1, min_day=15)], ["c"]
+        )
+        row = catalog.get("a")
+        self.assertEqual(row["size"], os.path.getsize(row["path"]))
+        self.assertEqual(json.loads(row["settings"])["simulation_seed"], 1)
+        with self.assertRaises(ValueError):
+            catalog.list(order_by="path; DROP TABLE saves")
+
+    def test_rebuild(self):
+        """Test si l'index est reconstruit à partir des fichiers du dossier."""
+        self.__save(1, 10, "json", "a")
+        self.__save(2, 30, "columnar", "b")
+        expected = SaveCatalog(self.directory.name).list()
+        os.remove(os.path.join(self.directory.name, "catalog.sqlite3"))
+        shutil.copy(
+            os.path.join(self.directory.name, "sim_a.json"),
+            os.path.join(self.directory.name, "sim_copy.json"),
+        )
+        os.remove(os.path.join(self.directory.name, "sim_b.colony"))
+
+        rows = {
+            row["unique_id"]: row for row in rebuild_catalog(self.directory.name).list()
+        }
+        self.assertEqual(sorted(rows), ["a", "copy"])
+        for column in ("settings_hash", "seed", "final_day", "peak_population"):
+            self.assertEqual(rows["a"][column], expected[0][column])
+
+    def test_listing_follows_directory(self):
+        """Test si l'index suit les fichiers supprimés, copiés et modifiés."""
+        self.__save(1, 10, "json", "a")
+        self.__save(2, 30, "json", "b")
+        os.remove(os.path.join(self.directory.name, "sim_a.json"))
+        shutil.copy(
+            os.path.join(self.directory.name, "sim_b.json"),
+            os.path.join(self.directory.name, "sim_copy.json"),
+        )
+        saves = sorted(list_save_files(self.directory.name).values())
+        self.assertEqual(saves, ["b", "copy"])
+        with self.assertRaises(FileNotFoundError):
+            load_save_file("a", self.directory.name)
+
+        created = SaveCatalog(self.directory.name).get("b")["created"]
+        self.__save(3, 5, "json", "c")
+        os.replace(
+            os.path.join(self.directory.name, "sim_c.json"),
+            os.path.join(self.directory.name, "sim_b.json"),
+        )
+        os.utime(os.path.join(self.directory.name, "sim_b.json"), (0, 0))
+        self.assertEqual(load_save_file("b", self.directory.name)["simulation_seed"], 3)
+        row = SaveCatalog(self.directory.name).get("b")
+        self.assertEqual((row["final_day"], row["modified"]), (5, 0))
+        self.assertEqual(row["created"], created)
+
+    def test_listing_served_from_catalog(self):
+        """Test si l'index n'est relu que quand le dossier change."""
+        self.__save(1, 10, "json", "a")
+        list_saves(directory=self.directory.name)
+        catalog = SaveCatalog(self.directory.name)
+        # Les écritures de l'index ne changent pas la date du dossier
+        self.assertEqual(
+            catalog.directory_mtime, os.stat(self.directory.name).st_mtime_ns
+        )
+
+        # Un fichier réécrit sur place n'est relu que sur demande
+        path = os.path.join(self.directory.name, "sim_a.json")
+        self.__save(2, 20, "json", "b")
+        list_saves(directory=self.directory.name)
+        shutil.copyfile(os.path.join(self.directory.name, "sim_b.json"), path)
+        self.assertEqual(catalog.get("a")["final_day"], 10)
+        self.assertEqual(
+            [row["final_day"] for row in list_saves(directory=self.directory.name)],
+            [10, 20],
+        )
+        rebuild_catalog(self.directory.name)
+        self.assertEqual(catalog.get("a")["final_day"], 20)
+
+    def test_header_only_is_read(self):
+        """Test si seul l'en-tête d'une sauvegarde JSON est lu pour l'index."""
+        self.__save(1, 10, "json", "a")
+        path = os.path.join(self.directory.name, "sim_a.json")
+        with open(path, encoding="utf8") as file:
+            header = file.readline()
+        os.remove(os.path.join(self.directory.name, "catalog.sqlite3"))
+        with open(path, "w", encoding="utf8") as file:
+            file.write(header + "not JSON\n")
+        (row,) = list_saves(directory=self.directory.name)
+        self.assertEqual((row["unique_id"], row["final_day"]), ("a", 10))
+
+    def test_autosaves_are_indexed(self):
+        """Test si les sauvegardes automatiques retirées quittent l'index."""
+        autosaver = Autosaver(5, None, keep=1, directory=self.directory.name)
+        colony = create_colony(self.settings)
+        for _ in range(12):
+            colony.evolve()
+            if autosaver.maybe_save(colony):
+                autosaver.pending.result()
+        autosaver.close()
+        rows = SaveCatalog(self.directory.name).list()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["final_day"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Ce module test les chaînes de checkpoints complets et de deltas
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from src.classes.food import Food
+from src.classes.settings import Settings
+
+from src.classes.colony import Colony
+from src.utils.checkpoints import (
+    CheckpointChain,
+    chain_days,
+    iter_chain,
+    restore_checkpoint,
+    restore_colony,
+)
+
+
+class TestCheckpoints(unittest.TestCase):
+    def setUp(self):
+        """Set up une colonie dont la reine meurt et un fichier temporaire."""
+        self.settings = Settings(
+            initial_ant_quantity=300, queen_avg_age=60, queen_avg_age_variation=0
+        )
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "sim.chain")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def __record(self, days: int, full_every: int, **options) -> dict:
+        """Enregistre une simulation et renvoie le checkpoint de chaque jour."""
+        colony = Colony(self.settings, Food(self.settings))
+        chain = CheckpointChain(self.file_path, self.settings, full_every, **options)
+        checkpoints = {}
+        for _ in range(days):
+            colony.evolve()
+            chain.record(colony)
+            checkpoints[colony.day] = json.loads(json.dumps(colony.checkpoint()))
+        chain.close()
+        return checkpoints
+
+    def test_every_day_is_restored(self):
+        """Test si les jours enregistrés redonnent le checkpoint de ce jour."""
+        checkpoints = self.__record(120, full_every=40)
+        self.assertEqual(chain_days(self.file_path), list(checkpoints))
+        for day in [*range(1, 121, 7), 40, 41, 80, 81, 120]:
+            checkpoint = checkpoints[day]
+            restored = json.loads(json.dumps(restore_checkpoint(self.file_path, day)))
+            self.assertEqual(restored, checkpoint)
+
+    def test_full_every(self):
+        """Test si un checkpoint complet est écrit toutes les full_every entrées."""
+        self.__record(25, full_every=10)
+        kinds = [kind for kind, _ in iter_chain(self.file_path)]
+        self.assertEqual(
+            [day for day, kind in enumerate(kinds) if kind == "full"], [0, 10, 20]
+        )
+
+    def test_deltas_are_small(self):
+        """Test si un delta est bien plus petit que le checkpoint du même jour."""
+        checkpoints = self.__record(60, full_every=60)
+        for kind, entry in iter_chain(self.file_path):
+            if kind == "delta" and entry["day"] > 30:
+                self.assertLess(
+                    len(json.dumps(entry)) * 3,
+                    len(json.dumps(checkpoints[entry["day"]])),
+                )
+
+    def test_restored_colony_continues(self):
+        """Test si une colonie restaurée continue comme l'originale."""
+        self.__record(80, full_every=25, compression="gzip")
+        colony = Colony(self.settings, Food(self.settings))
+        for _ in range(60):
+            colony.evolve()
+        restored = restore_colony(self.file_path, 60)
+        for _ in range(40):
+            colony.evolve()
+            restored.evolve()
+        self.assertEqual(restored.to_dict(), colony.to_dict())
+
+    def test_unknown_day(self):
+        """Test si un jour absent de la chaîne est refusé."""
+        self.__record(10, full_every=5)
+        with self.assertRaises(ValueError):
+            restore_checkpoint(self.file_path, 0)
+        with self.assertRaises(ValueError):
+            restore_checkpoint(self.file_path, 11)
+
+    def test_delta_requires_journal(self):
+        """Test si un delta sans journal est refusé."""
+        colony = Colony(self.settings, Food(self.settings))
+        with self.assertRaises(RuntimeError):
+            colony.checkpoint_delta()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+Ce module test la classe CohortColony
+"""
+import unittest
+
+from src.classes.food import Food
+from src.classes.settings import Settings
+
+from src.classes.cohort_colony import CohortColony
+
+
+class TestCohortColony(unittest.TestCase):
+    def setUp(self):
+        """Set up la colonie et la nourriture pour les tests."""
+        self.settings = Settings(initial_ant_quantity=1000)
+        self.food = Food(self.settings)
+        self.colony = CohortColony(self.settings, self.food)
+
+    def test_initial_state(self):
+        """Test si les cohortes contiennent toutes les fourmis initiales."""
+        self.assertEqual(self.colony.ant_count(), 1001)
+        self.assertEqual(self.colony.dead_ant_count(), 0)
+        self.assertLessEqual(
+            len(self.colony.ant_cohorts["count"]),
+            2 * (2 * self.settings.ant_avg_age_variation + 1),
+        )
+
+    def test_evolve_ages_cohorts(self):
+        """Test si l'age des fourmis se déduit du jour de la colonie."""
+        for _ in range(3):
+            self.colony.evolve()
+        self.assertTrue(all(ant["age"] == 3 for ant in self.colony.ants))
+
+    def test_eggs_hatch_into_ants(self):
+        """Test si les oeufs pondus finissent par éclore en fourmis."""
+        self.settings.ant_random_death_chance = 0.0
+        for _ in range(
+            self.settings.egg_avg_age + self.settings.egg_avg_age_variation + 2
+        ):
+            self.colony.evolve()
+        self.assertGreater(self.colony.ant_count(), 1001)
+
+    def test_evolve_death_by_starvation(self):
+        """Test si les fourmis meurent quand il n'y a plus de nourriture."""
+        self.settings.min_food_multiplier = 0.0
+        self.settings.max_food_multiplier = 0.0
+        self.food.quantity = 0
+        self.colony.evolve()
+        self.assertEqual(self.colony.ant_count(), 0)
+        self.assertEqual(self.colony.dead_ant_count(), 1001)
+
+    def test_to_dict(self):
+        """Test si to_dict développe chaque cohorte en fourmis individuelles."""
+        for _ in range(6):
+            self.colony.evolve()
+        data = self.colony.to_dict()
+        self.assertEqual(len(data["ants"]) + 1, self.colony.ant_count())
+        self.assertEqual(len(data["eggs"]), self.colony.egg_count())
+
+
+if __name__ == "__main__":
+    unittest.main()
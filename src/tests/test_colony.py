@@ -0,0 +1,170 @@
+"""
+Ce module test la classe Colony
+"""
+import unittest
+import random
+import json
+
+from src.classes.food import Food
+from src.classes.settings import Settings
+from src.classes.enums import State
+
+from src.classes.colony import Colony
+from src.classes.egg import Egg
+
+
+class TestColony(unittest.TestCase):
+    def setUp(self):
+        """Set up la colonie et la nourriture pour les tests."""
+        random.seed(0)
+        self.settings = Settings(initial_ant_quantity=50)
+        self.food = Food(self.settings)
+        self.colony = Colony(self.settings, self.food)
+
+    def test_initial_state(self):
+        """Test si la colonie est créée avec les bons attributs."""
+        self.assertEqual(self.colony.day, 0)
+        self.assertEqual(self.colony.ant_count(), 51)
+        self.assertEqual(self.colony.dead_ant_count(), 0)
+        self.assertTrue(all(ant.age == 0 for ant in self.colony.ants))
+
+    def test_ants_age_with_colony(self):
+        """Test si l'age des fourmis suit les jours de la colonie."""
+        for _ in range(5):
+            self.colony.evolve()
+        self.assertTrue(all(ant.age == 5 for ant in self.colony.ants))
+
+    def test_death_by_age_is_scheduled(self):
+        """Test si une fourmi meurt le jour où elle dépasse son age maximal."""
+        self.settings.ant_random_death_chance = 0.0
+        self.settings.queen_avg_eggs = 0
+        self.settings.queen_avg_egg_variation = 0
+        colony = Colony(self.settings, self.food)
+        oldest = max(ant.max_age for ant in colony.ants)
+        youngest = min(ant.max_age for ant in colony.ants)
+        for _ in range(youngest):
+            colony.evolve()
+        self.assertEqual(colony.dead_ant_count(), 0)
+        for _ in range(oldest - youngest + 1):
+            colony.evolve()
+        self.assertEqual(colony.ants, [])
+        self.assertEqual(colony.dead_ant_count(), 50)
+
+    def test_death_by_starvation(self):
+        """Test si les fourmis meurent quand il n'y a plus de nourriture."""
+        self.settings.min_food_multiplier = 0.0
+        self.settings.max_food_multiplier = 0.0
+        self.food.quantity = 0
+        ants = self.colony.ants
+        self.colony.evolve()
+        self.assertEqual(self.colony.ant_count(), 0)
+        self.assertTrue(all(ant.state == State.DEAD for ant in ants))
+
+    def test_eggs_are_laid_and_hatch(self):
+        """Test si les oeufs comptés dans l'anneau sont pondus puis éclosent."""
+        self.settings.ant_random_death_chance = 0.0
+        self.colony.evolve()
+        laid = self.colony.egg_count()
+        self.assertGreaterEqual(
+            laid, self.settings.queen_avg_eggs - self.settings.queen_avg_egg_variation
+        )
+        self.assertTrue(all(egg.age <= egg.max_age for egg in self.colony.eggs))
+        for _ in range(
+            self.settings.egg_avg_age + self.settings.egg_avg_age_variation + 1
+        ):
+            self.colony.evolve()
+        self.assertGreater(self.colony.ant_count(), 51)
+
+    def test_counters_match_recount(self):
+        """Test si les compteurs restent égaux à un recomptage complet."""
+        colony = Colony(self.settings, self.food, debug=True)
+        for _ in range(200):
+            colony.evolve()
+        self.food.quantity = 1.0
+        colony.evolve()
+        self.assertEqual(
+            colony.worker_count(),
+            len([ant for ant in colony.ants if ant.profession.value]),
+        )
+        self.assertEqual(colony.egg_count(), len(colony.eggs))
+
+    def test_corrupted_counters_are_detected(self):
+        """Test si le mode debug détecte chaque compteur faussé."""
+
+        def corrupt_queen_eggs(colony):
+            colony._Colony__queen_eggs.append(Egg(self.settings, self.food))
+
+        def corrupt_calendar(colony):
+            colony._Colony__calendar.clear()
+
+        def corrupt_journal(colony):
+            colony.start_journal()
+            colony._Colony__journal["deaths"].append(next(iter(colony._Colony__ants)))
+
+        corruptions = {
+            "Worker": lambda colony: setattr(
+                colony, "_Colony__worker_quantity", colony.worker_count() + 1
+            ),
+            "Egg": lambda colony: setattr(
+                colony, "_Colony__egg_quantity", colony.egg_count() + 1
+            ),
+            "queen egg": corrupt_queen_eggs,
+            "Birth counter": lambda colony: setattr(
+                colony, "_Colony__born_ants", -colony.ant_count()
+            ),
+            "death day": corrupt_calendar,
+            "since the last delta": corrupt_journal,
+        }
+        for message, corrupt in corruptions.items():
+            with self.subTest(counter=message):
+                food = Food(self.settings)
+                colony = Colony(self.settings, food, debug=True)
+                for _ in range(30):
+                    colony.evolve()
+                corrupt(colony)
+                with self.assertRaisesRegex(RuntimeError, message):
+                    colony.evolve()
+
+    def test_resume_from_checkpoint(self):
+        """Test si une colonie restaurée continue exactement comme l'originale."""
+        settings = Settings(
+            initial_ant_quantity=200, queen_avg_age=60, queen_avg_age_variation=0
+        )
+        colony = Colony(settings, Food(settings))
+        for _ in range(90):
+            colony.evolve()
+        checkpoint = json.loads(json.dumps(colony.checkpoint()))
+        resumed = Colony.from_checkpoint(Settings(**settings.to_dict()), checkpoint)
+        self.assertEqual(resumed.to_dict(), colony.to_dict())
+
+        for _ in range(150):
+            colony.evolve()
+            resumed.evolve()
+            self.assertEqual(resumed.food.quantity, colony.food.quantity)
+            self.assertEqual(resumed.ant_count(), colony.ant_count())
+            self.assertEqual(resumed.egg_count(), colony.egg_count())
+        self.assertEqual(resumed.to_dict(), colony.to_dict())
+        self.assertEqual(resumed.checkpoint(), colony.checkpoint())
+
+    def test_checkpoint_ants_in_chunks(self):
+        """Test si les fourmis du checkpoint se lisent et se restaurent par blocs."""
+        colony = Colony(self.settings, Food(self.settings))
+        for _ in range(60):
+            colony.evolve()
+        checkpoint = colony.checkpoint()
+        chunks = list(colony.iter_checkpoint_ants(chunk_size=7))
+        self.assertTrue(all(len(chunk["serial"]) <= 7 for chunk in chunks))
+        for name, column in checkpoint["ants"].items():
+            self.assertEqual(sum((chunk[name] for chunk in chunks), []), column)
+
+        scalars = colony.checkpoint(with_ants=False)
+        self.assertNotIn("ants", scalars)
+        resumed = Colony.from_checkpoint(
+            self.settings, {**scalars, "ants": iter(chunks)}, debug=True
+        )
+        self.assertEqual(resumed.checkpoint(), checkpoint)
+        resumed.evolve()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Ce module test les sauvegardes en colonnes
+"""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.classes.settings import Settings
+
+from src.utils.headless import create_colony, ENGINES
+from src.utils.columnar import (
+    ALIGNMENT,
+    read_columnar,
+    read_columnar_header,
+    write_columnar,
+)
+from src.utils.files import create_save_file
+
+
+class TestColumnar(unittest.TestCase):
+    def setUp(self):
+        """Set up des colonies de chaque moteur après quelques jours."""
+        self.settings = Settings(initial_ant_quantity=300)
+        self.colonies = {}
+        for engine in ENGINES:
+            colony = create_colony(self.settings, engine)
+            for _ in range(40):
+                colony.evolve()
+            self.colonies[engine] = colony
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "colony.colony")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_columns_match_to_dict(self):
+        """Test si les colonnes contiennent les mêmes agents que to_dict."""
+        for engine, colony in self.colonies.items():
+            columns = colony.to_columns()
+            data = colony.to_dict()
+            for group in ("ants", "eggs"):
+                for key in ("age", "max_age", "state"):
+                    self.assertEqual(
+                        columns[group][key].tolist(),
+                        [agent[key] for agent in data[group]],
+                        f"{engine} {group} {key}",
+                    )
+            self.assertEqual(
+                columns["eggs"]["is_queen_egg"].tolist(),
+                [egg["is_queen_egg"] for egg in data["eggs"]],
+            )
+
+    def test_round_trip(self):
+        """Test si une sauvegarde relue donne les mêmes colonnes."""
+        for colony in self.colonies.values():
+            columns = colony.to_columns()
+            write_columnar(self.file_path, self.settings, columns)
+            loaded = read_columnar(self.file_path)
+            self.assertEqual(loaded["settings"], self.settings.to_dict())
+            self.assertEqual(loaded["colony"]["day"], colony.day)
+            self.assertEqual(loaded["colony"]["queen"], colony.queen.to_dict())
+            for group in ("ants", "eggs"):
+                for key, column in columns[group].items():
+                    np.testing.assert_array_equal(loaded["colony"][group][key], column)
+            del loaded
+
+    def test_arrays_are_memory_mapped(self):
+        """Test si les colonnes sont des vues alignées sur le fichier."""
+        write_columnar(
+            self.file_path, self.settings, self.colonies["array"].to_columns()
+        )
+        header = read_columnar_header(self.file_path)
+        self.assertEqual(header["data_offset"] % ALIGNMENT, 0)
+        ages = read_columnar(self.file_path)["colony"]["ants"]["age"]
+        self.assertIsInstance(ages.base, np.memmap)
+        self.assertFalse(ages.flags.writeable)
+
+    def test_save_file_format(self):
+        """Test si create_save_file écrit le format demandé."""
+        colony = self.colonies["object"]
+        unique_id = create_save_file(colony, self.directory.name, "columnar")
+        file_path = os.path.join(self.directory.name, f"sim_{unique_id}.colony")
+        self.assertEqual(read_columnar_header(file_path)["colony"]["day"], colony.day)
+        with self.assertRaises(ValueError):
+            create_save_file(colony, self.directory.name, "xml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Ce module test la compression des sauvegardes
+"""
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.classes.settings import Settings
+
+from src.utils.compression import (
+    COMPRESSIONS,
+    compression_suffix,
+    detect_compression,
+    open_file,
+)
+from src.utils.columnar import read_columnar, write_columnar
+from src.utils.streaming import iter_json_lines, write_json, write_json_lines
+from src.utils.files import create_save_file, parse_save_name, rebuild_catalog
+from src.utils.headless import create_colony
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        """Set up une colonie après quelques jours et un dossier temporaire."""
+        self.settings = Settings(initial_ant_quantity=300)
+        self.colony = create_colony(self.settings, "array")
+        for _ in range(40):
+            self.colony.evolve()
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "sim")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_detect_compression(self):
+        """Test si la compression est reconnue à ses premiers octets."""
+        for compression in (None, *COMPRESSIONS):
+            with open_file(self.file_path, "w", compression) as file:
+                file.write("fourmis")
+            self.assertEqual(detect_compression(self.file_path), compression)
+            with open_file(self.file_path) as file:
+                self.assertEqual(file.read(), "fourmis")
+
+    def test_invalid_compression(self):
+        """Test si une compression ou un niveau inconnu est refusé."""
+        with self.assertRaises(ValueError):
+            open_file(self.file_path, "w", "zip")
+        with self.assertRaises(ValueError):
+            open_file(self.file_path, "w", "gzip", 10)
+        with self.assertRaises(ValueError):
+            compression_suffix("zip")
+
+    def test_level_changes_size(self):
+        """Test si un niveau plus élevé donne un fichier plus petit."""
+        sizes = []
+        for level in (0, 9):
+            write_json(
+                self.file_path,
+                self.settings,
+                self.colony,
+                compression="gzip",
+                level=level,
+            )
+            sizes.append(os.path.getsize(self.file_path))
+        self.assertLess(sizes[1], sizes[0])
+
+    def test_json_round_trip(self):
+        """Test si le JSON compressé est identique à to_dict."""
+        for compression in COMPRESSIONS:
+            write_json(
+                self.file_path, self.settings, self.colony, compression=compression
+            )
+            with open_file(self.file_path) as file:
+                self.assertEqual(json.load(file)["colony"], self.colony.to_dict())
+
+    def test_json_lines_round_trip(self):
+        """Test si les agents relus d'un JSON Lines compressé sont les mêmes."""
+        for compression in COMPRESSIONS:
+            write_json_lines(
+                self.file_path, self.settings, self.colony, compression=compression
+            )
+            ants = []
+            for group, chunk in iter_json_lines(self.file_path, chunk_size=100):
+                if group == "ants":
+                    ants.extend(chunk)
+            self.assertEqual(ants, self.colony.to_dict()["ants"])
+
+    def test_columnar_round_trip(self):
+        """Test si les colonnes relues d'un fichier compressé sont les mêmes."""
+        columns = self.colony.to_columns()
+        for compression in COMPRESSIONS:
+            write_columnar(self.file_path, self.settings, columns, compression)
+            data = read_columnar(self.file_path)
+            for group in ("ants", "eggs"):
+                for name, column in columns[group].items():
+                    np.testing.assert_array_equal(data["colony"][group][name], column)
+
+    def test_compressed_saves_are_indexed(self):
+        """Test si les sauvegardes compressées sont reconnues et indexées."""
+        for file_format, compression in (
+            ("json", "gzip"),
+            ("jsonl", "bz2"),
+            ("columnar", "lzma"),
+        ):
+            create_save_file(
+                self.colony,
+                self.directory.name,
+                file_format,
+                file_format,
+                compression=compression,
+            )
+        self.assertEqual(
+            sorted(
+                parse_save_name(file)
+                for file in os.listdir(self.directory.name)
+                if file.startswith("sim_")
+            ),
+            [("columnar", "columnar"), ("json", "json"), ("jsonl", "jsonl")],
+        )
+        self.assertEqual(
+            {
+                detect_compression(os.path.join(self.directory.name, file))
+                for file in os.listdir(self.directory.name)
+                if file.startswith("sim_")
+            },
+            set(COMPRESSIONS),
+        )
+
+        os.remove(os.path.join(self.directory.name, "catalog.sqlite3"))
+        rows = rebuild_catalog(self.directory.name).list(order_by="unique_id")
+        self.assertEqual(
+            [(row["unique_id"], row["final_day"]) for row in rows],
+            [(name, self.colony.day) for name in ("columnar", "json", "jsonl")],
+        )
+
+    def test_parse_save_name(self):
+        """Test si les fichiers qui ne sont pas des sauvegardes sont ignorés."""
+        self.assertEqual(parse_save_name("sim_a.json.gz"), ("a", "json"))
+        self.assertEqual(parse_save_name("sim_a.colony"), ("a", "columnar"))
+        self.assertIsNone(parse_save_name("sim_a.telemetry"))
+        self.assertIsNone(parse_save_name("catalog.sqlite3"))
+
+
+if __name__ == "__main__":
+    unittest.main()
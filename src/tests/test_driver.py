@@ -0,0 +1,158 @@
+"""
+Ce module test le pilote asyncio d'une simulation
+"""
+import asyncio
+import time
+import unittest
+
+from src.classes.settings import Settings
+
+from src.utils.headless import create_colony, simulate
+from src.utils.driver import SimulationDriver, drive, serve_control
+
+
+class TestDriver(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        """Set up une colonie simulée le plus vite possible."""
+        self.settings = Settings(simulation_speed=0.0, initial_ant_quantity=100)
+
+    def __driver(self, **options) -> SimulationDriver:
+        return SimulationDriver(create_colony(self.settings), **options)
+
+    async def test_runs_in_batches(self):
+        """Test si le pilote simule les mêmes jours et rend la main par lots."""
+        days = []
+        driver = self.__driver(
+            max_days=100, batch_days=16, on_day=[lambda c: days.append(c.day)]
+        )
+        ticks = 0
+
+        async def count_ticks():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.create_task(count_ticks())
+        colony = await driver.run()
+        ticker.cancel()
+
+        series = simulate(self.settings, max_days=100)
+        self.assertEqual(days, list(series.days))
+        self.assertEqual(colony.ant_count(), series.ants[-1])
+        self.assertGreaterEqual(ticks, 100 // 16)
+
+    async def test_command_within_slice(self):
+        """Test si une commande est appliquée au plus une tranche plus tard."""
+        loop = asyncio.get_running_loop()
+        days = []
+
+        def slow_day(colony):
+            days.append(colony.day)
+            time.sleep(0.005)
+
+        # Un lot de 64 jours durerait plus de 0,3 s
+        driver = self.__driver(max_days=2000, batch_days=64, on_day=[slow_day])
+        task = asyncio.create_task(driver.run())
+        issued = loop.time() + 0.05
+        applied = []
+
+        def pause():
+            applied.append((loop.time(), len(days)))
+            driver.pause()
+
+        loop.call_at(issued, pause)
+        await asyncio.sleep(0.2)
+        self.assertTrue(driver.paused)
+        when, day_count = applied[0]
+        self.assertLess(when - issued, 0.01 + 0.005 + 0.05)
+        self.assertEqual(len(days), day_count)
+        driver.stop()
+        await asyncio.wait_for(task, 5)
+
+    async def test_initial_pacing(self):
+        """Test si simulation_speed est le délai initial."""
+        settings = Settings(simulation_speed=0.25)
+        self.assertEqual(SimulationDriver(create_colony(settings)).day_delay, 0.25)
+
+    async def test_pause_step_resume(self):
+        """Test si la pause, le pas à pas et la reprise sont respectés."""
+        driver = self.__driver(max_days=200, batch_days=8)
+        driver.pause()
+        task = asyncio.create_task(driver.run())
+        await asyncio.sleep(0.01)
+        self.assertEqual(driver.colony.day, 0)
+
+        driver.handle("s 3")
+        await asyncio.sleep(0.01)
+        self.assertEqual(driver.colony.day, 3)
+        self.assertTrue(driver.paused)
+
+        self.assertTrue(driver.handle("r").startswith("running"))
+        await asyncio.wait_for(task, 30)
+        self.assertEqual(driver.colony.day, 200)
+
+    async def test_speed_and_stop(self):
+        """Test si un changement de délai interrompt l'attente en cours."""
+        driver = self.__driver(day_delay=60.0)
+        task = asyncio.create_task(driver.run())
+        await asyncio.sleep(0.01)
+        self.assertEqual(driver.colony.day, 1)
+        driver.handle("speed 0")
+        await asyncio.sleep(0.01)
+        self.assertGreater(driver.colony.day, 1)
+        driver.handle("stop")
+        await asyncio.wait_for(task, 5)
+        self.assertTrue(driver.finished)
+
+    async def test_fast_forward_command(self):
+        """Test si l'avance rapide jusqu'à un évènement rend la main ensuite."""
+        driver = self.__driver(day_delay=60.0)
+        self.assertTrue(driver.handle("ff").startswith("error"))
+        self.assertTrue(driver.handle("ff population 1000").endswith("1000"))
+        task = asyncio.create_task(driver.run())
+        for _ in range(500):
+            await asyncio.sleep(0.01)
+            if driver.last_event:
+                break
+        self.assertIsNone(driver.fast_forward)
+        self.assertGreaterEqual(driver.colony.ant_count(), 1000)
+        driver.stop()
+        await asyncio.wait_for(task, 5)
+
+    async def test_invalid_commands(self):
+        """Test si une commande invalide renvoie une erreur sans rien changer."""
+        driver = self.__driver()
+        self.assertTrue(driver.handle("jump").startswith("error"))
+        self.assertTrue(driver.handle("speed").startswith("error"))
+        self.assertTrue(driver.handle("speed -1").startswith("error"))
+        self.assertTrue(driver.handle("step 0").startswith("error"))
+        self.assertFalse(driver.paused)
+
+    async def test_control_socket(self):
+        """Test si les commandes reçues par le socket local sont exécutées."""
+        driver = self.__driver(max_days=50)
+        driver.pause()
+        server = await serve_control(driver, port=0)
+        port = server.sockets[0].getsockname()[1]
+        task = asyncio.create_task(drive(driver, keyboard=False))
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"step 4\n")
+        await writer.drain()
+        self.assertTrue((await reader.readline()).startswith(b"paused"))
+        await asyncio.sleep(0.01)
+        self.assertEqual(driver.colony.day, 4)
+        writer.write(b"q\n")
+        await writer.drain()
+        await reader.readline()
+        writer.close()
+
+        await asyncio.wait_for(task, 5)
+        server.close()
+        await server.wait_closed()
+        self.assertEqual(driver.colony.day, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Ce module test le lancement d'ensembles de simulations
+"""
+import unittest
+
+import numpy as np
+
+from src.classes.settings import Settings
+
+from src.utils.ensemble import run_ensemble
+
+
+class TestEnsemble(unittest.TestCase):
+    def setUp(self):
+        """Set up les paramètres pour les tests."""
+        self.settings = Settings(initial_ant_quantity=100)
+
+    def test_summary_shape(self):
+        """Test si les statistiques couvrent chaque jour de l'horizon."""
+        seeds = []
+        summary = run_ensemble(
+            self.settings,
+            3,
+            40,
+            workers=1,
+            on_result=lambda seed, series: seeds.append(seed),
+        )
+        self.assertEqual(sorted(seeds), [1234, 1235, 1236])
+        self.assertEqual(len(summary["ants"]["mean"]), 40)
+        self.assertTrue(
+            np.all(summary["ants"]["quantiles"][0.05] <= summary["ants"]["mean"])
+        )
+
+    def test_worker_count_does_not_change_results(self):
+        """Test si le nombre de processus ne change pas les statistiques."""
+        sequential = run_ensemble(self.settings, 3, 40, engine="cohort", workers=1)
+        parallel = run_ensemble(self.settings, 3, 40, engine="cohort", workers=2)
+        np.testing.assert_allclose(sequential["food"]["mean"], parallel["food"]["mean"])
+        np.testing.assert_allclose(
+            sequential["ants"]["quantiles"][0.5], parallel["ants"]["quantiles"][0.5]
+        )
+
+    def test_extinct_runs_are_padded(self):
+        """Test si une colonie éteinte compte pour zéro fourmi jusqu'à la fin."""
+        self.settings.initial_food_quantity = 0.0
+        self.settings.min_food_multiplier = 0.0
+        self.settings.max_food_multiplier = 0.0
+        summary = run_ensemble(self.settings, 2, 10, workers=1)
+        self.assertTrue(np.all(summary["ants"]["mean"] == 0))
+
+    def test_requires_horizon(self):
+        """Test si un ensemble sans horizon lève une erreur."""
+        with self.assertRaises(ValueError):
+            run_ensemble(self.settings, 2, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
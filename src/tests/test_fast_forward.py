@@ -0,0 +1,89 @@
+"""
+Ce module test les modes d'avance rapide
+"""
+import unittest
+
+from src.classes.settings import Settings
+
+from src.utils.headless import create_colony, simulate
+from src.utils.fast_forward import MAX_SKIP, FastForward, run_batch
+from src.utils.runner import SimulationRunner
+
+
+class TestFastForward(unittest.TestCase):
+    def setUp(self):
+        """Set up une colonie dont la reine meurt vers le jour 60."""
+        self.settings = Settings(
+            initial_ant_quantity=100, queen_avg_age=60, queen_avg_age_variation=0
+        )
+
+    def test_parse(self):
+        """Test si les descriptions des modes sont reconnues."""
+        self.assertEqual(FastForward.parse("x10").describe(), "x10")
+        self.assertEqual(FastForward.parse("100").batch_days(), 100)
+        self.assertEqual(FastForward.parse("adaptive").describe(), "adaptive")
+        self.assertEqual(
+            FastForward.parse("population 500").describe(), "until population 500"
+        )
+        for text in ("", "x0", "fast", "population"):
+            with self.assertRaises(ValueError):
+                FastForward.parse(text)
+
+    def test_adaptive_batch_size(self):
+        """Test si la taille des lots suit le coût mesuré d'un jour."""
+        fast_forward = FastForward(fps=10)
+        self.assertEqual(fast_forward.batch_days(), 1)
+        fast_forward.measure(10, 0.01)
+        self.assertEqual(fast_forward.batch_days(), 100)
+        fast_forward.measure(1, 10.0)
+        self.assertEqual(fast_forward.batch_days(), 1)
+        fast_forward = FastForward(fps=10)
+        fast_forward.measure(1_000_000, 0.001)
+        self.assertEqual(fast_forward.batch_days(), MAX_SKIP)
+        self.assertAlmostEqual(fast_forward.delay(1.0, 0.04), 0.06)
+
+    def test_delay(self):
+        """Test si l'attente entre deux lots dépend du mode."""
+        self.assertEqual(FastForward(skip=10).delay(0.5, 0.01), 0.5)
+        self.assertEqual(FastForward(until="extinction").delay(0.5, 0.01), 0.0)
+
+    def test_until_queen_death(self):
+        """Test si l'avance rapide s'arrête le jour de la mort de la reine."""
+        series = simulate(self.settings)
+        queen_death = series.days[list(series.queen_alive).index(0)]
+
+        colony = create_colony(self.settings)
+        fast_forward = FastForward(until="queen-death")
+        while not run_batch(colony, fast_forward):
+            pass
+        self.assertEqual(colony.day, queen_death)
+        self.assertFalse(colony.queen.is_alive)
+
+    def test_batches_keep_results(self):
+        """Test si avancer par lots donne les mêmes jours que jour par jour."""
+        days = []
+        runner = SimulationRunner(
+            create_colony(self.settings),
+            on_day=[lambda colony: days.append(colony.day)],
+            fast_forward=FastForward(skip=7),
+        )
+        runner.start()
+        colony = runner.result(timeout=30)
+        series = simulate(self.settings)
+        self.assertEqual(days, list(series.days))
+        self.assertEqual(colony.dead_ant_count(), series.dead_ants[-1])
+
+    def test_runner_stops_fast_forward_at_event(self):
+        """Test si le thread revient au jour par jour après l'évènement."""
+        runner = SimulationRunner(
+            create_colony(self.settings),
+            fast_forward=FastForward(until="population", threshold=1000),
+        )
+        runner.start()
+        runner.result(timeout=30)
+        self.assertIsNone(runner.fast_forward)
+        self.assertEqual(runner.last_event, "until population 1000")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Ce module test la classe FrozenSettings
+"""
+import pickle
+import unittest
+
+from src.classes.settings import FrozenSettings, Settings
+
+
+class TestFrozenSettings(unittest.TestCase):
+    def setUp(self):
+        """Set up des paramètres modifiés et leur copie immuable."""
+        self.settings = Settings(simulation_seed=7, initial_ant_quantity=250)
+        self.frozen = self.settings.freeze()
+
+    def test_same_values(self):
+        """Test si la copie immuable a les mêmes valeurs que les paramètres."""
+        self.assertEqual(self.frozen.to_dict(), self.settings.to_dict())
+        self.assertEqual(self.frozen.initial_ant_quantity, 250)
+        self.assertEqual(self.frozen.thaw().to_dict(), self.settings.to_dict())
+
+    def test_immutable(self):
+        """Test si les paramètres gelés ne peuvent pas être modifiés."""
+        with self.assertRaises(AttributeError):
+            self.frozen.simulation_seed = 8
+
+    def test_hash(self):
+        """Test si l'empreinte ne dépend que du contenu."""
+        same = FrozenSettings.from_trusted_dict(self.settings.to_dict())
+        other = self.frozen._replace(simulation_seed=8)
+        self.assertEqual(same, self.frozen)
+        self.assertEqual(hash(same), hash(self.frozen))
+        self.assertEqual(same.content_hash, self.frozen.content_hash)
+        self.assertNotEqual(other.content_hash, self.frozen.content_hash)
+        # La vitesse d'affichage ne change pas les résultats
+        faster = self.frozen._replace(simulation_speed=0.0)
+        self.assertNotEqual(faster, self.frozen)
+        self.assertEqual(faster.content_hash, self.frozen.content_hash)
+        self.assertEqual({self.frozen: 1}[same], 1)
+
+    def test_bytes_round_trip(self):
+        """Test si la représentation binaire redonne les mêmes paramètres."""
+        data = self.frozen.to_bytes()
+        self.assertEqual(len(data), 8 * len(FrozenSettings._fields))
+        restored = FrozenSettings.from_bytes(data)
+        self.assertEqual(restored, self.frozen)
+        self.assertIsInstance(restored.simulation_seed, int)
+        self.assertIsInstance(restored.simulation_speed, float)
+
+    def test_pickle_is_compact(self):
+        """Test si les paramètres gelés sont plus légers à envoyer."""
+        self.assertEqual(pickle.loads(pickle.dumps(self.frozen)), self.frozen)
+        self.assertLess(
+            len(pickle.dumps(self.frozen)), len(pickle.dumps(self.settings))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
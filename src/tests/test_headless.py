@@ -0,0 +1,46 @@
+"""
+Ce module test la simulation sans affichage
+"""
+import unittest
+
+from src.classes.settings import Settings
+
+from src.utils.headless import simulate, ENGINES
+
+
+class TestSimulate(unittest.TestCase):
+    def setUp(self):
+        """Set up les paramètres pour les tests."""
+        self.settings = Settings(initial_ant_quantity=200)
+
+    def test_max_days(self):
+        """Test si la simulation s'arrête après max_days jours."""
+        for engine in ENGINES:
+            series = simulate(self.settings, max_days=30, engine=engine)
+            self.assertEqual(len(series), 30)
+            self.assertEqual(list(series.days), list(range(1, 31)))
+
+    def test_is_reproducible(self):
+        """Test si deux simulations avec la même seed donnent la même série."""
+        first = simulate(self.settings, max_days=100)
+        second = simulate(self.settings, max_days=100)
+        self.assertEqual(first.to_dict(), second.to_dict())
+
+    def test_runs_until_extinction(self):
+        """Test si la simulation s'arrête quand la colonie est éteinte."""
+        self.settings.initial_food_quantity = 0.0
+        self.settings.min_food_multiplier = 0.0
+        self.settings.max_food_multiplier = 0.0
+        series = simulate(self.settings)
+        self.assertEqual(len(series), 1)
+        self.assertEqual(series.ants[-1], 0)
+        self.assertFalse(series.queen_alive[-1])
+
+    def test_unknown_engine(self):
+        """Test si un moteur inconnu lève une erreur."""
+        with self.assertRaises(ValueError):
+            simulate(self.settings, max_days=1, engine="unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Ce module test l'historique résumé et son graphique
+"""
+import random
+import unittest
+
+from rich.console import Console
+
+from src.classes.history import History
+from src.utils.chart import HistoryChart, create_chart, sparkline
+
+
+class TestHistory(unittest.TestCase):
+    def setUp(self):
+        """Set up un historique de 1000 jours aléatoires."""
+        random.seed(0)
+        self.values = [
+            {name: random.randint(0, 1000) for name in ("ants", "eggs", "workers")}
+            | {"food": random.random()}
+            for _ in range(1000)
+        ]
+        self.history = History(width=16)
+        for values in self.values:
+            self.history.append(values)
+
+    def test_size_is_bounded(self):
+        """Test si le nombre de colonnes ne dépend pas du nombre de jours."""
+        buckets = self.history.buckets()
+        self.assertEqual(buckets["days"], 1000)
+        for column in buckets["metrics"].values():
+            self.assertLessEqual(len(column["max"]), 16)
+            self.assertGreater(len(column["max"]), 8)
+        for values in self.values * 50:
+            self.history.append(values)
+        self.assertLessEqual(len(self.history.buckets()["metrics"]["ants"]["max"]), 16)
+
+    def test_columns_match_days(self):
+        """Test si chaque colonne garde le minimum et le maximum de ses jours."""
+        buckets = self.history.buckets()
+        size = buckets["column_days"]
+        for name, column in buckets["metrics"].items():
+            days = [values[name] for values in self.values]
+            for index, (low, high) in enumerate(zip(column["min"], column["max"])):
+                chunk = days[index * size : (index + 1) * size]
+                self.assertEqual((low, high), (min(chunk), max(chunk)))
+            self.assertEqual(column["last"], days[-1])
+
+    def test_sparkline(self):
+        """Test si la courbe a un caractère par valeur, du plus bas au plus haut."""
+        self.assertEqual(sparkline([0, 5, 10], 0, 10), "▁▅█")
+        self.assertEqual(sparkline([3, 3], 3, 3), "▁▁")
+
+    def test_chart(self):
+        """Test si le graphique affiche chaque métrique."""
+        console = Console(record=True, width=120)
+        console.print(create_chart(self.history))
+        text = console.export_text()
+        for name in ("Ants", "Eggs", "Workers", "Food"):
+            self.assertIn(name, text)
+        self.assertIn("1000 days", text)
+
+    def test_persistent_chart(self):
+        """Test si le graphique persistant suit l'historique sans être recréé."""
+        chart = HistoryChart(self.history)
+        panel = chart.__rich__()
+        self.assertIs(chart.__rich__(), panel)
+        self.history.append(self.values[0])
+        self.assertIsNot(chart.__rich__(), panel)
+        console = Console(record=True, width=120)
+        console.print(chart)
+        self.assertIn("1001 days", console.export_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Ce module test le tableau des compteurs de l'affichage en direct
+"""
+import time
+import unittest
+
+from rich.console import Console
+
+from src.utils.live_metrics import LIVE_ROWS, LiveMetrics
+
+from src.classes.settings import Settings
+from src.utils.headless import create_colony
+from src.utils.runner import SimulationRunner, sample, take_counters
+
+
+class TestLiveMetrics(unittest.TestCase):
+    def setUp(self):
+        """Set up des compteurs d'un jour de simulation."""
+        self.counters = {
+            "playback": "normal",
+            "day": 400,
+            "eggs": 12,
+            "ants": 250,
+            "workers": 200,
+            "food": 1234.5678,
+            "queen_alive": True,
+            "dead_ants": 3,
+        }
+
+    def __render(self, metrics: LiveMetrics) -> str:
+        console = Console(width=80, record=True, file=open("/dev/null", "w"))
+        console.print(metrics)
+        console.file.close()
+        return console.export_text()
+
+    def test_redraw_only_on_change(self):
+        """Test si seules les mises à jour visibles demandent un dessin."""
+        metrics = LiveMetrics()
+        self.assertTrue(metrics.update(self.counters))
+        self.assertFalse(metrics.update(dict(self.counters)))
+        # Un changement arrondi à l'affichage ne redessine rien
+        self.assertFalse(metrics.update(self.counters | {"food": 1234.5699}))
+        self.assertTrue(metrics.update(self.counters | {"ants": 251}))
+        text = self.__render(metrics)
+        self.assertIn("251", text)
+        self.assertIn("1234.57", text)
+        self.assertIn("Alive", text)
+
+    def test_formats_changed_cells_only(self):
+        """Test si une valeur inchangée n'est pas remise en forme."""
+        calls = []
+
+        def count(value):
+            calls.append(value)
+            return str(value)
+
+        rows = [(label, key, count) for label, key, _ in LIVE_ROWS]
+        metrics = LiveMetrics(rows)
+        metrics.update(self.counters)
+        self.assertEqual(len(calls), len(rows))
+        calls.clear()
+        metrics.update(self.counters | {"eggs": 13})
+        self.assertEqual(calls, [13])
+
+    def test_cells_updated_in_place(self):
+        """Test si le tableau et ses cellules inchangées sont gardés."""
+        metrics = LiveMetrics()
+        metrics.update(self.counters)
+        table = metrics.table
+        before = list(table.columns[1].cells)
+        plain = [cell.plain for cell in before]
+        metrics.update(self.counters | {"ants": 251})
+        after = list(metrics.table.columns[1].cells)
+        self.assertIs(metrics.table, table)
+        self.assertTrue(all(old is new for old, new in zip(before, after)))
+        changed = [
+            index for index, cell in enumerate(after) if cell.plain != plain[index]
+        ]
+        self.assertEqual(changed, [4])
+        self.assertEqual(after[4].plain, "251")
+
+    def test_empty_table(self):
+        """Test si un tableau sans compteurs peut être affiché."""
+        self.assertIn("Queen", self.__render(LiveMetrics()))
+
+
+class TestRenderBudget(unittest.TestCase):
+    def __runner(self) -> SimulationRunner:
+        settings = Settings(
+            initial_ant_quantity=50, queen_avg_age=30, queen_avg_age_variation=0
+        )
+        return SimulationRunner(create_colony(settings), day_delay=0.002)
+
+    def test_render_share_is_bounded(self):
+        """Test si un affichage lent est espacé pour rester sous sa part."""
+        runner = self.__runner()
+
+        def slow_render(counters):
+            time.sleep(0.01)
+
+        stats = {}
+        runner.start()
+        sample(runner, slow_render, fps=1000, max_share=0.2, stats=stats)
+        self.assertEqual(stats["skipped"], 0)
+        # La dernière image, celle des compteurs finaux, n'est pas espacée
+        self.assertLessEqual(stats["render_seconds"], stats["elapsed"] * 0.2 + 0.02)
+
+    def test_skipped_frames(self):
+        """Test si les images sans changement sont comptées comme sautées."""
+        runner = self.__runner()
+        metrics = LiveMetrics()
+        seen = []
+
+        def render(counters):
+            seen.append(counters)
+            return metrics.update(counters)
+
+        stats = {}
+        runner.start()
+        colony = sample(runner, render, fps=1000, stats=stats)
+        changes = 1 + sum(
+            previous != current for previous, current in zip(seen, seen[1:])
+        )
+        self.assertEqual(stats["frames"], len(seen))
+        self.assertLessEqual(stats["frames"] - stats["skipped"], changes)
+        self.assertGreater(stats["skipped"], 0)
+        self.assertFalse(metrics.update(take_counters(colony)))
+
+    def test_invalid_share(self):
+        """Test si une part d'affichage invalide est refusée."""
+        for share in (0, -0.1, 1.5):
+            with self.assertRaises(ValueError):
+                sample(self.__runner(), print, max_share=share)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Ce module test la classe RandomStreams
+"""
+import unittest
+
+import numpy as np
+
+from src.classes.settings import Settings
+
+from src.classes.random_streams import RandomStreams
+from src.utils.headless import simulate, ENGINES
+
+
+class TestRandomStreams(unittest.TestCase):
+    def setUp(self):
+        """Set up les paramètres pour les tests."""
+        self.settings = Settings()
+
+    def test_same_seed_same_draws(self):
+        """Test si deux générateurs avec la même seed tirent les mêmes valeurs."""
+        first = RandomStreams(self.settings)
+        second = RandomStreams(self.settings)
+        self.assertEqual(
+            first.ant_max_ages(100).tolist(), second.ant_max_ages(100).tolist()
+        )
+        self.assertEqual(first.clutch_size(), second.clutch_size())
+
+    def test_streams_are_independent(self):
+        """Test si tirer dans un sous-système ne change pas les autres."""
+        first = RandomStreams(self.settings)
+        second = RandomStreams(self.settings)
+        first.ant_max_ages(1000)
+        first.professions(1000)
+        self.assertEqual(first.queen_max_age(), second.queen_max_age())
+        self.assertEqual(first.food_gain(500), second.food_gain(500))
+
+    def test_batched_draws(self):
+        """Test si les tirages groupés respectent les bornes des paramètres."""
+        streams = RandomStreams(self.settings)
+        max_ages = streams.ant_max_ages(1000)
+        self.assertEqual(len(max_ages), 1000)
+        self.assertTrue(
+            (
+                max_ages
+                >= self.settings.ant_avg_age - self.settings.ant_avg_age_variation
+            ).all()
+        )
+        lifetimes = streams.ant_lifetimes(max_ages)
+        self.assertTrue((lifetimes >= 1).all())
+        self.assertTrue((lifetimes <= max_ages + 1).all())
+
+    def test_state_round_trip(self):
+        """Test si restaurer l'état rejoue exactement les mêmes tirages."""
+        streams = RandomStreams(self.settings)
+        streams.clutch_size()
+        state = streams.get_state()
+        expected = [streams.clutch_size(), streams.hatched_counts(500, False)]
+        streams.set_state(state)
+        self.assertEqual(
+            expected, [streams.clutch_size(), streams.hatched_counts(500, False)]
+        )
+
+    def test_engines_are_reproducible(self):
+        """Test si une même graine redonne la même simulation avec chaque moteur."""
+        settings = Settings(initial_ant_quantity=200)
+        other_seed = Settings(initial_ant_quantity=200, simulation_seed=1)
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                first = simulate(settings, max_days=60, engine=engine)
+                second = simulate(settings, max_days=60, engine=engine)
+                self.assertEqual(first.to_dict(), second.to_dict())
+                self.assertNotEqual(
+                    first.to_dict(),
+                    simulate(other_seed, max_days=60, engine=engine).to_dict(),
+                )
+
+    def test_engines_agree_on_average(self):
+        """Test si les moteurs donnent les mêmes moyennes sur plusieurs graines."""
+        metrics = ("ants", "eggs", "workers", "food", "dead_ants")
+        means = {}
+        for engine in ENGINES:
+            finals = []
+            for seed in range(1, 9):
+                settings = Settings(initial_ant_quantity=200, simulation_seed=seed)
+                series = simulate(settings, max_days=100, engine=engine)
+                finals.append([getattr(series, metric)[-1] for metric in metrics])
+            means[engine] = np.mean(finals, axis=0)
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                np.testing.assert_allclose(means[engine], means["object"], rtol=0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Ce module test le replay d'une simulation
+"""
+import os
+import tempfile
+import unittest
+
+from src.classes.settings import Settings
+
+from src.utils.headless import create_colony, simulate
+from src.utils.replay import Replay
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        """Set up une simulation enregistrée avec un checkpoint tous les 25 jours."""
+        self.settings = Settings(initial_ant_quantity=200)
+        self.replay = Replay(self.settings, every=25)
+        self.series = simulate(self.settings, max_days=120, replay=self.replay)
+
+    def __expected(self, day: int) -> dict:
+        colony = create_colony(self.settings)
+        for _ in range(day):
+            colony.evolve()
+        return colony.to_dict()
+
+    def test_sparse_checkpoints(self):
+        """Test si seul un checkpoint tous les `every` jours est gardé."""
+        self.assertEqual(self.replay.days, [0, 25, 50, 75, 100])
+        self.assertEqual(self.replay.last_day, 120)
+
+    def test_colony_at(self):
+        """Test si la colonie d'un jour est celle de la simulation d'origine."""
+        for day in (0, 24, 25, 93, 120):
+            self.assertEqual(self.replay.colony_at(day).to_dict(), self.__expected(day))
+
+    def test_iter_days(self):
+        """Test si les jours générés suivent les métriques de la simulation."""
+        days, ants = [], []
+        for colony in self.replay.iter_days(40, 110, step=7):
+            days.append(colony.day)
+            ants.append(colony.ant_count())
+        self.assertEqual(days, list(range(40, 110, 7)))
+        self.assertEqual(ants, [self.series.ants[day - 1] for day in days])
+        self.assertEqual(
+            [colony.day for colony in self.replay.iter_days(118)], [118, 119, 120]
+        )
+
+    def test_days_after_recording(self):
+        """Test si les jours après le dernier jour enregistré sont refusés."""
+        with self.assertRaises(ValueError):
+            self.replay.colony_at(121)
+        with self.assertRaises(ValueError):
+            list(self.replay.iter_days(100, 200))
+        with self.assertRaises(ValueError):
+            list(self.replay.iter_days(121))
+        self.assertEqual(
+            [colony.day for colony in self.replay.iter_days(100, 121, 10)],
+            [100, 110, 120],
+        )
+
+    def test_save_and_load(self):
+        """Test si un replay relu redonne les mêmes colonies."""
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "sim.replay")
+            self.replay.save(file_path, compression="gzip")
+            loaded = Replay.load(file_path)
+        self.assertEqual(loaded.days, self.replay.days)
+        self.assertEqual(loaded.last_day, 120)
+        self.assertEqual(loaded.colony_at(60).to_dict(), self.__expected(60))
+
+    def test_only_object_engine(self):
+        """Test si une colonie d'un autre moteur est refusée."""
+        with self.assertRaises(ValueError):
+            self.replay.record(create_colony(self.settings, "array"))
+        with self.assertRaises(ValueError):
+            Replay(self.settings).colony_at(10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Ce module test la simulation dans son propre thread
+"""
+import time
+import unittest
+
+from src.classes.settings import Settings
+
+from src.utils.headless import create_colony, simulate
+from src.utils.runner import SimulationRunner, sample, take_counters
+
+
+class TestRunner(unittest.TestCase):
+    def setUp(self):
+        """Set up une petite colonie qui s'éteint rapidement."""
+        self.settings = Settings(
+            initial_ant_quantity=50, queen_avg_age=30, queen_avg_age_variation=0
+        )
+
+    def test_runs_to_extinction(self):
+        """Test si le thread simule les mêmes jours que simulate."""
+        days = []
+        runner = SimulationRunner(
+            create_colony(self.settings),
+            on_day=[lambda colony: days.append(colony.day)],
+        )
+        runner.start()
+        colony = runner.result(timeout=30)
+        series = simulate(self.settings)
+        self.assertEqual(days, list(series.days))
+        self.assertEqual(runner.counters, take_counters(colony))
+        self.assertEqual(runner.counters["ants"], series.ants[-1])
+
+    def test_stop(self):
+        """Test si stop arrête la simulation sans attendre le délai."""
+        runner = SimulationRunner(create_colony(self.settings), day_delay=60.0)
+        runner.start()
+        time.sleep(0.05)
+        runner.stop()
+        start = time.monotonic()
+        colony = runner.result(timeout=5)
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(colony.day, 1)
+
+    def test_error_is_raised(self):
+        """Test si une erreur du thread est levée par result."""
+
+        def fail(colony):
+            raise RuntimeError(f"day {colony.day}")
+
+        runner = SimulationRunner(create_colony(self.settings), on_day=[fail])
+        runner.start()
+        with self.assertRaisesRegex(RuntimeError, "day 1"):
+            runner.result(timeout=5)
+
+    def test_sample_rate(self):
+        """Test si l'affichage suit sa propre fréquence, pas celle des jours."""
+        frames = []
+        runner = SimulationRunner(create_colony(self.settings), day_delay=0.001)
+        runner.start()
+        start = time.monotonic()
+        colony = sample(runner, frames.append, fps=20)
+        elapsed = time.monotonic() - start
+        self.assertLess(len(frames), colony.day)
+        self.assertLessEqual(len(frames), elapsed * 20 + 2)
+        self.assertEqual(frames[-1], take_counters(colony))
+
+
+if __name__ == "__main__":
+    unittest.main()
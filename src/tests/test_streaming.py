@@ -0,0 +1,170 @@
+"""
+Ce module test les sauvegardes écrites et lues agent par agent
+"""
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+from src.classes.settings import Settings
+
+from src.utils.headless import create_colony, ENGINES
+from src.utils.files import create_save_file, load_checkpoint, load_colony
+from src.utils.streaming import (
+    iter_chunks,
+    iter_json_agents,
+    iter_json_lines,
+    read_json_checkpoint,
+    read_json_header,
+    read_json_lines_header,
+    write_json,
+    write_json_lines,
+)
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        """Set up des colonies de chaque moteur après quelques jours."""
+        self.settings = Settings(initial_ant_quantity=300)
+        self.colonies = {}
+        for engine in ENGINES:
+            colony = create_colony(self.settings, engine)
+            for _ in range(40):
+                colony.evolve()
+            self.colonies[engine] = colony
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "sim")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_iter_chunks(self):
+        """Test si les blocs ont la bonne taille et gardent l'ordre."""
+        chunks = list(iter_chunks(range(25), 10))
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 5])
+        self.assertEqual(sum(chunks, []), list(range(25)))
+
+    def test_json_matches_to_dict(self):
+        """Test si le JSON écrit en flux est identique à to_dict."""
+        for colony in self.colonies.values():
+            write_json(self.file_path, self.settings, colony, {"extra": [1, 2]})
+            with open(self.file_path, "r", encoding="utf8") as file:
+                data = json.load(file)
+            header = data.pop("header")
+            self.assertEqual(
+                data,
+                {
+                    "settings": self.settings.to_dict(),
+                    "colony": colony.to_dict(),
+                    "extra": [1, 2],
+                },
+            )
+            self.assertEqual(header["ants"], len(data["colony"]["ants"]))
+            self.assertEqual(header["eggs"], len(data["colony"]["eggs"]))
+
+    def test_json_round_trip(self):
+        """Test si l'en-tête et les agents d'un JSON se relisent par blocs."""
+        for colony in self.colonies.values():
+            write_json(self.file_path, self.settings, colony, chunk_size=50)
+            header = read_json_header(self.file_path)
+            self.assertEqual(header["settings"], self.settings.to_dict())
+            self.assertEqual(header["colony"]["day"], colony.day)
+
+            agents = {"ants": [], "eggs": []}
+            for group, chunk in iter_json_agents(self.file_path, chunk_size=100):
+                self.assertLessEqual(len(chunk), 100)
+                agents[group].extend(chunk)
+            data = colony.to_dict()
+            self.assertEqual(agents["ants"], data["ants"])
+            self.assertEqual(agents["eggs"], data["eggs"])
+
+    def test_json_checkpoint_in_chunks(self):
+        """Test si le checkpoint d'un JSON se relit bloc par bloc."""
+        colony = self.colonies["object"]
+        write_json(self.file_path, self.settings, colony, chunk_size=50)
+        with self.assertRaises(ValueError):
+            read_json_checkpoint(self.file_path)
+
+        write_json(
+            self.file_path, self.settings, colony, chunk_size=50, checkpoint=True
+        )
+        checkpoint = read_json_checkpoint(self.file_path)
+        blocks = list(checkpoint.pop("ants"))
+        self.assertGreater(len(blocks), 1)
+        self.assertTrue(all(len(block["serial"]) <= 50 for block in blocks))
+        expected = json.loads(json.dumps(colony.checkpoint()))
+        ants = expected.pop("ants")
+        self.assertEqual(checkpoint, expected)
+        for name, column in ants.items():
+            self.assertEqual(sum((block[name] for block in blocks), []), column)
+
+    def test_json_lines_round_trip(self):
+        """Test si les agents relus par blocs sont ceux de to_dict."""
+        for colony in self.colonies.values():
+            write_json_lines(self.file_path, self.settings, colony)
+            header = read_json_lines_header(self.file_path)
+            self.assertEqual(header["settings"], self.settings.to_dict())
+            self.assertEqual(header["colony"]["day"], colony.day)
+
+            agents = {"ants": [], "eggs": []}
+            for group, chunk in iter_json_lines(self.file_path, chunk_size=100):
+                self.assertLessEqual(len(chunk), 100)
+                agents[group].extend(chunk)
+            data = colony.to_dict()
+            self.assertEqual(agents["ants"], data["ants"])
+            self.assertEqual(agents["eggs"], data["eggs"])
+
+    def test_json_save_holds_colony_and_checkpoint(self):
+        """Test si une sauvegarde JSON contient la colonie et son checkpoint."""
+        colony = self.colonies["object"]
+        create_save_file(colony, self.directory.name, unique_id="object")
+        with open(
+            os.path.join(self.directory.name, "sim_object.json"), encoding="utf8"
+        ) as file:
+            data = json.load(file)
+        self.assertEqual(set(data), {"settings", "header", "colony", "checkpoint"})
+        self.assertEqual(data["colony"], colony.to_dict())
+        self.assertEqual(load_colony("object", self.directory.name), colony.to_dict())
+        resumed = load_checkpoint("object", self.directory.name)
+        self.assertEqual(resumed.ant_count(), colony.ant_count())
+
+    def test_memory_is_bounded(self):
+        """Test si le pic de mémoire ne grandit pas avec la colonie."""
+        path = os.path.join(self.directory.name, "sim_big.json")
+        peaks = {}
+        for quantity in (2_000, 8_000):
+            colony = create_colony(Settings(initial_ant_quantity=quantity), "array")
+            tracemalloc.start()
+            write_json_lines(self.file_path, colony.settings, colony, chunk_size=500)
+            peaks.setdefault("jsonl", []).append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+            colony = create_colony(Settings(initial_ant_quantity=quantity), "object")
+            tracemalloc.start()
+            write_json(path, colony.settings, colony, chunk_size=500, checkpoint=True)
+            peaks.setdefault("json", []).append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+            # Pour les chargements, seule la mémoire en plus du résultat compte
+            for name, load in (
+                ("load_colony", lambda: load_colony("big", self.directory.name, 500)),
+                (
+                    "load_checkpoint",
+                    lambda: load_checkpoint("big", self.directory.name),
+                ),
+            ):
+                tracemalloc.start()
+                loaded = load()
+                current, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                peaks.setdefault(name, []).append(peak - current)
+                del loaded
+
+        for name, (small, large) in peaks.items():
+            with self.subTest(name):
+                self.assertLess(large, small * 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
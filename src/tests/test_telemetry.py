@@ -0,0 +1,71 @@
+"""
+Ce module test l'enregistrement des métriques journalières
+"""
+import os
+import tempfile
+import unittest
+
+from src.classes.settings import Settings
+from src.classes.time_series import METRICS
+
+from src.utils.headless import create_colony, simulate
+from src.utils.telemetry import (
+    RECORD_DTYPE,
+    TelemetryRecorder,
+    read_telemetry,
+)
+
+
+class TestTelemetry(unittest.TestCase):
+    def setUp(self):
+        """Set up un fichier temporaire pour les métriques."""
+        self.settings = Settings(initial_ant_quantity=200)
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "sim.telemetry")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_matches_time_series(self):
+        """Test si les métriques relues sont celles de la simulation."""
+        recorder = TelemetryRecorder(self.file_path, buffer_days=16)
+        colony = create_colony(self.settings)
+        for _ in range(100):
+            colony.evolve()
+            recorder.record(colony)
+        recorder.close()
+
+        records = read_telemetry(self.file_path)
+        series = simulate(self.settings, max_days=100)
+        self.assertEqual(len(records), 100)
+        self.assertEqual(len(recorder), 100)
+        for name, _ in METRICS:
+            self.assertEqual(records[name].tolist(), list(getattr(series, name)))
+
+    def test_flushes_in_batches(self):
+        """Test si le fichier n'est écrit que lorsque le tampon est plein."""
+        recorder = TelemetryRecorder(self.file_path, buffer_days=10)
+        colony = create_colony(self.settings)
+        header_size = os.path.getsize(self.file_path)
+        for _ in range(9):
+            colony.evolve()
+            recorder.record(colony)
+        self.assertEqual(os.path.getsize(self.file_path), header_size)
+        colony.evolve()
+        recorder.record(colony)
+        self.assertEqual(
+            os.path.getsize(self.file_path), header_size + 10 * RECORD_DTYPE.itemsize
+        )
+        recorder.close()
+        self.assertEqual(len(read_telemetry(self.file_path)), 10)
+
+    def test_invalid_file(self):
+        """Test si un fichier qui n'est pas une télémétrie est refusé."""
+        with open(self.file_path, "wb") as file:
+            file.write(b"not telemetry")
+        with self.assertRaises(ValueError):
+            read_telemetry(self.file_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,251 @@
+"""
+Ce module contient la classe Autosaver, qui sauvegarde régulièrement une
+simulation en cours sans l'interrompre
+"""
+
+import datetime
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+from src.classes.settings import SAVE_DIRECTORY, YEAR
+from src.classes.colony import Colony
+from src.utils.columnar import write_columnar
+from src.utils.compression import compression_suffix
+from src.utils.streaming import write_json
+from src.utils.files import (
+    SAVE_FORMATS,
+    add_to_catalog,
+    parse_save_name,
+    remove_from_catalog,
+)
+
+AUTOSAVE_PREFIX = "sim_autosave_"
+AUTOSAVE_EVERY_DAYS = YEAR
+AUTOSAVE_EVERY_SECONDS = 60.0
+AUTOSAVE_KEEP = 3
+
+
+def take_snapshot(colony) -> dict:
+    """
+    Copie de l'état d'une colonie à un instant donné, indépendante de la
+    colonie : elle peut être écrite pendant que la simulation continue.
+    Une colonie Colony est copiée sous forme de checkpoint (reprenable),
+    écrit avec la colonie comme une sauvegarde JSON, les autres moteurs sous
+    forme de colonnes. La copie est faite par le
+    thread de la simulation et coûte O(N) pour N fourmis (de l'ordre d'une
+    microseconde par fourmi, autant que plusieurs dizaines de jours
+    simulés) : c'est le seul travail d'une sauvegarde qui l'interrompt.
+    """
+    if isinstance(colony, Colony):
+        return {
+            "format": "json",
+            "day": colony.day,
+            "population": colony.ant_count(),
+            "settings": colony.settings,
+            "checkpoint": colony.checkpoint(),
+        }
+
+    columns = colony.to_columns()
+    for group in ("ants", "eggs"):
+        columns[group] = {
+            name: np.array(column, copy=True) for name, column in columns[group].items()
+        }
+    return {
+        "format": "columnar",
+        "day": colony.day,
+        "population": colony.ant_count(),
+        "settings": colony.settings,
+        "columns": columns,
+    }
+
+
+class Autosaver:
+    """
+    Classe représentant la sauvegarde automatique d'une simulation.
+
+    Tous les `every_days` jours (aux multiples de `every_days`) ou toutes les
+    `every_seconds` secondes, une copie de la colonie est prise le jour même
+    puis écrite par un thread en arrière-plan, sans bloquer la simulation.
+    Une seule copie attend au plus derrière l'écriture en cours : une copie
+    plus récente remplace celle qui n'a pas encore commencé à être écrite.
+    Les jours sauvegardés restent donc des multiples de `every_days`, même
+    si l'écriture est plus lente que la simulation. Seules les `keep` sauvegardes automatiques les
+    plus récentes sont conservées. Elles peuvent être compressées avec
+    `compression` au niveau `level`.
+    """
+
+    def __init__(
+        self,
+        every_days: int = AUTOSAVE_EVERY_DAYS,
+        every_seconds: float = AUTOSAVE_EVERY_SECONDS,
+        keep: int = AUTOSAVE_KEEP,
+        directory: str = SAVE_DIRECTORY,
+        compression: str = None,
+        level: int = None,
+    ):
+        if keep < 1:
+            raise ValueError("At least one autosave must be kept")
+        compression_suffix(compression)
+
+        self.__every_days = every_days
+        self.__every_seconds = every_seconds
+        self.__keep = keep
+        self.__directory = directory
+        self.__compression = compression
+        self.__level = level
+
+        self.__last_day = None
+        self.__last_time = time.monotonic()
+        self.__pending = None
+        self.__error = None
+        self.__executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="autosave"
+        )
+
+    @property
+    def directory(self) -> str:
+        """
+        Dossier des sauvegardes automatiques
+        """
+        return self.__directory
+
+    @property
+    def pending(self) -> Future:
+        """
+        Ecriture en cours ou dernière écriture lancée
+        """
+        return self.__pending
+
+    def is_due(self, colony) -> bool:
+        """
+        Si une sauvegarde automatique doit être faite pour ce jour
+        """
+        if self.__last_day is None:
+            self.__last_day = colony.day
+        if (
+            self.__every_days
+            and colony.day // self.__every_days > self.__last_day // self.__every_days
+        ):
+            return True
+        return bool(
+            self.__every_seconds
+            and time.monotonic() - self.__last_time >= self.__every_seconds
+        )
+
+    def maybe_save(self, colony) -> bool:
+        """
+        Lance une sauvegarde automatique si elle est due. Une erreur d'une
+        écriture précédente est levée ici.
+        """
+        self.__raise_error()
+        if not self.is_due(colony):
+            return False
+        self.save(colony)
+        return True
+
+    def save(self, colony) -> Future:
+        """
+        Prend une copie de la colonie et l'écrit en arrière-plan, à la place
+        de la copie qui attendrait encore d'être écrite
+        """
+        snapshot = take_snapshot(colony)
+        self.__last_day = colony.day
+        self.__last_time = time.monotonic()
+        if self.__pending is not None:
+            self.__pending.cancel()
+        self.__pending = self.__executor.submit(self.__write, snapshot)
+        self.__pending.add_done_callback(self.__keep_error)
+        return self.__pending
+
+    def close(self):
+        """
+        Attend la fin de l'écriture en cours et arrête le thread
+        """
+        self.__executor.shutdown(wait=True)
+        self.__raise_error()
+
+    def __keep_error(self, future: Future):
+        """
+        Garde la première erreur d'écriture, levée par maybe_save ou close
+        """
+        if not future.cancelled() and self.__error is None:
+            self.__error = future.exception()
+
+    def __raise_error(self):
+        if self.__error is not None:
+            error, self.__error = self.__error, None
+            raise error
+
+    def __write(self, snapshot: dict) -> str:
+        """
+        Ecrit une copie de colonie dans un fichier temporaire puis le renomme :
+        un arrêt brutal ne laisse jamais de sauvegarde à moitié écrite
+        """
+        if not os.path.exists(self.__directory):
+            os.makedirs(self.__directory)
+
+        stamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        unique_id = f"autosave_{stamp}_day{snapshot['day']}"
+        file_path = os.path.join(
+            self.__directory,
+            f"sim_{unique_id}{SAVE_FORMATS[snapshot['format']]}"
+            f"{compression_suffix(self.__compression)}",
+        )
+        temporary_path = f"{file_path}.tmp"
+
+        if snapshot["format"] == "json":
+            # Même forme qu'une sauvegarde JSON : la colonie, recréée ici à
+            # partir de la copie, puis son checkpoint
+            colony = Colony.from_checkpoint(
+                snapshot["settings"], snapshot["checkpoint"]
+            )
+            write_json(
+                temporary_path,
+                snapshot["settings"],
+                colony,
+                compression=self.__compression,
+                level=self.__level,
+                checkpoint=True,
+            )
+        else:
+            write_columnar(
+                temporary_path,
+                snapshot["settings"],
+                snapshot["columns"],
+                self.__compression,
+                self.__level,
+            )
+        os.replace(temporary_path, file_path)
+
+        add_to_catalog(
+            unique_id,
+            snapshot["format"],
+            file_path,
+            snapshot["settings"].to_dict(),
+            snapshot["day"],
+            snapshot["population"],
+            self.__directory,
+        )
+        self.__rotate()
+        return file_path
+
+    def __rotate(self):
+        """
+        Supprime les sauvegardes automatiques les plus anciennes
+        """
+        autosaves = sorted(
+            (
+                os.path.join(self.__directory, file)
+                for file in os.listdir(self.__directory)
+                if file.startswith(AUTOSAVE_PREFIX) and not file.endswith(".tmp")
+            ),
+            key=lambda file_path: (os.stat(file_path).st_mtime_ns, file_path),
+        )
+        for file_path in autosaves[: -self.__keep]:
+            os.remove(file_path)
+            remove_from_catalog(
+                parse_save_name(os.path.basename(file_path))[0], self.__directory
+            )
@@ -0,0 +1,205 @@
+"""
+Ce module contient la classe SaveCatalog, un index SQLite des sauvegardes :
+lister, trier et filtrer les sauvegardes ne demande ni de parcourir le
+dossier ni d'ouvrir les fichiers
+"""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import List
+
+from src.classes.settings import SAVE_DIRECTORY, Settings
+
+CATALOG_FILE = "catalog.sqlite3"
+COLUMNS = (
+    "unique_id",
+    "format",
+    "path",
+    "settings",
+    "settings_hash",
+    "seed",
+    "final_day",
+    "peak_population",
+    "size",
+    "modified",
+    "created",
+)
+
+
+class SaveCatalog:
+    """
+    Classe représentant l'index des sauvegardes d'un dossier.
+    Chaque ligne décrit une sauvegarde : identifiant, format, chemin,
+    paramètres et leur empreinte (FrozenSettings.content_hash), graine,
+    dernier jour, population maximale, taille et date de modification du
+    fichier et date de création. Les paramètres sont validés par Settings :
+    une sauvegarde invalide lève TypeError ou ValueError. La date de
+    modification du dossier à la dernière mise à jour (directory_mtime)
+    permet de ne parcourir le dossier que s'il a changé depuis.
+    """
+
+    def __init__(self, directory: str = SAVE_DIRECTORY):
+        self.__directory = directory
+        self.__path = os.path.join(directory, CATALOG_FILE)
+        self.__is_new = not os.path.exists(self.__path)
+
+        with closing(self.__connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS saves ("
+                "unique_id TEXT PRIMARY KEY, format TEXT NOT NULL, "
+                "path TEXT NOT NULL, settings TEXT NOT NULL, "
+                "settings_hash TEXT NOT NULL, seed INTEGER, final_day INTEGER, "
+                "peak_population INTEGER, size INTEGER, modified REAL, "
+                "created REAL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS state (name TEXT PRIMARY KEY, value)"
+            )
+            columns = {
+                row["name"] for row in connection.execute("PRAGMA table_info(saves)")
+            }
+            if "modified" not in columns:  # Index créé avant la colonne
+                connection.execute("ALTER TABLE saves ADD COLUMN modified REAL")
+            for column in ("settings_hash", "seed", "final_day", "created"):
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS saves_{column} ON saves ({column})"
+                )
+
+    def __connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.__path, timeout=10)
+        connection.row_factory = sqlite3.Row
+        # Le journal est gardé entre deux écritures : écrire dans l'index ne
+        # crée ni ne supprime de fichier, et ne change donc pas la date de
+        # modification du dossier (voir directory_mtime)
+        connection.execute("PRAGMA journal_mode = PERSIST")
+        return connection
+
+    @property
+    def directory(self) -> str:
+        """
+        Dossier des sauvegardes indexées
+        """
+        return self.__directory
+
+    @property
+    def is_new(self) -> bool:
+        """
+        Si l'index vient d'être créé et ne contient pas encore les
+        sauvegardes déjà présentes dans le dossier
+        """
+        return self.__is_new
+
+    @property
+    def directory_mtime(self) -> int:
+        """
+        Date de modification du dossier (en nanosecondes) lors de la dernière
+        mise à jour de l'index avec son contenu, ou None
+        """
+        with closing(self.__connect()) as connection:
+            row = connection.execute(
+                "SELECT value FROM state WHERE name = 'directory_mtime'"
+            ).fetchone()
+        return row["value"] if row else None
+
+    @directory_mtime.setter
+    def directory_mtime(self, value: int):
+        if value is not None and not isinstance(value, int):
+            raise TypeError("The directory modification time must be an integer")
+        with closing(self.__connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO state (name, value) "
+                "VALUES ('directory_mtime', ?)",
+                (value,),
+            )
+
+    def add(
+        self,
+        unique_id: str,
+        file_format: str,
+        file_path: str,
+        settings: dict,
+        final_day: int,
+        peak_population: int,
+        created: float = None,
+    ):
+        """
+        Ajoute (ou remplace) une sauvegarde dans l'index. `created` vaut par
+        défaut l'heure actuelle.
+        """
+        with closing(self.__connect()) as connection, connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO saves ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(COLUMNS))})",
+                (
+                    unique_id,
+                    file_format,
+                    file_path,
+                    json.dumps(settings),
+                    Settings(**settings).freeze().content_hash,
+                    settings["simulation_seed"],
+                    final_day,
+                    peak_population,
+                    os.path.getsize(file_path),
+                    os.path.getmtime(file_path),
+                    created if created is not None else time.time(),
+                ),
+            )
+
+    def remove(self, unique_id: str):
+        """
+        Retire une sauvegarde de l'index
+        """
+        with closing(self.__connect()) as connection, connection:
+            connection.execute("DELETE FROM saves WHERE unique_id = ?", (unique_id,))
+
+    def get(self, unique_id: str) -> dict:
+        """
+        Ligne d'une sauvegarde, ou None si elle n'est pas indexée
+        """
+        with closing(self.__connect()) as connection:
+            row = connection.execute(
+                "SELECT * FROM saves WHERE unique_id = ?", (unique_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def list(
+        self,
+        order_by: str = "created",
+        descending: bool = False,
+        seed: int = None,
+        settings_hash: str = None,
+        file_format: str = None,
+        min_day: int = None,
+    ) -> List[dict]:
+        """
+        Lignes des sauvegardes, triées par `order_by` et filtrées par graine,
+        empreinte des paramètres, format ou dernier jour minimal
+        """
+        if order_by not in COLUMNS:
+            raise ValueError(
+                f"Cannot sort saves by {order_by!r}, "
+                f"expected one of {', '.join(COLUMNS)}"
+            )
+
+        filters = {
+            "seed = ?": seed,
+            "settings_hash = ?": settings_hash,
+            "format = ?": file_format,
+            "final_day >= ?": min_day,
+        }
+        conditions = [
+            condition for condition, value in filters.items() if value is not None
+        ]
+        query = "SELECT * FROM saves"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}, unique_id"
+
+        with closing(self.__connect()) as connection:
+            rows = connection.execute(
+                query, [value for value in filters.values() if value is not None]
+            ).fetchall()
+        return [dict(row) for row in rows]
@@ -0,0 +1,88 @@
+"""
+Ce module contient les fonctions et la classe du graphique de l'historique
+"""
+
+from rich.panel import Panel
+from rich.table import Table
+
+from src.classes.history import History
+
+BLOCKS = "▁▂▃▄▅▆▇█"
+STYLES = {
+    "ants": "bold green",
+    "eggs": "bold yellow",
+    "workers": "bold cyan",
+    "food": "bold magenta",
+}
+
+
+def sparkline(values, low: float, high: float) -> str:
+    """
+    Courbe d'une liste de valeurs, un caractère par valeur, entre `low` et
+    `high`
+    """
+    if high <= low:
+        return BLOCKS[0] * len(values)
+    scale = (len(BLOCKS) - 1) / (high - low)
+    return "".join(BLOCKS[round((value - low) * scale)] for value in values)
+
+
+def create_chart(history: History) -> Panel:
+    """
+    Crée le panneau de l'historique : une courbe par métrique (maximum de
+    chaque colonne), avec la dernière valeur et le maximum atteint
+    """
+    buckets = history.buckets()
+    table = Table.grid(padding=(0, 1))
+    table.add_column(style="bold blue")
+    table.add_column(no_wrap=True)
+    table.add_column(justify="right", style="yellow")
+
+    for name, column in buckets["metrics"].items():
+        if column["last"] is None:
+            continue
+        low, high = min(column["min"]), max(column["max"])
+        table.add_row(
+            name.title(),
+            f"[{STYLES.get(name, 'white')}]"
+            f"{sparkline(column['max'], low, high)}[/]",
+            f"{round(column['last'], 2)} (max {round(high, 2)})",
+        )
+
+    return Panel(
+        table,
+        safe_box=True,
+        border_style="blue",
+        title="History",
+        title_align="left",
+        subtitle=f"{buckets['days']} days, {buckets['column_days']} per column",
+        subtitle_align="right",
+        expand=False,
+    )
+
+
+class HistoryChart:
+    """
+    Classe représentant le graphique d'un historique dans un affichage
+    persistant : il est redessiné depuis l'historique à chaque affichage, et
+    seulement si un jour a été enregistré depuis le dernier
+    """
+
+    def __init__(self, history: History):
+        self.__history = history
+        self.__days = None
+        self.__panel = None
+
+    @property
+    def history(self) -> History:
+        """
+        Historique affiché
+        """
+        return self.__history
+
+    def __rich__(self) -> Panel:
+        days = len(self.__history)
+        if days != self.__days:
+            self.__panel = create_chart(self.__history)
+            self.__days = days
+        return self.__panel
@@ -0,0 +1,147 @@
+"""
+Ce module contient la classe CheckpointChain, qui enregistre l'état d'une
+colonie Colony jour après jour sous forme de checkpoints complets espacés et
+de deltas entre eux : un delta ne contient que les fourmis nées et mortes,
+son coût dépend du nombre d'évènements et non de la taille de la colonie.
+
+Format JSON Lines :
+    ligne 1 : en-tête (paramètres, nombre d'entrées entre deux checkpoints)
+    puis une ligne par entrée : {"kind": "full" ou "delta", "day": ..., ...}
+"""
+
+import json
+from typing import Iterator, List, Tuple
+
+from src.classes.settings import Settings
+from src.classes.colony import Colony
+from src.utils.compression import open_file
+
+FULL_EVERY = 100
+
+
+class CheckpointChain:
+    """
+    Classe représentant l'enregistreur d'une chaîne de checkpoints.
+
+    Chaque appel à record ajoute une entrée : un checkpoint complet toutes les
+    `full_every` entrées, un delta depuis l'entrée précédente sinon. N'importe
+    quel jour enregistré est restauré en appliquant les deltas au checkpoint
+    complet qui le précède (voir restore_colony).
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        settings: Settings,
+        full_every: int = FULL_EVERY,
+        compression: str = None,
+        level: int = None,
+    ):
+        if full_every < 1:
+            raise ValueError("A full checkpoint must be written at least every entry")
+
+        self.__file_path = file_path
+        self.__full_every = full_every
+        self.__since_full = None
+        self.__recorded = 0
+
+        self.__encoder = json.JSONEncoder()
+        self.__file = open_file(file_path, "w", compression, level)
+        self.__file.write(
+            self.__encoder.encode(
+                {"settings": settings.to_dict(), "full_every": full_every}
+            )
+            + "\n"
+        )
+        self.__file.flush()
+
+    @property
+    def file_path(self) -> str:
+        """
+        Fichier de la chaîne
+        """
+        return self.__file_path
+
+    def __len__(self) -> int:
+        return self.__recorded
+
+    def record(self, colony: Colony) -> str:
+        """
+        Ajoute l'état du jour courant de la colonie. Renvoie le type de
+        l'entrée écrite ("full" ou "delta").
+        """
+        if self.__since_full is None or self.__since_full >= self.__full_every:
+            entry = {"kind": "full", **colony.checkpoint()}
+            colony.start_journal()
+            self.__since_full = 1
+        else:
+            entry = {"kind": "delta", **colony.checkpoint_delta()}
+            self.__since_full += 1
+
+        self.__file.write(self.__encoder.encode(entry) + "\n")
+        self.__file.flush()
+        self.__recorded += 1
+        return entry["kind"]
+
+    def close(self):
+        """
+        Ferme le fichier
+        """
+        if not self.__file.closed:
+            self.__file.close()
+
+
+def read_chain_header(file_path: str) -> dict:
+    """
+    Lit uniquement l'en-tête d'une chaîne de checkpoints
+    """
+    with open_file(file_path) as file:
+        return json.loads(file.readline())
+
+
+def iter_chain(file_path: str) -> Iterator[Tuple[str, dict]]:
+    """
+    Génère les entrées d'une chaîne de checkpoints sous forme de couples
+    (type, entrée), dans l'ordre où elles ont été écrites
+    """
+    with open_file(file_path) as file:
+        file.readline()
+        for line in file:
+            entry = json.loads(line)
+            yield entry.pop("kind"), entry
+
+
+def chain_days(file_path: str) -> List[int]:
+    """
+    Jours enregistrés dans une chaîne de checkpoints
+    """
+    return [entry["day"] for _, entry in iter_chain(file_path)]
+
+
+def restore_checkpoint(file_path: str, day: int) -> dict:
+    """
+    Checkpoint du jour `day`, obtenu à partir du checkpoint complet qui le
+    précède et des deltas suivants
+    """
+    full, deltas = None, []
+    for kind, entry in iter_chain(file_path):
+        if entry["day"] > day:
+            break
+        if kind == "full":
+            full, deltas = entry, []
+        else:
+            deltas.append(entry)
+
+    if full is None or (deltas[-1] if deltas else full)["day"] != day:
+        raise ValueError(f"Day {day} is not recorded in the checkpoint chain")
+    return Colony.apply_deltas(full, deltas)
+
+
+def restore_colony(file_path: str, day: int, debug: bool = False) -> Colony:
+    """
+    Recrée la colonie du jour `day` d'une chaîne de checkpoints
+    """
+    settings = Settings(**read_chain_header(file_path)["settings"])
+    return Colony.from_checkpoint(
+        settings, restore_checkpoint(file_path, day), debug=debug
+    )
@@ -0,0 +1,121 @@
+"""
+Ce module contient les fonctions pour écrire et lire les sauvegardes en
+colonnes : un petit en-tête JSON (paramètres et scalaires) suivi des colonnes
+des fourmis et des oeufs sous forme de tableaux binaires bruts.
+
+Disposition du fichier :
+    MAGIC | taille de l'en-tête (uint64) | en-tête JSON | tableaux
+Chaque tableau commence sur un multiple de ALIGNMENT octets, ce qui permet de
+le lire directement depuis un fichier projeté en mémoire, sans copie. Un
+fichier compressé est décompressé en mémoire à la lecture.
+"""
+
+import json
+import struct
+
+import numpy as np
+
+from src.classes.settings import Settings
+from src.utils.compression import open_file, detect_compression
+
+MAGIC = b"ANTCOL01"
+ALIGNMENT = 64
+GROUPS = ("ants", "eggs")
+
+
+def __padding(position: int) -> int:
+    """
+    Nombre d'octets à ajouter pour atteindre le prochain multiple de ALIGNMENT
+    """
+    return -position % ALIGNMENT
+
+
+def write_columnar(
+    file_path: str,
+    settings: Settings,
+    columns: dict,
+    compression: str = None,
+    level: int = None,
+):
+    """
+    Ecrit une sauvegarde en colonnes à partir de `columns`, le résultat de
+    to_columns d'une colonie, éventuellement compressée
+    """
+    arrays = []
+    descriptors = []
+    offset = 0
+    for group in GROUPS:
+        for name, column in columns[group].items():
+            column = np.ascontiguousarray(column)
+            column = column.astype(column.dtype.newbyteorder("<"), copy=False)
+            descriptors.append(
+                {
+                    "group": group,
+                    "name": name,
+                    "dtype": column.dtype.str,
+                    "length": len(column),
+                    "offset": offset,
+                }
+            )
+            arrays.append(column)
+            offset += column.nbytes + __padding(column.nbytes)
+
+    header = json.dumps(
+        {
+            "settings": settings.to_dict(),
+            "colony": {
+                key: value for key, value in columns.items() if key not in GROUPS
+            },
+            "arrays": descriptors,
+        }
+    ).encode("utf8")
+
+    with open_file(file_path, "wb", compression, level) as file:
+        file.write(MAGIC)
+        file.write(struct.pack("<Q", len(header)))
+        file.write(header)
+        file.write(bytes(__padding(len(MAGIC) + 8 + len(header))))
+        for column in arrays:
+            file.write(memoryview(column).cast("B"))
+            file.write(bytes(__padding(column.nbytes)))
+
+
+def read_columnar_header(file_path: str) -> dict:
+    """
+    Lit uniquement l'en-tête d'une sauvegarde en colonnes
+    """
+    with open_file(file_path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError("The file is not a columnar save file")
+        (length,) = struct.unpack("<Q", file.read(8))
+        header = json.loads(file.read(length).decode("utf8"))
+
+    start = len(MAGIC) + 8 + length
+    header["data_offset"] = start + __padding(start)
+    return header
+
+
+def read_columnar(file_path: str) -> dict:
+    """
+    Lit une sauvegarde en colonnes. Les colonnes sont des vues en lecture
+    seule sur le fichier projeté en mémoire : rien n'est copié ni lu avant
+    d'être utilisé. Un fichier compressé est d'abord décompressé en mémoire.
+    """
+    header = read_columnar_header(file_path)
+    if detect_compression(file_path):
+        with open_file(file_path, "rb") as file:
+            buffer = np.frombuffer(file.read(), dtype=np.uint8)
+    else:
+        buffer = np.memmap(file_path, dtype=np.uint8, mode="r")
+
+    colony = dict(header["colony"])
+    for group in GROUPS:
+        colony[group] = {}
+    for descriptor in header["arrays"]:
+        dtype = np.dtype(descriptor["dtype"])
+        start = header["data_offset"] + descriptor["offset"]
+        colony[descriptor["group"]][descriptor["name"]] = buffer[
+            start : start + descriptor["length"] * dtype.itemsize
+        ].view(dtype)
+
+    return {"settings": header["settings"], "colony": colony}
@@ -0,0 +1,83 @@
+"""
+Ce module contient les fonctions pour ouvrir les fichiers de sauvegarde,
+compressés ou non. En lecture, la compression est détectée à partir des
+premiers octets du fichier : le nom du fichier n'a pas d'importance.
+"""
+
+import bz2
+import gzip
+import lzma
+
+COMPRESSIONS = {
+    "gzip": {"open": gzip.open, "magic": b"\x1f\x8b", "suffix": ".gz"},
+    "bz2": {"open": bz2.open, "magic": b"BZh", "suffix": ".bz2"},
+    "lzma": {"open": lzma.open, "magic": b"\xfd7zXZ\x00", "suffix": ".xz"},
+}
+LEVELS = {"gzip": (0, 9), "bz2": (1, 9), "lzma": (0, 9)}
+DEFAULT_LEVELS = {"gzip": 6, "bz2": 9, "lzma": 6}
+
+
+def __validate_compression(compression: str, level: int = None):
+    """
+    Vérifie le nom de la compression et son niveau
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Unknown compression {compression!r}, "
+            f"expected one of {', '.join(COMPRESSIONS)}"
+        )
+    min_level, max_level = LEVELS[compression]
+    if level is not None and not min_level <= level <= max_level:
+        raise ValueError(
+            f"Invalid {compression} level {level}: "
+            f"expected a value between {min_level} and {max_level}"
+        )
+
+
+def compression_suffix(compression: str = None) -> str:
+    """
+    Suffixe ajouté au nom d'un fichier compressé
+    """
+    if compression is None:
+        return ""
+    __validate_compression(compression)
+    return COMPRESSIONS[compression]["suffix"]
+
+
+def detect_compression(file_path: str) -> str:
+    """
+    Compression d'un fichier d'après ses premiers octets, ou None s'il n'est
+    pas compressé
+    """
+    with open(file_path, "rb") as file:
+        start = file.read(max(len(codec["magic"]) for codec in COMPRESSIONS.values()))
+    for compression, codec in COMPRESSIONS.items():
+        if start.startswith(codec["magic"]):
+            return compression
+    return None
+
+
+def open_file(
+    file_path: str, mode: str = "r", compression: str = None, level: int = None
+):
+    """
+    Ouvre un fichier de sauvegarde en texte ("r", "w", "a") ou en binaire
+    ("rb", "wb", "ab"). En écriture, le fichier est compressé avec `compression` au
+    niveau `level` ; en lecture, la compression est détectée.
+    """
+    binary = "b" in mode
+    if "r" in mode:
+        compression = detect_compression(file_path)
+        level = None
+
+    if compression is None:
+        return open(file_path, mode, encoding=None if binary else "utf8")
+
+    __validate_compression(compression, level)
+    level = DEFAULT_LEVELS[compression] if level is None else level
+    options = {} if binary else {"encoding": "utf8"}
+    if "r" not in mode:
+        options["preset" if compression == "lzma" else "compresslevel"] = level
+    return COMPRESSIONS[compression]["open"](
+        file_path, mode if binary else mode.replace("t", "") + "t", **options
+    )
@@ -0,0 +1,399 @@
+"""
+Ce module contient la classe SimulationDriver, qui fait évoluer une colonie
+dans une boucle asyncio et peut être contrôlée pendant la simulation (pause,
+reprise, pas à pas, vitesse, arrêt) depuis le clavier ou un socket local.
+
+Commandes (une par ligne) :
+    pause (p), resume (r), step [jours] (s), speed <secondes>, stop (q),
+    ff <x10 | x100 | adaptive | queen-death | extinction | population N | off>,
+    status
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from typing import Callable, Iterable
+
+from src.utils.headless import is_running
+from src.utils.runner import take_counters
+from src.utils.fast_forward import FastForward, run_batch
+
+BATCH_DAYS = 64
+SLICE_SECONDS = 0.01
+CONTROL_HOST = "127.0.0.1"
+CONTROL_PORT = 8765
+SHORTCUTS = {"p": "pause", "r": "resume", "s": "step", "q": "stop"}
+
+
+class SimulationDriver:
+    """
+    Classe représentant le pilote asyncio d'une simulation.
+
+    Les jours sont simulés par tranches de `batch_days` jours et d'environ
+    `slice_seconds` secondes au plus (au moins un jour), puis la main est
+    rendue à la boucle asyncio : les commandes et les entrées / sorties sont
+    traitées entre deux tranches, quelle que soit la taille de la colonie.
+    Un lot d'avance rapide est découpé de la même façon. Avec `day_delay`
+    secondes entre deux jours (par défaut simulation_speed), un seul jour
+    est simulé par lot. Les fonctions `on_day` sont appelées avec la colonie après chaque
+    jour. En avance rapide (FastForward), la taille des lots et l'attente
+    entre deux lots sont choisies par le mode d'avance rapide.
+    """
+
+    def __init__(
+        self,
+        colony,
+        day_delay: float = None,
+        max_days: int = None,
+        batch_days: int = BATCH_DAYS,
+        on_day: Iterable[Callable] = (),
+        slice_seconds: float = SLICE_SECONDS,
+    ):
+        if batch_days < 1:
+            raise ValueError("A batch must contain at least one day")
+        if slice_seconds <= 0:
+            raise ValueError("A slice must last a positive number of seconds")
+
+        self.__colony = colony
+        self.__max_days = max_days
+        self.__batch_days = batch_days
+        self.__slice_seconds = slice_seconds
+        self.__on_day = list(on_day)
+        self.__wake = asyncio.Event()
+        self.__day_delay = None
+        self.day_delay = (
+            colony.settings.simulation_speed if day_delay is None else day_delay
+        )
+
+        self.__paused = False
+        self.__steps = 0
+        self.__stopped = False
+        self.__fast_forward = None
+        self.__batch_left = 0
+        self.__batch_seconds = 0.0
+        self.__last_event = None
+        self.__counters = take_counters(colony)
+
+    @property
+    def colony(self):
+        """
+        Colonie simulée
+        """
+        return self.__colony
+
+    @property
+    def counters(self) -> dict:
+        """
+        Compteurs du dernier jour simulé
+        """
+        return self.__counters
+
+    @property
+    def day_delay(self) -> float:
+        """
+        Secondes entre deux jours, 0 pour aller le plus vite possible
+        """
+        return self.__day_delay
+
+    @day_delay.setter
+    def day_delay(self, value: float):
+        """
+        Modifie le délai entre deux jours, pris en compte immédiatement
+        """
+        if value < 0:
+            raise ValueError("The delay between two days cannot be negative")
+        self.__day_delay = float(value)
+        self.__wake.set()
+
+    @property
+    def fast_forward(self) -> FastForward:
+        """
+        Mode d'avance rapide en cours, ou None
+        """
+        return self.__fast_forward
+
+    @fast_forward.setter
+    def fast_forward(self, value: FastForward):
+        """
+        Change le mode d'avance rapide, pris en compte immédiatement
+        """
+        self.__fast_forward = value
+        self.__batch_left = 0
+        self.__wake.set()
+
+    @property
+    def last_event(self) -> str:
+        """
+        Dernier évènement qui a arrêté une avance rapide, ou None
+        """
+        return self.__last_event
+
+    @property
+    def paused(self) -> bool:
+        """
+        Si la simulation est en pause
+        """
+        return self.__paused
+
+    @property
+    def finished(self) -> bool:
+        """
+        Si la simulation est terminée (arrêtée, éteinte ou à max_days)
+        """
+        return (
+            self.__stopped
+            or not is_running(self.__colony)
+            or (self.__max_days is not None and self.__colony.day >= self.__max_days)
+        )
+
+    def pause(self):
+        """
+        Met la simulation en pause après le lot en cours
+        """
+        self.__paused = True
+        self.__wake.set()
+
+    def resume(self):
+        """
+        Reprend la simulation
+        """
+        self.__paused = False
+        self.__steps = 0
+        self.__wake.set()
+
+    def step(self, days: int = 1):
+        """
+        Met la simulation en pause et fait évoluer `days` jours
+        """
+        if days < 1:
+            raise ValueError("A step must contain at least one day")
+        self.__paused = True
+        self.__steps += days
+        self.__wake.set()
+
+    def stop(self):
+        """
+        Arrête la simulation après le lot en cours
+        """
+        self.__stopped = True
+        self.__wake.set()
+
+    def handle(self, command: str) -> str:
+        """
+        Exécute une commande textuelle et renvoie la réponse à afficher
+        """
+        words = command.strip().lower().split()
+        if not words:
+            return self.status()
+        name, arguments = SHORTCUTS.get(words[0], words[0]), words[1:]
+
+        try:
+            if name == "pause":
+                self.pause()
+            elif name == "resume":
+                self.resume()
+            elif name == "step":
+                self.step(int(arguments[0]) if arguments else 1)
+            elif name == "speed":
+                self.day_delay = float(arguments[0])
+            elif name == "stop":
+                self.stop()
+            elif name == "ff":
+                self.fast_forward = (
+                    None
+                    if arguments[0] == "off"
+                    else FastForward.parse(" ".join(arguments))
+                )
+            elif name != "status":
+                raise ValueError(f"Unknown command {words[0]!r}")
+        except IndexError:
+            return f"error: {name} needs a value"
+        except ValueError as error:
+            return f"error: {error}"
+        return self.status()
+
+    def status(self) -> str:
+        """
+        Etat de la simulation en une ligne
+        """
+        counters = self.__counters
+        state = (
+            "finished" if self.finished else "paused" if self.__paused else "running"
+        )
+        playback = f", {self.__fast_forward.describe()}" if self.__fast_forward else ""
+        return (
+            f"{state} day {counters['day']}: {counters['ants']} ants, "
+            f"{counters['eggs']} eggs, {round(counters['food'], 2)} food, "
+            f"delay {self.__day_delay}s{playback}"
+        )
+
+    async def __wait(self, timeout: float = None):
+        """
+        Attend une commande, ou au plus `timeout` secondes
+        """
+        try:
+            await asyncio.wait_for(self.__wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self.__wake.clear()
+
+    def __run_slice(self, days: int) -> int:
+        """
+        Fait évoluer au plus `days` jours, en s'arrêtant après
+        `slice_seconds` secondes. Renvoie le nombre de jours simulés.
+        """
+        start = time.perf_counter()
+        done = 0
+        while done < days and not self.finished:
+            self.__colony.evolve()
+            for callback in self.__on_day:
+                callback(self.__colony)
+            done += 1
+            if time.perf_counter() - start >= self.__slice_seconds:
+                break
+        return done
+
+    def __run_fast_forward_slice(self, fast_forward: FastForward) -> float:
+        """
+        Simule une tranche du lot d'avance rapide en cours (ou d'un nouveau
+        lot). Renvoie l'attente avant la tranche suivante : aucune tant que
+        le lot n'est pas terminé.
+        """
+        if not self.__batch_left:
+            self.__batch_left = fast_forward.batch_days()
+            self.__batch_seconds = 0.0
+        start_day, start = self.__colony.day, time.perf_counter()
+        reached = run_batch(
+            self.__colony,
+            fast_forward,
+            self.__on_day,
+            self.__max_days,
+            self.__batch_left,
+            self.__slice_seconds,
+        )
+        self.__batch_seconds += time.perf_counter() - start
+        self.__batch_left -= self.__colony.day - start_day
+        if reached:
+            self.__last_event = fast_forward.describe()
+            self.__batch_left = 0
+            if self.__fast_forward is fast_forward:
+                self.__fast_forward = None
+        if self.__batch_left > 0 and not self.finished:
+            return 0.0
+        self.__batch_left = 0
+        return fast_forward.delay(self.__day_delay, self.__batch_seconds)
+
+    async def run(self):
+        """
+        Fait évoluer la colonie jusqu'à la fin de la simulation
+        """
+        self.__wake.clear()
+        while not self.finished:
+            if self.__paused and not self.__steps:
+                await self.__wait()
+                continue
+
+            fast_forward = None if self.__paused else self.__fast_forward
+            if fast_forward:
+                delay = self.__run_fast_forward_slice(fast_forward)
+            else:
+                if self.__paused:
+                    days = min(self.__steps, self.__batch_days)
+                else:
+                    days = 1 if self.__day_delay else self.__batch_days
+                done = self.__run_slice(days)
+                if self.__paused:
+                    self.__steps -= done
+                delay = 0.0 if self.__paused else self.__day_delay
+            self.__counters = take_counters(self.__colony)
+
+            if delay:
+                await self.__wait(delay)
+            else:
+                await asyncio.sleep(0)
+        return self.__colony
+
+
+async def read_keyboard(driver: SimulationDriver, output=print):
+    """
+    Lit les commandes tapées au clavier (une par ligne) et affiche les réponses.
+    L'entrée standard est lue par un thread à part, qui ne bloque ni la boucle
+    asyncio ni la fin du programme.
+    """
+    loop = asyncio.get_running_loop()
+    lines = asyncio.Queue()
+
+    def read_lines():
+        try:
+            for line in sys.stdin:
+                loop.call_soon_threadsafe(lines.put_nowait, line)
+            loop.call_soon_threadsafe(lines.put_nowait, None)
+        except RuntimeError:  # La boucle asyncio est déjà fermée
+            pass
+
+    threading.Thread(target=read_lines, name="keyboard", daemon=True).start()
+    while not driver.finished:
+        line = await lines.get()
+        if line is None:
+            return
+        output(driver.handle(line))
+
+
+async def serve_control(
+    driver: SimulationDriver, host: str = CONTROL_HOST, port: int = CONTROL_PORT
+) -> asyncio.AbstractServer:
+    """
+    Ouvre un socket local qui accepte les commandes (une par ligne) et répond
+    par une ligne
+    """
+
+    async def handle_client(reader, writer):
+        try:
+            while not reader.at_eof():
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write((driver.handle(line.decode("utf8")) + "\n").encode())
+                await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle_client, host, port)
+
+
+async def drive(
+    driver: SimulationDriver,
+    port: int = None,
+    keyboard: bool = True,
+    report=None,
+    report_every: float = 1.0,
+):
+    """
+    Lance la simulation avec ses sources de commandes (clavier, socket local
+    si `port` est donné) et appelle `report(status)` toutes les
+    `report_every` secondes. Renvoie la colonie à la fin de la simulation.
+    """
+    tasks = []
+    server = await serve_control(driver, port=port) if port is not None else None
+    if keyboard:
+        tasks.append(asyncio.create_task(read_keyboard(driver)))
+
+    async def report_status():
+        while True:
+            await asyncio.sleep(report_every)
+            report(driver.status())
+
+    if report:
+        tasks.append(asyncio.create_task(report_status()))
+
+    try:
+        return await driver.run()
+    finally:
+        for task in tasks:
+            task.cancel()
+        if server:
+            server.close()
+            await server.wait_closed()
+        if report:
+            report(driver.status())
@@ -0,0 +1,137 @@
+"""
+Ce module contient les fonctions pour lancer plusieurs simulations (une par
+graine) en parallèle et agréger leurs résultats
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator, Tuple
+
+import numpy as np
+
+from src.classes.settings import FrozenSettings, Settings
+from src.classes.time_series import TimeSeries
+from src.utils.headless import simulate
+
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# Paramètres communs à toutes les simulations d'un processus du pool, envoyés
+# une seule fois à son démarrage plutôt qu'avec chaque simulation.
+__worker_settings = None
+
+
+def __init_worker(settings: bytes):
+    """
+    Initialise un processus du pool avec les paramètres de l'ensemble
+    """
+    global __worker_settings
+    __worker_settings = FrozenSettings.from_bytes(settings)
+
+
+def __run_replicate(
+    settings: FrozenSettings, seed: int, max_days: int, engine: str
+) -> Tuple[int, TimeSeries]:
+    """
+    Lance une simulation pour une graine. Les paramètres ont déjà été validés :
+    seule la graine change, sans nouvelle validation.
+    """
+    replicate = settings._replace(simulation_seed=seed)
+    return seed, simulate(replicate, max_days, engine)
+
+
+def __run_in_worker(seed: int, max_days: int, engine: str) -> Tuple[int, TimeSeries]:
+    """
+    Lance une simulation pour une graine. Exécutée dans un processus du pool.
+    """
+    return __run_replicate(__worker_settings, seed, max_days, engine)
+
+
+def iter_ensemble(
+    settings: Settings,
+    seeds: Iterable[int],
+    max_days: int,
+    engine: str = "object",
+    workers: int = None,
+) -> Iterator[Tuple[int, TimeSeries]]:
+    """
+    Lance une simulation par graine sur un pool de processus et renvoie les
+    couples (graine, série) au fur et à mesure que les simulations se terminent
+    """
+    frozen = settings.freeze()
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        for seed in seeds:
+            yield __run_replicate(frozen, seed, max_days, engine)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=__init_worker,
+        initargs=(frozen.to_bytes(),),
+    ) as executor:
+        futures = [
+            executor.submit(__run_in_worker, seed, max_days, engine) for seed in seeds
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def __pad(column, max_days: int) -> np.ndarray:
+    """
+    Prolonge une colonne jusqu'à max_days avec sa dernière valeur : une
+    colonie éteinte garde sa population (nulle) et sa nourriture
+    """
+    values = np.asarray(column, dtype=float)
+    padded = np.empty(max_days)
+    padded[: len(values)] = values
+    padded[len(values) :] = values[-1] if len(values) else 0.0
+    return padded
+
+
+def __summarize(matrix: np.ndarray, quantiles: Tuple[float]) -> dict:
+    """
+    Moyenne, variance et quantiles jour par jour d'une matrice (runs x jours)
+    """
+    return {
+        "mean": matrix.mean(axis=0),
+        "variance": matrix.var(axis=0, ddof=1 if len(matrix) > 1 else 0),
+        "quantiles": dict(zip(quantiles, np.quantile(matrix, quantiles, axis=0))),
+    }
+
+
+def run_ensemble(
+    settings: Settings,
+    runs: int,
+    max_days: int,
+    engine: str = "object",
+    workers: int = None,
+    quantiles: Tuple[float] = QUANTILES,
+    on_result=None,
+) -> dict:
+    """
+    Lance `runs` simulations avec les graines simulation_seed,
+    simulation_seed + 1, ... et agrège jour par jour la population et la
+    nourriture. `on_result(seed, series)` est appelé à chaque simulation terminée.
+    """
+    if max_days is None or max_days <= 0:
+        raise ValueError("An ensemble needs a positive max_days horizon")
+
+    seeds = range(settings.simulation_seed, settings.simulation_seed + runs)
+    population = np.empty((runs, max_days))
+    food = np.empty((runs, max_days))
+
+    for row, (seed, series) in enumerate(
+        iter_ensemble(settings, seeds, max_days, engine, workers)
+    ):
+        population[row] = __pad(series.ants, max_days)
+        food[row] = __pad(series.food, max_days)
+        if on_result:
+            on_result(seed, series)
+
+    return {
+        "days": np.arange(1, max_days + 1),
+        "runs": runs,
+        "ants": __summarize(population, quantiles),
+        "food": __summarize(food, quantiles),
+    }
@@ -0,0 +1,182 @@
+"""
+Ce module contient la classe FastForward, qui décide combien de jours simuler
+entre deux images de l'affichage : un nombre fixe (x10, x100), un nombre
+adapté au coût mesuré d'un jour pour tenir une fréquence d'images, ou le plus
+vite possible jusqu'à un évènement (mort de la reine, extinction, seuil de
+population).
+"""
+
+import time
+
+from src.utils.headless import is_running
+
+TARGET_FPS = 10.0
+MAX_SKIP = 10_000
+EVENTS = ("queen-death", "extinction", "population")
+
+
+class FastForward:
+    """
+    Classe représentant un mode d'avance rapide.
+
+    Avec `skip`, chaque lot contient `skip` jours. Sans `skip`, la taille des
+    lots est adaptée pour qu'un lot dure environ 1 / `fps` secondes, d'après
+    le coût moyen d'un jour mesuré avec measure. Avec `until`, la simulation
+    avance sans délai jusqu'à l'évènement, puis l'avance rapide s'arrête.
+    """
+
+    def __init__(
+        self,
+        skip: int = None,
+        until: str = None,
+        threshold: int = None,
+        fps: float = TARGET_FPS,
+    ):
+        if skip is not None and skip < 1:
+            raise ValueError("Fast-forward must skip at least one day")
+        if until is not None and until not in EVENTS:
+            raise ValueError(
+                f"Unknown event {until!r}, expected one of {', '.join(EVENTS)}"
+            )
+        if until == "population" and threshold is None:
+            raise ValueError("The population event needs a threshold")
+        if fps <= 0:
+            raise ValueError("The target frame rate must be positive")
+
+        self.__skip = skip
+        self.__until = until
+        self.__threshold = threshold
+        self.__fps = fps
+        self.__day_cost = None
+        self.__baseline = None
+
+    @classmethod
+    def parse(cls, text: str, fps: float = TARGET_FPS) -> "FastForward":
+        """
+        Crée un mode d'avance rapide à partir de sa description : "x10",
+        "100", "adaptive", "queen-death", "extinction" ou "population 5000"
+        """
+        words = text.strip().lower().split()
+        if not words:
+            raise ValueError("Empty fast-forward mode")
+        name = words[0]
+        if name == "adaptive":
+            return cls(fps=fps)
+        if name in EVENTS:
+            threshold = int(words[1]) if len(words) > 1 else None
+            return cls(until=name, threshold=threshold, fps=fps)
+        try:
+            return cls(skip=int(name.lstrip("x")), fps=fps)
+        except ValueError:
+            raise ValueError(f"Unknown fast-forward mode {text.strip()!r}") from None
+
+    @property
+    def until(self) -> str:
+        """
+        Evènement qui arrête l'avance rapide, ou None
+        """
+        return self.__until
+
+    @property
+    def day_cost(self) -> float:
+        """
+        Coût moyen mesuré d'un jour, en secondes
+        """
+        return self.__day_cost
+
+    def describe(self) -> str:
+        """
+        Description courte du mode
+        """
+        if self.__until == "population":
+            return f"until population {self.__threshold}"
+        if self.__until:
+            return f"until {self.__until}"
+        return f"x{self.__skip}" if self.__skip else "adaptive"
+
+    def batch_days(self) -> int:
+        """
+        Nombre de jours à simuler avant la prochaine image
+        """
+        if self.__skip:
+            return self.__skip
+        if not self.__day_cost:
+            return 1
+        return max(1, min(MAX_SKIP, int(1 / (self.__fps * self.__day_cost))))
+
+    def measure(self, days: int, seconds: float):
+        """
+        Prend en compte la durée d'un lot de `days` jours (moyenne mobile)
+        """
+        if days <= 0:
+            return
+        cost = seconds / days
+        self.__day_cost = (
+            cost if self.__day_cost is None else 0.8 * self.__day_cost + 0.2 * cost
+        )
+
+    def delay(self, day_delay: float, elapsed: float) -> float:
+        """
+        Secondes à attendre après un lot qui a duré `elapsed` secondes :
+        aucune jusqu'à un évènement, le reste de l'image en mode adaptatif,
+        `day_delay` par lot avec un nombre de jours fixe
+        """
+        if self.__until:
+            return 0.0
+        if self.__skip:
+            return day_delay
+        return max(0.0, 1 / self.__fps - elapsed)
+
+    def reached(self, colony) -> bool:
+        """
+        Si l'évènement attendu vient d'arriver. Le premier appel note l'état
+        de départ de la colonie.
+        """
+        if self.__until is None:
+            return False
+
+        state = {
+            "queen-death": lambda: colony.queen.is_alive,
+            "extinction": lambda: is_running(colony),
+            "population": lambda: colony.ant_count() >= self.__threshold,
+        }[self.__until]()
+        if self.__baseline is None:
+            self.__baseline = state
+            return False
+        return state != self.__baseline
+
+
+def run_batch(
+    colony,
+    fast_forward: FastForward,
+    on_day=(),
+    max_days: int = None,
+    days: int = None,
+    max_seconds: float = None,
+) -> bool:
+    """
+    Simule un lot de jours choisi par `fast_forward` (ou de `days` jours) et
+    mesure sa durée. S'arrête avant la fin du lot si l'évènement attendu
+    arrive, si la colonie s'éteint, au jour `max_days` ou, après au moins un
+    jour, quand le lot a duré `max_seconds` secondes. Renvoie True si
+    l'évènement est arrivé.
+    """
+    fast_forward.reached(colony)
+    start = time.perf_counter()
+    planned = fast_forward.batch_days() if days is None else days
+    days = 0
+    reached = False
+    for _ in range(planned):
+        colony.evolve()
+        days += 1
+        for callback in on_day:
+            callback(colony)
+        if fast_forward.reached(colony):
+            reached = True
+            break
+        if not is_running(colony) or (max_days is not None and colony.day >= max_days):
+            break
+        if max_seconds is not None and time.perf_counter() - start >= max_seconds:
+            break
+    fast_forward.measure(days, time.perf_counter() - start)
+    return reached
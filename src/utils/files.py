@@ -7,65 +7,471 @@ import json
 import datetime
 from typing import List
 
-from src.classes.settings import SAVE_DIRECTORY
+from src.classes.settings import SAVE_DIRECTORY, Settings
+from src.classes.enums import State
 from src.classes.colony import Colony
+from src.utils.catalog import SaveCatalog
+from src.utils.columnar import write_columnar, read_columnar, read_columnar_header
+from src.utils.streaming import (
+    CHUNK_SIZE,
+    write_json,
+    write_json_lines,
+    read_json_header,
+    read_json_checkpoint,
+    read_json_lines_header,
+    iter_json_agents,
+    iter_json_lines,
+)
+from src.utils.telemetry import TelemetryRecorder, read_telemetry
+from src.utils.compression import COMPRESSIONS, compression_suffix, open_file
+from src.utils.replay import Replay
 
+SAVE_FORMATS = {"json": ".json", "jsonl": ".jsonl", "columnar": ".colony"}
+TELEMETRY_EXTENSION = ".telemetry"
+REPLAY_EXTENSION = ".replay"
 
-def __ensure_save_directory_exists():
+
+def __ensure_save_directory_exists(directory: str = SAVE_DIRECTORY):
     """
     Vérifie que le dossier de sauvegarde existe
     """
-    if not os.path.exists(SAVE_DIRECTORY):
-        os.makedirs(SAVE_DIRECTORY)
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+
+def parse_save_name(file_name: str) -> tuple:
+    """
+    Identifiant et format d'un fichier de sauvegarde d'après son nom
+    (sim_<identifiant>.<format>[.<compression>]), ou None si ce n'est pas
+    une sauvegarde
+    """
+    for codec in COMPRESSIONS.values():
+        if file_name.endswith(codec["suffix"]):
+            file_name = file_name[: -len(codec["suffix"])]
+            break
+    name, extension = os.path.splitext(file_name)
+    formats = {extension: name for name, extension in SAVE_FORMATS.items()}
+    if not name.startswith("sim_") or extension not in formats:
+        return None
+    return name.replace("sim_", "", 1), formats[extension]
+
+
+def __save_format(file_path: str) -> str:
+    """
+    Format d'un fichier de sauvegarde d'après son nom
+    """
+    return parse_save_name(os.path.basename(file_path))[1]
+
+
+def __open_catalog(directory: str = SAVE_DIRECTORY) -> SaveCatalog:
+    """
+    Ouvre l'index des sauvegardes. S'il vient d'être créé, les sauvegardes
+    déjà présentes dans le dossier y sont ajoutées.
+    """
+    __ensure_save_directory_exists(directory)
+    catalog = SaveCatalog(directory)
+    if catalog.is_new:
+        rebuild_catalog(directory)
+    return catalog
+
+
+def __synced_catalog(directory: str = SAVE_DIRECTORY) -> SaveCatalog:
+    """
+    Ouvre l'index des sauvegardes, mis à jour avec le contenu du dossier
+    seulement si le dossier a changé (fichier ajouté, supprimé ou renommé)
+    depuis la dernière mise à jour. Un fichier réécrit sur place n'est relu
+    qu'avec rebuild_catalog.
+    """
+    catalog = __open_catalog(directory)
+    if catalog.directory_mtime != os.stat(directory).st_mtime_ns:
+        rebuild_catalog(directory)
+    return catalog
+
+
+def __read_header(file_path: str) -> dict:
+    """
+    Paramètres, dernier jour et population d'un fichier de sauvegarde. Seul
+    l'en-tête est lu, sauf pour une sauvegarde JSON sans en-tête qui doit
+    être lue en entier.
+    """
+    file_format = __save_format(file_path)
+    if file_format == "columnar":
+        header = read_columnar_header(file_path)
+        colony = header["colony"]
+        ants = next(
+            array["length"]
+            for array in header["arrays"]
+            if array["group"] == "ants" and array["name"] == "age"
+        )
+    else:
+        header = __read_agents_header(file_path)
+        if header is not None:
+            colony = header["colony"]
+            ants = header["ants"]
+        else:
+            with open_file(file_path) as file:
+                header = json.load(file)
+            colony = header["colony"]
+            ants = len(colony["ants"])
+
+    return {
+        "settings": header["settings"],
+        "day": colony["day"],
+        "population": ants + int(colony["queen"]["state"] == State.ALIVE.value),
+    }
+
+
+def __peak_population(file_path: str, population: int) -> int:
+    """
+    Population maximale d'une sauvegarde, lue dans ses métriques journalières
+    si elles existent
+    """
+    unique_id, _ = parse_save_name(os.path.basename(file_path))
+    telemetry_path = os.path.join(
+        os.path.dirname(file_path), f"sim_{unique_id}{TELEMETRY_EXTENSION}"
+    )
+    if os.path.exists(telemetry_path):
+        ants = read_telemetry(telemetry_path)["ants"]
+        if len(ants):
+            return max(int(ants.max()), population)
+    return population
+
+
+def rebuild_catalog(directory: str = SAVE_DIRECTORY) -> SaveCatalog:
+    """
+    Met l'index à jour avec le contenu du dossier : retire les sauvegardes
+    dont le fichier a disparu, ajoute celles qui n'y sont pas et relit
+    celles dont le fichier a été modifié depuis leur indexation. Seuls les
+    en-têtes de ces fichiers sont lus : si rien n'a changé, il suffit de
+    lister le dossier. Les listes et les recherches de sauvegardes ne
+    l'appellent que si le dossier a changé depuis.
+    """
+    __ensure_save_directory_exists(directory)
+    catalog = SaveCatalog(directory)
+    # Date lue avant de parcourir le dossier : un changement pendant la mise
+    # à jour sera vu à la prochaine
+    directory_mtime = os.stat(directory).st_mtime_ns
+    indexed = {}
+    for row in catalog.list():
+        if os.path.exists(row["path"]):
+            indexed[row["unique_id"]] = row
+        else:
+            catalog.remove(row["unique_id"])
+
+    for file in os.listdir(directory):
+        parsed = parse_save_name(file)
+        if parsed is None:
+            continue
+        unique_id, file_format = parsed
+        file_path = f"{directory}/{file}"
+        row = indexed.get(unique_id)
+        if row is not None and (
+            row["path"] != file_path or row["modified"] == os.path.getmtime(file_path)
+        ):
+            continue  # Déjà indexée, ou un autre format porte cet identifiant
+        try:
+            header = __read_header(file_path)
+            catalog.add(
+                unique_id,
+                file_format,
+                file_path,
+                header["settings"],
+                header["day"],
+                __peak_population(file_path, header["population"]),
+                row["created"] if row is not None else os.path.getmtime(file_path),
+            )
+        except (ValueError, TypeError, KeyError, OSError):
+            continue  # Fichier illisible : il n'est pas proposé au chargement
+    catalog.directory_mtime = directory_mtime
+    return catalog
+
+
+def add_to_catalog(
+    unique_id: str,
+    file_format: str,
+    file_path: str,
+    settings: dict,
+    final_day: int,
+    peak_population: int,
+    directory: str = SAVE_DIRECTORY,
+):
+    """
+    Ajoute une sauvegarde qui vient d'être écrite à l'index de son dossier
+    """
+    __open_catalog(directory).add(
+        unique_id, file_format, file_path, settings, final_day, peak_population
+    )
+
+
+def remove_from_catalog(unique_id: str, directory: str = SAVE_DIRECTORY):
+    """
+    Retire une sauvegarde de l'index de son dossier
+    """
+    __open_catalog(directory).remove(unique_id)
 
 
-def list_save_files() -> List[str]:
+def __find_save_file(unique_id: str, directory: str = SAVE_DIRECTORY) -> str:
     """
-    Liste les fichiers de sauvegarde disponibles
+    Chemin du fichier de sauvegarde `unique_id`, quel que soit son format
     """
-    __ensure_save_directory_exists()
+    row = __synced_catalog(directory).get(unique_id)
+    if row is not None:
+        return row["path"]
+    # Fichier que l'index n'a pas pu lire : il est cherché d'après son nom
+    for extension in SAVE_FORMATS.values():
+        for compression in (None, *COMPRESSIONS):
+            file_path = (
+                f"{directory}/sim_{unique_id}{extension}"
+                f"{compression_suffix(compression)}"
+            )
+            if os.path.exists(file_path):
+                return file_path
+    raise FileNotFoundError("The file you are trying to load does not exist")
+
 
-    files = os.listdir(SAVE_DIRECTORY)
-    sim_files = [
-        file for file in files if file.endswith(".json") and file.startswith("sim_")
-    ]
+def list_save_files(directory: str = SAVE_DIRECTORY) -> List[str]:
+    """
+    Liste les fichiers de sauvegarde disponibles, du plus ancien au plus
+    récent, d'après l'index
+    """
     sim_map = {}
 
-    for index, file in enumerate(sim_files, start=1):
-        unique_id = file.replace("sim_", "").replace(".json", "")
-        sim_map[str(index)] = unique_id
+    for index, row in enumerate(__synced_catalog(directory).list(), start=1):
+        sim_map[str(index)] = row["unique_id"]
 
     return sim_map
 
 
-def load_save_file(unique_id: str) -> dict:
+def list_saves(
+    order_by: str = "created",
+    descending: bool = False,
+    directory: str = SAVE_DIRECTORY,
+    **filters,
+) -> List[dict]:
     """
-    Charge un fichier de sauvegarde
+    Lignes de l'index des sauvegardes, triées et filtrées
+    (voir SaveCatalog.list)
+    """
+    return __synced_catalog(directory).list(order_by, descending, **filters)
+
+
+def load_save_file(unique_id: str, directory: str = SAVE_DIRECTORY) -> dict:
     """
-    file_path = f"{SAVE_DIRECTORY}/sim_{unique_id}.json"
+    Charge les paramètres d'un fichier de sauvegarde. Ils sont lus dans
+    l'index, sans ouvrir le fichier.
+    """
+    row = __synced_catalog(directory).get(unique_id)
+    if row is not None:
+        return json.loads(row["settings"])
+    return __read_header(__find_save_file(unique_id, directory))["settings"]
+
+
+def __colony_from_checkpoint(data: dict) -> Colony:
+    """
+    Recrée la colonie du checkpoint d'une sauvegarde JSON déjà lue
+    """
+    if "checkpoint" not in data:
+        raise ValueError("This save file has no checkpoint to resume from")
+
+    return Colony.from_checkpoint(Settings(**data["settings"]), data["checkpoint"])
+
+
+def load_colony(
+    unique_id: str, directory: str = SAVE_DIRECTORY, chunk_size: int = CHUNK_SIZE
+) -> dict:
+    """
+    Charge la colonie d'un fichier de sauvegarde : une liste de dictionnaires
+    par agent pour les formats JSON, des colonnes projetées en mémoire pour le
+    format en colonnes. Les agents sont lus par blocs de `chunk_size` (voir
+    iter_save_agents) : seule la colonie renvoyée occupe toute la mémoire.
+    Une sauvegarde JSON sans en-tête est lue en entier.
+    """
+    file_path = __find_save_file(unique_id, directory)
+    if __save_format(file_path) == "columnar":
+        return read_columnar(file_path)["colony"]
+    header = __read_agents_header(file_path)
+    if header is None:
+        with open_file(file_path) as file:
+            return json.load(file)["colony"]
+
+    colony = header["colony"]
+    colony.update({"ants": [], "eggs": []})
+    for group, agents in __iter_agents(file_path, chunk_size):
+        colony[group].extend(agents)
+    return colony
+
+
+def __read_agents_header(file_path: str) -> dict:
+    """
+    En-tête d'une sauvegarde JSON ou JSON Lines, ou None si elle n'en a pas
+    """
+    if __save_format(file_path) == "jsonl":
+        return read_json_lines_header(file_path)
+    return read_json_header(file_path)
+
+
+def __iter_agents(file_path: str, chunk_size: int):
+    if __save_format(file_path) == "jsonl":
+        return iter_json_lines(file_path, chunk_size)
+    return iter_json_agents(file_path, chunk_size)
+
+
+def iter_save_agents(
+    unique_id: str, chunk_size: int = CHUNK_SIZE, directory: str = SAVE_DIRECTORY
+):
+    """
+    Lit les agents d'une sauvegarde JSON ou JSON Lines par blocs de
+    `chunk_size` agents, sans charger tout le fichier : génère des couples
+    (groupe, liste d'agents)
+    """
+    file_path = __find_save_file(unique_id, directory)
+    if __save_format(file_path) == "columnar":
+        raise ValueError("Only JSON and JSON Lines save files can be read in chunks")
+    return __iter_agents(file_path, chunk_size)
+
+
+def load_checkpoint(unique_id: str, directory: str = SAVE_DIRECTORY) -> Colony:
+    """
+    Recrée la colonie d'un fichier de sauvegarde, au jour où elle a été
+    sauvegardée. Les fourmis du checkpoint sont lues et recréées bloc par
+    bloc ; une sauvegarde sans en-tête est lue en entier.
+    """
+    file_path = __find_save_file(unique_id, directory)
+    if __save_format(file_path) != "json":
+        raise ValueError("Only JSON save files have a checkpoint to resume from")
+
+    header = read_json_header(file_path)
+    if header is None:
+        with open_file(file_path) as file:
+            return __colony_from_checkpoint(json.load(file))
+    return Colony.from_checkpoint(
+        Settings(**header["settings"]), read_json_checkpoint(file_path)
+    )
+
+
+def create_unique_id() -> str:
+    """
+    Crée l'identifiant d'une nouvelle sauvegarde
+    """
+    return datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+
+def create_telemetry_recorder(
+    unique_id: str, directory: str = SAVE_DIRECTORY
+) -> TelemetryRecorder:
+    """
+    Crée l'enregistreur des métriques journalières de la sauvegarde
+    `unique_id`, dont le fichier est placé à côté de la sauvegarde
+    """
+    __ensure_save_directory_exists(directory)
+    return TelemetryRecorder(f"{directory}/sim_{unique_id}{TELEMETRY_EXTENSION}")
+
+
+def load_telemetry(unique_id: str):
+    """
+    Charge les métriques journalières d'une sauvegarde
+    """
+    file_path = f"{SAVE_DIRECTORY}/sim_{unique_id}{TELEMETRY_EXTENSION}"
     if not os.path.exists(file_path):
-        raise FileNotFoundError("The file you are trying to load does not exist")
+        raise FileNotFoundError("This save file has no telemetry")
+    return read_telemetry(file_path)
+
+
+def save_replay(replay: Replay, unique_id: str, directory: str = SAVE_DIRECTORY) -> str:
+    """
+    Ecrit le replay de la sauvegarde `unique_id` à côté de la sauvegarde
+    """
+    __ensure_save_directory_exists(directory)
+    file_path = f"{directory}/sim_{unique_id}{REPLAY_EXTENSION}"
+    replay.save(file_path)
+    return file_path
+
+
+def load_replay(unique_id: str) -> Replay:
+    """
+    Charge le replay d'une sauvegarde
+    """
+    file_path = f"{SAVE_DIRECTORY}/sim_{unique_id}{REPLAY_EXTENSION}"
+    if not os.path.exists(file_path):
+        raise FileNotFoundError("This save file has no replay")
+    return Replay.load(file_path)
+
+
+def load_settings_file(file_path: str) -> Settings:
+    """
+    Charge des paramètres depuis un fichier JSON de la forme de Settings.to_dict()
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(
+            "The settings file you are trying to load does not exist"
+        )
 
     with open(file_path, "r", encoding="utf8") as file:
-        return json.load(file)["settings"]
+        return Settings(**json.load(file))
 
 
-def create_save_file(colony: Colony) -> str:
+def create_save_file(
+    colony: Colony,
+    directory: str = SAVE_DIRECTORY,
+    file_format: str = "json",
+    unique_id: str = None,
+    peak_population: int = None,
+    compression: str = None,
+    level: int = None,
+) -> str:
     """
-    Crée un fichier de sauvegarde
+    Crée un fichier de sauvegarde, en JSON (lisible et échangeable), en JSON
+    Lines (un agent par ligne, relisible par blocs) ou en colonnes (compact et
+    rapide à charger pour les grandes colonies). Les agents sont écrits au fur
+    et à mesure, sans construire la liste complète en mémoire. En JSON, une
+    colonie Colony est aussi écrite sous forme de checkpoint, à côté de la
+    colonie et lui aussi par blocs, pour pouvoir être reprise
+    (load_checkpoint). Tous les formats
+    peuvent être compressés (gzip, bz2 ou lzma) au niveau `level`.
+    La sauvegarde est ajoutée à l'index du dossier.
     """
-    __ensure_save_directory_exists()
+    if file_format not in SAVE_FORMATS:
+        raise ValueError(
+            f"Unknown save format {file_format!r}, "
+            f"expected one of {', '.join(SAVE_FORMATS)}"
+        )
 
-    unique_id = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    file_path = f"{SAVE_DIRECTORY}/sim_{unique_id}.json"
-    with open(file_path, "w", encoding="utf8") as file:
-        json.dump(
-            {
-                "settings": colony.settings.to_dict(),
-                "colony": colony.to_dict(),
-            },
-            file,
-            indent=2,
+    __ensure_save_directory_exists(directory)
+
+    unique_id = unique_id or create_unique_id()
+    file_path = (
+        f"{directory}/sim_{unique_id}{SAVE_FORMATS[file_format]}"
+        f"{compression_suffix(compression)}"
+    )
+    if file_format == "columnar":
+        write_columnar(
+            file_path, colony.settings, colony.to_columns(), compression, level
+        )
+    elif file_format == "jsonl":
+        write_json_lines(
+            file_path,
+            colony.settings,
+            colony,
+            compression=compression,
+            level=level,
+        )
+    else:
+        write_json(
+            file_path,
+            colony.settings,
+            colony,
+            compression=compression,
+            level=level,
+            checkpoint=isinstance(colony, Colony),
         )
 
+    add_to_catalog(
+        unique_id,
+        file_format,
+        file_path,
+        colony.settings.to_dict(),
+        colony.day,
+        peak_population if peak_population is not None else colony.ant_count(),
+        directory,
+    )
     return unique_id
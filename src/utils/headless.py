@@ -0,0 +1,71 @@
+"""
+Ce module contient les fonctions pour faire tourner une simulation sans affichage
+"""
+
+from src.classes.food import Food
+from src.classes.colony import Colony
+from src.classes.array_colony import ArrayColony
+from src.classes.cohort_colony import CohortColony
+from src.classes.settings import Settings
+from src.classes.time_series import TimeSeries
+
+ENGINES = {
+    "object": Colony,
+    "array": ArrayColony,
+    "cohort": CohortColony,
+}
+
+
+def create_colony(settings: Settings, engine: str = "object"):
+    """
+    Initialise la nourriture et la colonie d'une simulation. Chaque colonie
+    tire ses nombres aléatoires dans ses propres générateurs, dérivés de
+    simulation_seed.
+    """
+    if engine not in ENGINES:
+        raise ValueError(
+            f"Unknown engine {engine!r}, expected one of {', '.join(ENGINES)}"
+        )
+
+    food = Food(settings)
+    return ENGINES[engine](settings, food)
+
+
+def is_running(colony) -> bool:
+    """
+    Si la colonie contient encore des fourmis ou des oeufs
+    """
+    return bool(colony.ant_count() or colony.egg_count())
+
+
+def simulate(
+    settings: Settings,
+    max_days: int = None,
+    engine: str = "object",
+    autosaver=None,
+    replay=None,
+) -> TimeSeries:
+    """
+    Fait évoluer une colonie jusqu'à son extinction (ou jusqu'à `max_days`),
+    sans affichage ni pause, et renvoie ses métriques jour par jour.
+    Si un Autosaver est donné, il est appelé après chaque jour puis fermé.
+    Si un Replay est donné, chaque jour (y compris le jour 0) y est enregistré.
+    """
+    colony = create_colony(settings, engine)
+    series = TimeSeries()
+    if replay:
+        replay.record(colony)
+
+    try:
+        while is_running(colony) and (max_days is None or colony.day < max_days):
+            colony.evolve()
+            series.record(colony)
+            if replay:
+                replay.record(colony)
+            if autosaver:
+                autosaver.maybe_save(colony)
+    finally:
+        if autosaver:
+            autosaver.close()
+
+    return series
@@ -0,0 +1,74 @@
+"""
+Ce module contient la classe LiveMetrics, le tableau des compteurs de
+l'affichage en direct, gardé d'une image à l'autre
+"""
+
+from rich.table import Table
+from rich.text import Text
+
+from src.utils.table import create_table
+from src.utils.day_to_string import days_to_string
+
+# Lignes du tableau : libellé, clé des compteurs et mise en forme de la valeur
+LIVE_ROWS = (
+    ("Playback", "playback", str),
+    ("Total Time", "day", days_to_string),
+    ("Days", "day", str),
+    ("Eggs", "eggs", str),
+    ("Ants", "ants", str),
+    ("Workers", "workers", str),
+    ("Food", "food", lambda food: str(round(food, 2))),
+    ("Queen", "queen_alive", lambda alive: "Alive" if alive else "Deceased"),
+    ("Dead Ants", "dead_ants", str),
+)
+
+
+class LiveMetrics:
+    """
+    Classe représentant le tableau des compteurs de l'affichage en direct.
+
+    Le tableau rich est créé une seule fois, avec un texte modifiable par
+    valeur. Chaque cellule garde la valeur brute qu'elle affiche : seules les
+    cellules dont la valeur a changé sont remises en forme et leur texte
+    remplacé, le reste du tableau est gardé tel quel. update indique si
+    l'image doit être redessinée.
+    """
+
+    def __init__(self, rows=LIVE_ROWS):
+        self.__rows = tuple(rows)
+        # Une valeur que les compteurs ne peuvent pas avoir : la première
+        # mise à jour remplit toutes les cellules
+        self.__values = [object()] * len(self.__rows)
+        self.__cells = [Text() for _ in self.__rows]
+        self.__table = create_table(
+            rows=[
+                (label, cell) for (label, _, _), cell in zip(self.__rows, self.__cells)
+            ]
+        )
+
+    @property
+    def table(self) -> Table:
+        """
+        Tableau rich, le même d'une mise à jour à l'autre
+        """
+        return self.__table
+
+    def update(self, counters: dict) -> bool:
+        """
+        Met à jour les cellules à partir des compteurs. Renvoie True si une
+        cellule visible a changé.
+        """
+        changed = False
+        for index, (_, key, formatter) in enumerate(self.__rows):
+            value = counters.get(key)
+            if value == self.__values[index]:
+                continue
+            self.__values[index] = value
+            cell = formatter(value) if value is not None else ""
+            if cell != self.__cells[index].plain:
+                self.__cells[index].plain = cell
+                changed = True
+        return changed
+
+    def __rich__(self) -> Table:
+        return self.__table
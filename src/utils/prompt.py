@@ -23,7 +23,7 @@ def prompt_initial_settings(console: Console) -> Settings:
         "Simulation seed (0 for random)", default=default_settings.simulation_seed
     )
     simulation_speed = FloatPrompt.ask(
-        "Initial simulation speed (in seconds)",
+        "Initial simulation speed (in seconds, 0 for max speed)",
         default=default_settings.simulation_speed,
     )
     initial_ant_quantity = IntPrompt.ask(
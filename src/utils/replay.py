@@ -0,0 +1,168 @@
+"""
+Ce module contient la classe Replay, qui garde quelques checkpoints d'une
+simulation pour pouvoir revenir à n'importe quel jour sans tout rejouer
+depuis le jour 0.
+
+Format JSON Lines :
+    ligne 1 : en-tête (paramètres, intervalle entre deux checkpoints, dernier
+    jour enregistré)
+    puis un checkpoint par ligne
+"""
+
+import json
+from bisect import bisect_right
+from typing import Iterator, List
+
+from src.classes.settings import Settings
+from src.classes.colony import Colony
+from src.utils.compression import open_file
+
+REPLAY_EVERY = 100
+
+
+class Replay:
+    """
+    Classe représentant le replay d'une simulation.
+
+    Pendant la simulation, record garde un checkpoint tous les `every` jours
+    (les checkpoints contiennent l'état des générateurs aléatoires). Ensuite,
+    colony_at restaure le checkpoint le plus proche avant le jour demandé et
+    fait évoluer la colonie sans affichage jusqu'à ce jour : au plus
+    `every` - 1 jours sont recalculés.
+    """
+
+    def __init__(self, settings: Settings, every: int = REPLAY_EVERY):
+        if every < 1:
+            raise ValueError("Checkpoints must be at least one day apart")
+
+        self.__settings = settings
+        self.__every = every
+        self.__checkpoints = {}
+        self.__last_day = None
+
+    @property
+    def settings(self) -> Settings:
+        """
+        Paramètres de la simulation
+        """
+        return self.__settings
+
+    @property
+    def every(self) -> int:
+        """
+        Nombre de jours entre deux checkpoints
+        """
+        return self.__every
+
+    @property
+    def days(self) -> List[int]:
+        """
+        Jours des checkpoints, dans l'ordre
+        """
+        return sorted(self.__checkpoints)
+
+    @property
+    def last_day(self) -> int:
+        """
+        Dernier jour enregistré, ou None si rien n'a été enregistré
+        """
+        return self.__last_day
+
+    def record(self, colony: Colony) -> bool:
+        """
+        Enregistre le jour courant de la colonie. Renvoie True si un
+        checkpoint a été gardé.
+        """
+        if not isinstance(colony, Colony):
+            raise ValueError("Only the object engine can be replayed")
+
+        self.__last_day = colony.day
+        if self.__checkpoints and colony.day % self.__every:
+            return False
+        self.__checkpoints[colony.day] = colony.checkpoint()
+        return True
+
+    def __check_recorded(self, day: int):
+        """
+        Vérifie que le jour `day` ne dépasse pas le dernier jour enregistré
+        """
+        if self.__last_day is None:
+            raise ValueError("Nothing was recorded in this replay")
+        if day > self.__last_day:
+            raise ValueError(
+                f"Day {day} was not recorded, the replay ends on day "
+                f"{self.__last_day}"
+            )
+
+    def colony_at(self, day: int, debug: bool = False) -> Colony:
+        """
+        Colonie du jour `day`, recréée à partir du checkpoint le plus proche.
+        Un jour après le dernier jour enregistré est refusé.
+        """
+        self.__check_recorded(day)
+        days = self.days
+        index = bisect_right(days, day)
+        if index == 0:
+            raise ValueError(f"No checkpoint was recorded on or before day {day}")
+
+        colony = Colony.from_checkpoint(
+            self.__settings, self.__checkpoints[days[index - 1]], debug=debug
+        )
+        while colony.day < day:
+            colony.evolve()
+        return colony
+
+    def iter_days(
+        self, start: int, stop: int = None, step: int = 1, debug: bool = False
+    ) -> Iterator[Colony]:
+        """
+        Génère la colonie des jours range(start, stop, step), ou de `start`
+        jusqu'au dernier jour enregistré. C'est la même colonie qui évolue
+        d'un jour à l'autre : utiliser checkpoint ou to_dict pour en garder
+        une copie.
+        """
+        if step < 1:
+            raise ValueError("The step must be a positive number of days")
+        if stop is None:
+            self.__check_recorded(start)
+            stop = self.__last_day + 1
+        self.__check_recorded(stop - 1)
+
+        if start >= stop:
+            return
+        colony = self.colony_at(start, debug)
+        while True:
+            yield colony
+            if colony.day + step >= stop:
+                return
+            for _ in range(step):
+                colony.evolve()
+
+    def save(self, file_path: str, compression: str = None, level: int = None):
+        """
+        Ecrit le replay dans un fichier JSON Lines, un checkpoint par ligne
+        """
+        encoder = json.JSONEncoder()
+        with open_file(file_path, "w", compression, level) as file:
+            header = {
+                "settings": self.__settings.to_dict(),
+                "every": self.__every,
+                "last_day": self.__last_day,
+            }
+            file.write(encoder.encode(header) + "\n")
+            for day in self.days:
+                file.write(encoder.encode(self.__checkpoints[day]) + "\n")
+
+    @classmethod
+    def load(cls, file_path: str) -> "Replay":
+        """
+        Lit un replay écrit par save
+        """
+        with open_file(file_path) as file:
+            header = json.loads(file.readline())
+            replay = cls(Settings(**header["settings"]), header["every"])
+            for line in file:
+                checkpoint = json.loads(line)
+                replay.__checkpoints[checkpoint["day"]] = checkpoint
+        replay.__last_day = header["last_day"]
+        return replay
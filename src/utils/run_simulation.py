@@ -1,26 +1,65 @@
 """
 Fichier permettant de démarrer une simulation
 """
-import time
-import random
-
 from rich.live import Live
+from rich.table import Table
 from rich.console import Console
-from rich.prompt import Confirm
+from rich.prompt import Confirm, Prompt
 
-from src.classes.food import Food
-from src.classes.colony import Colony
 from src.classes.settings import Settings
+from src.classes.colony import Colony
+from src.classes.history import History
 
 from src.utils.table import create_table
 from src.utils.panel import create_panel
-from src.utils.day_to_string import days_to_string
-from src.utils.files import create_save_file
+from src.utils.chart import HistoryChart
+from src.utils.files import (
+    create_save_file,
+    create_telemetry_recorder,
+    create_unique_id,
+    load_telemetry,
+    save_replay,
+)
+from src.utils.headless import create_colony
+from src.utils.autosave import Autosaver
+from src.utils.replay import Replay
+from src.utils.runner import DISPLAY_FPS, SimulationRunner, sample
+from src.utils.live_metrics import LiveMetrics
+from src.utils.fast_forward import FastForward
+
+
+def __prompt_fast_forward(console: Console, fps: float) -> FastForward:
+    """
+    Demande le mode d'avance rapide, ou None pour avancer jour par jour
+    """
+    while True:
+        answer = Prompt.ask(
+            "Playback (normal, x10, x100, adaptive, queen-death, extinction, "
+            "population N)",
+            default="normal",
+        )
+        if answer.strip().lower() == "normal":
+            return None
+        try:
+            return FastForward.parse(answer, fps)
+        except ValueError as error:
+            console.print(create_panel(str(error), "red", "Error"))
 
 
-def run_simulation(console: Console, settings: Settings) -> bool:
+def run_simulation(
+    console: Console,
+    settings: Settings,
+    colony: Colony = None,
+    fps: float = DISPLAY_FPS,
+) -> bool:
     """
-    Démarre la simulation
+    Démarre la simulation, ou reprend `colony` si elle est donnée.
+    La simulation tourne dans son propre thread (simulation_speed secondes
+    entre deux jours, 0 pour aller le plus vite possible) et l'affichage est
+    rafraîchi `fps` fois par seconde avec les derniers compteurs et le
+    graphique de l'historique, de taille fixe. Une avance
+    rapide (x10, x100, adaptative ou jusqu'à un évènement) peut être choisie
+    avant de démarrer.
     """
     console.clear()
 
@@ -34,50 +73,85 @@ def run_simulation(console: Console, settings: Settings) -> bool:
         )
     )
 
-    if not Confirm.ask("Start simulation?"):
+    if not Confirm.ask("Resume simulation?" if colony else "Start simulation?"):
         return True
+    fast_forward = __prompt_fast_forward(console, fps)
 
-    random.seed(settings.simulation_seed)
-
-    sim_food = Food(settings)
-    sim_colony = Colony(settings, sim_food)
-
-    with Live(auto_refresh=False) as live:
-        while sim_colony.ants or sim_colony.queen.is_alive or sim_colony.eggs:
-            sim_colony.evolve()
-            live.update(
-                create_table(
-                    rows=[
-                        ("Total Time", days_to_string(sim_colony.day)),
-                        ("Days", str(sim_colony.day)),
-                        ("Eggs", str(sim_colony.egg_count())),
-                        ("Ants", str(sim_colony.ant_count())),
-                        ("Workers", str(sim_colony.worker_count())),
-                        ("Food", str(round(sim_colony.food.quantity, 2))),
-                        (
-                            "Queen",
-                            "Alive" if sim_colony.queen.is_alive else "Deceased",
-                        ),
-                        ("Dead Ants", str(sim_colony.dead_ant_count())),
-                    ],
-                )
-            )
-            live.refresh()
-            time.sleep(settings.simulation_speed)
+    sim_colony = colony or create_colony(settings)
+    autosaver = Autosaver()
+    unique_id = create_unique_id()
+    recorder = create_telemetry_recorder(unique_id)
+    replay = Replay(settings)
+    replay.record(sim_colony)
+    history = History()
+    history.record(sim_colony)
+
+    runner = SimulationRunner(
+        sim_colony,
+        settings.simulation_speed,
+        on_day=(
+            recorder.record,
+            replay.record,
+            history.record,
+            autosaver.maybe_save,
+        ),
+        fast_forward=fast_forward,
+    )
+
+    # Vue construite une seule fois : le tableau est mis à jour en place et
+    # le graphique se redessine depuis l'historique à chaque rafraîchissement
+    metrics = LiveMetrics()
+    view = Table.grid(padding=(0, 1))
+    view.add_row(metrics.table, HistoryChart(history))
+    stats = {}
+
+    def render(counters: dict) -> bool:
+        if runner.fast_forward:
+            playback = runner.fast_forward.describe()
+        elif runner.last_event:
+            playback = f"normal (reached {runner.last_event.replace('until ', '')})"
+        else:
+            playback = "normal"
+        # L'historique n'avance qu'avec les jours : rien à redessiner si
+        # aucune cellule du tableau n'a changé
+        if not metrics.update({**counters, "playback": playback}):
+            return False
+        live.refresh()
+        return True
+
+    try:
+        with Live(view, auto_refresh=False) as live:
+            runner.start()
+            sample(runner, render, fps, stats=stats)
+    finally:
+        runner.stop()
+        runner.join()
+        recorder.close()
+        autosaver.close()
 
     console.print(
         create_panel(
-            "Simulation completed. The results are displayed above.",
+            "Simulation completed. The results are displayed above.\n"
+            f"Rendering: {stats['frames']} frames ({stats['skipped']} skipped), "
+            f"{stats['render_seconds'] / max(stats['elapsed'], 1e-9):.1%} "
+            "of run time",
             "green",
             "Ended",
         )
     )
 
-    unique_id = create_save_file(sim_colony)
+    create_save_file(
+        sim_colony,
+        unique_id=unique_id,
+        peak_population=int(max(load_telemetry(unique_id)["ants"], default=0)),
+    )
+    save_replay(replay, unique_id)
 
     console.print(
         create_panel(
-            f"Simulation saved at: saves/sim_{unique_id}.json",
+            f"Simulation saved at: saves/sim_{unique_id}.json\n"
+            f"Daily metrics saved at: saves/sim_{unique_id}.telemetry\n"
+            f"Replay saved at: saves/sim_{unique_id}.replay",
             "green",
             "Saved",
         )
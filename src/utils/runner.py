@@ -0,0 +1,185 @@
+"""
+Ce module contient la classe SimulationRunner, qui fait évoluer une colonie
+dans son propre thread : l'affichage lit le dernier état publié à son propre
+rythme, sans jamais ralentir la simulation.
+"""
+
+import threading
+import time
+from typing import Callable, Iterable
+
+from src.utils.headless import is_running
+from src.utils.fast_forward import FastForward, run_batch
+
+DISPLAY_FPS = 10.0
+RENDER_SHARE = 0.05
+
+
+def take_counters(colony) -> dict:
+    """
+    Compteurs d'une colonie à un instant donné, indépendants de la colonie
+    """
+    return {
+        "day": colony.day,
+        "eggs": colony.egg_count(),
+        "ants": colony.ant_count(),
+        "workers": colony.worker_count(),
+        "food": colony.food.quantity,
+        "queen_alive": colony.queen.is_alive,
+        "dead_ants": colony.dead_ant_count(),
+    }
+
+
+class SimulationRunner(threading.Thread):
+    """
+    Classe représentant le thread d'une simulation.
+
+    La colonie évolue jusqu'à son extinction (ou jusqu'à stop) avec
+    `day_delay` secondes entre deux jours, 0 pour aller le plus vite possible.
+    Après chaque jour, les fonctions `on_day` sont appelées avec la colonie
+    puis ses compteurs sont publiés dans `counters`. Seul ce thread touche à
+    la colonie pendant la simulation.
+
+    Un mode d'avance rapide (FastForward) peut être donné ou changé pendant
+    la simulation : les compteurs sont alors publiés après chaque lot.
+    """
+
+    def __init__(
+        self,
+        colony,
+        day_delay: float = 0.0,
+        on_day: Iterable[Callable] = (),
+        fast_forward: FastForward = None,
+    ):
+        super().__init__(name="simulation", daemon=True)
+        if day_delay < 0:
+            raise ValueError("The delay between two days cannot be negative")
+
+        self.__colony = colony
+        self.__day_delay = day_delay
+        self.__on_day = list(on_day)
+        self.__stopped = threading.Event()
+        self.__error = None
+        self.__counters = take_counters(colony)
+        self.__fast_forward = fast_forward
+        self.__last_event = None
+
+    @property
+    def colony(self):
+        """
+        Colonie simulée. A ne lire qu'une fois le thread terminé.
+        """
+        return self.__colony
+
+    @property
+    def counters(self) -> dict:
+        """
+        Compteurs du dernier jour simulé
+        """
+        return self.__counters
+
+    @property
+    def fast_forward(self) -> FastForward:
+        """
+        Mode d'avance rapide en cours, ou None
+        """
+        return self.__fast_forward
+
+    @fast_forward.setter
+    def fast_forward(self, value: FastForward):
+        """
+        Change le mode d'avance rapide à partir du lot suivant
+        """
+        self.__fast_forward = value
+
+    @property
+    def last_event(self) -> str:
+        """
+        Dernier évènement qui a arrêté une avance rapide, ou None
+        """
+        return self.__last_event
+
+    def run(self):
+        try:
+            while is_running(self.__colony) and not self.__stopped.is_set():
+                fast_forward = self.__fast_forward
+                if fast_forward is None:
+                    self.__colony.evolve()
+                    for callback in self.__on_day:
+                        callback(self.__colony)
+                    delay = self.__day_delay
+                else:
+                    start = time.perf_counter()
+                    if run_batch(self.__colony, fast_forward, self.__on_day):
+                        self.__last_event = fast_forward.describe()
+                        if self.__fast_forward is fast_forward:
+                            self.__fast_forward = None
+                    delay = fast_forward.delay(
+                        self.__day_delay, time.perf_counter() - start
+                    )
+                self.__counters = take_counters(self.__colony)
+                if delay:
+                    self.__stopped.wait(delay)
+        except Exception as error:
+            self.__error = error
+
+    def stop(self):
+        """
+        Demande l'arrêt de la simulation après le jour en cours
+        """
+        self.__stopped.set()
+
+    def result(self, timeout: float = None):
+        """
+        Attend la fin du thread et lève l'erreur de la simulation s'il y en a eu
+        """
+        self.join(timeout)
+        if self.__error is not None:
+            raise self.__error
+        return self.__colony
+
+
+def sample(
+    runner: SimulationRunner,
+    render: Callable,
+    fps: float = DISPLAY_FPS,
+    max_share: float = RENDER_SHARE,
+    stats: dict = None,
+):
+    """
+    Appelle `render(counters)` au plus `fps` fois par seconde tant que la
+    simulation tourne, puis une dernière fois avec les compteurs finaux.
+    Si l'affichage prend plus de `max_share` du temps, les images sont
+    espacées d'autant. `render` peut renvoyer False quand il n'a rien
+    redessiné. Si `stats` est donné, il reçoit le nombre d'images, d'images
+    sautées, le temps passé à afficher et la durée totale.
+    """
+    if fps <= 0:
+        raise ValueError("The display frame rate must be positive")
+    if not 0 < max_share <= 1:
+        raise ValueError("The rendering share must be between 0 and 1")
+
+    frame = 1 / fps
+    frames = skipped = 0
+    render_seconds = 0.0
+    begin = time.perf_counter()
+    while True:
+        finished = not runner.is_alive()
+        start = time.perf_counter()
+        if render(runner.counters) is False:
+            skipped += 1
+        duration = time.perf_counter() - start
+        frames += 1
+        render_seconds += duration
+        if finished:
+            break
+        runner.join(max(frame - duration, duration / max_share - duration))
+
+    if stats is not None:
+        stats.update(
+            frames=frames,
+            skipped=skipped,
+            render_seconds=render_seconds,
+            elapsed=time.perf_counter() - begin,
+        )
+    return runner.result()
@@ -0,0 +1,237 @@
+"""
+Ce module contient les fonctions pour écrire et lire les sauvegardes agent par
+agent, par blocs de CHUNK_SIZE agents : la mémoire utilisée ne dépend pas du
+nombre de fourmis et d'oeufs.
+
+Format JSON Lines :
+    ligne 1 : en-tête (paramètres, jour, reine, nourriture, nombre d'agents)
+    puis une ligne par fourmi, puis une ligne par oeuf
+
+Format JSON : un seul document JSON, écrit ligne par ligne pour être relu
+par blocs sans être décodé en entier :
+    ligne 1 : {"settings": ..., "header": ... (même en-tête qu'en JSON Lines)
+    puis , "colony": ... et ses listes "ants" et "eggs", un agent par ligne
+    puis éventuellement , "checkpoint": ... et sa liste "ants", un bloc de
+    colonnes par ligne
+    puis une ligne par valeur supplémentaire, et } sur la dernière ligne
+"""
+
+import json
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
+
+from src.classes.settings import Settings
+from src.utils.compression import open_file
+
+CHUNK_SIZE = 10_000
+GROUPS = ("ants", "eggs")
+
+
+def iter_chunks(items: Iterable, chunk_size: int = CHUNK_SIZE) -> Iterator[List]:
+    """
+    Découpe `items` en listes d'au plus `chunk_size` éléments
+    """
+    items = iter(items)
+    chunk = list(islice(items, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(items, chunk_size))
+
+
+def __scalars(colony) -> dict:
+    return {
+        "day": colony.day,
+        "queen": colony.queen.to_dict(),
+        "food": colony.food.to_dict(),
+    }
+
+
+def __agents(colony, group: str) -> Iterator[dict]:
+    return colony.iter_ant_dicts() if group == "ants" else colony.iter_egg_dicts()
+
+
+def __header(settings: Settings, colony) -> dict:
+    return {
+        "settings": settings.to_dict(),
+        "colony": __scalars(colony),
+        "ants": colony.ant_count() - int(colony.queen.is_alive),
+        "eggs": colony.egg_count(),
+    }
+
+
+def __write_items(
+    file, encoder: json.JSONEncoder, key: str, items: Iterable, chunk_size: int
+):
+    """
+    Ecrit la liste `key` d'un objet, un élément par ligne, entre une ligne
+    qui l'ouvre et une ligne qui commence par ]
+    """
+    file.write(f'\n, "{key}": [')
+    separator = "\n"
+    for chunk in iter_chunks(items, chunk_size):
+        file.write(separator + ",\n".join(map(encoder.encode, chunk)))
+        separator = ",\n"
+    file.write("\n]")
+
+
+def write_json(
+    file_path: str,
+    settings: Settings,
+    colony,
+    extra: dict = None,
+    chunk_size: int = CHUNK_SIZE,
+    compression: str = None,
+    level: int = None,
+    checkpoint: bool = False,
+):
+    """
+    Ecrit une sauvegarde JSON de la même forme que
+    {"settings": ..., "header": ..., "colony": colony.to_dict(), **extra},
+    sans jamais construire la liste complète des agents. Avec `checkpoint`,
+    le checkpoint de la colonie est écrit après elle, ses fourmis par blocs
+    de `chunk_size` colonnes.
+    """
+    encoder = json.JSONEncoder()
+    header = __header(settings, colony)
+    with open_file(file_path, "w", compression, level) as file:
+        file.write('{"settings": ')
+        file.write(encoder.encode(header.pop("settings")))
+        file.write(f', "header": {encoder.encode(header)}')
+        file.write(f'\n, "colony": {encoder.encode(header["colony"])[:-1]}')
+        for group in GROUPS:
+            __write_items(file, encoder, group, __agents(colony, group), chunk_size)
+        file.write("}")
+        if checkpoint:
+            scalars = colony.checkpoint(with_ants=False)
+            file.write(f'\n, "checkpoint": {encoder.encode(scalars)[:-1]}')
+            # Chaque élément est déjà un bloc de `chunk_size` fourmis
+            __write_items(
+                file, encoder, "ants", colony.iter_checkpoint_ants(chunk_size), 1
+            )
+            file.write("}")
+        for key, value in (extra or {}).items():
+            file.write(f"\n, {encoder.encode(key)}: {encoder.encode(value)}")
+        file.write("\n}\n")
+
+
+def __parse_json_header(line: str) -> dict:
+    """
+    En-tête lu sur la première ligne d'une sauvegarde JSON, ou None si elle
+    n'en a pas (sauvegarde écrite d'un seul bloc)
+    """
+    if not line.startswith('{"settings": '):
+        return None
+    try:
+        data = json.loads(line + "}")
+    except ValueError:
+        return None
+    if "header" not in data:
+        return None
+    return {"settings": data["settings"], **data["header"]}
+
+
+def read_json_header(file_path: str) -> dict:
+    """
+    Lit uniquement l'en-tête d'une sauvegarde JSON, de la même forme que
+    celui d'une sauvegarde JSON Lines, ou None si elle n'en a pas
+    """
+    with open_file(file_path) as file:
+        return __parse_json_header(file.readline())
+
+
+def iter_json_agents(
+    file_path: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple[str, List[dict]]]:
+    """
+    Lit les agents d'une sauvegarde JSON par blocs : génère des couples
+    (groupe, liste d'au plus `chunk_size` agents), les fourmis puis les oeufs
+    """
+    with open_file(file_path) as file:
+        header = __parse_json_header(file.readline())
+        if header is None:
+            raise ValueError("This save file has no header to be read in chunks")
+        file.readline()  # Valeurs de la colonie, déjà dans l'en-tête
+        for group in GROUPS:
+            file.readline()
+            lines = islice(file, header[group])
+            for chunk in iter_chunks(lines, chunk_size):
+                yield group, [json.loads(line.rstrip().rstrip(",")) for line in chunk]
+            file.readline()
+
+
+def __iter_json_checkpoint(file_path: str) -> Iterator[dict]:
+    """
+    Génère le checkpoint d'une sauvegarde JSON sans ses fourmis, puis les
+    blocs de colonnes de ses fourmis
+    """
+    with open_file(file_path) as file:
+        if __parse_json_header(file.readline()) is None:
+            raise ValueError("This save file has no header to be read in chunks")
+        # Les agents de la colonie sont sautés sans être décodés
+        prefix = ', "checkpoint": '
+        for line in file:
+            if line.startswith(prefix):
+                break
+        else:
+            raise ValueError("This save file has no checkpoint to resume from")
+        yield json.loads(line[len(prefix) :].rstrip() + "}")
+        file.readline()
+        for line in file:
+            if line.startswith("]"):
+                break
+            yield json.loads(line.rstrip().rstrip(","))
+
+
+def read_json_checkpoint(file_path: str) -> dict:
+    """
+    Lit le checkpoint d'une sauvegarde JSON écrite avec `checkpoint`. Ses
+    fourmis sont lues dans le fichier, bloc par bloc, au fur et à mesure
+    qu'elles sont parcourues (par Colony.from_checkpoint)
+    """
+    blocks = __iter_json_checkpoint(file_path)
+    checkpoint = next(blocks)
+    checkpoint["ants"] = blocks
+    return checkpoint
+
+
+def write_json_lines(
+    file_path: str,
+    settings: Settings,
+    colony,
+    chunk_size: int = CHUNK_SIZE,
+    compression: str = None,
+    level: int = None,
+):
+    """
+    Ecrit une sauvegarde JSON Lines, un agent par ligne
+    """
+    encoder = json.JSONEncoder()
+    header = __header(settings, colony)
+    with open_file(file_path, "w", compression, level) as file:
+        file.write(encoder.encode(header) + "\n")
+        for group in GROUPS:
+            for chunk in iter_chunks(__agents(colony, group), chunk_size):
+                file.write("\n".join(map(encoder.encode, chunk)) + "\n")
+
+
+def read_json_lines_header(file_path: str) -> dict:
+    """
+    Lit uniquement l'en-tête d'une sauvegarde JSON Lines
+    """
+    with open_file(file_path) as file:
+        return json.loads(file.readline())
+
+
+def iter_json_lines(
+    file_path: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple[str, List[dict]]]:
+    """
+    Lit les agents d'une sauvegarde JSON Lines par blocs : génère des couples
+    (groupe, liste d'au plus `chunk_size` agents), les fourmis puis les oeufs
+    """
+    with open_file(file_path) as file:
+        header = json.loads(file.readline())
+        for group in GROUPS:
+            lines = islice(file, header[group])
+            for chunk in iter_chunks(lines, chunk_size):
+                yield group, [json.loads(line) for line in chunk]
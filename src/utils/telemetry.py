@@ -0,0 +1,107 @@
+"""
+Ce module contient la classe TelemetryRecorder, qui enregistre les métriques
+de chaque jour d'une simulation dans un fichier binaire compact.
+
+Disposition du fichier :
+    MAGIC | taille de l'en-tête (uint64) | en-tête JSON | enregistrements
+Chaque enregistrement contient les métriques d'un jour (voir METRICS), sans
+séparateur, dans le format décrit par l'en-tête.
+"""
+
+import json
+import struct
+
+import numpy as np
+
+from src.classes.time_series import METRICS
+
+MAGIC = b"ANTTEL01"
+BUFFER_DAYS = 4096
+RECORD_DTYPE = np.dtype(
+    [(name, np.dtype(typecode).newbyteorder("<")) for name, typecode in METRICS]
+)
+
+
+class TelemetryRecorder:
+    """
+    Classe représentant l'enregistreur des métriques journalières.
+
+    Les métriques sont copiées dans un tampon préalloué de `buffer_days`
+    jours, puis écrites d'un bloc dans le fichier quand le tampon est plein :
+    un jour ne coûte qu'une affectation dans un tableau NumPy.
+    """
+
+    def __init__(self, file_path: str, buffer_days: int = BUFFER_DAYS):
+        if buffer_days < 1:
+            raise ValueError("The telemetry buffer must hold at least one day")
+
+        self.__file_path = file_path
+        self.__buffer = np.empty(buffer_days, dtype=RECORD_DTYPE)
+        self.__size = 0
+        self.__recorded = 0
+
+        header = json.dumps({"metrics": RECORD_DTYPE.descr}).encode("utf8")
+        self.__file = open(file_path, "wb")
+        self.__file.write(MAGIC)
+        self.__file.write(struct.pack("<Q", len(header)))
+        self.__file.write(header)
+        self.__file.flush()
+
+    @property
+    def file_path(self) -> str:
+        """
+        Fichier où sont écrites les métriques
+        """
+        return self.__file_path
+
+    def __len__(self) -> int:
+        return self.__recorded
+
+    def record(self, colony):
+        """
+        Ajoute les métriques du jour courant d'une colonie
+        """
+        self.__buffer[self.__size] = (
+            colony.day,
+            colony.egg_count(),
+            colony.ant_count(),
+            colony.worker_count(),
+            colony.food.quantity,
+            colony.queen.is_alive,
+            colony.dead_ant_count(),
+        )
+        self.__size += 1
+        self.__recorded += 1
+        if self.__size == len(self.__buffer):
+            self.flush()
+
+    def flush(self):
+        """
+        Ecrit les jours en attente dans le fichier
+        """
+        if self.__size:
+            self.__file.write(self.__buffer[: self.__size].tobytes())
+            self.__size = 0
+        self.__file.flush()
+
+    def close(self):
+        """
+        Ecrit les jours en attente et ferme le fichier
+        """
+        if not self.__file.closed:
+            self.flush()
+            self.__file.close()
+
+
+def read_telemetry(file_path: str) -> np.ndarray:
+    """
+    Lit un fichier de métriques. Renvoie un tableau structuré avec une ligne
+    par jour et une colonne par métrique (par exemple records["ants"]).
+    """
+    with open(file_path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError("The file is not a telemetry file")
+        (length,) = struct.unpack("<Q", file.read(8))
+        header = json.loads(file.read(length).decode("utf8"))
+        dtype = np.dtype([tuple(metric) for metric in header["metrics"]])
+        return np.fromfile(file, dtype=dtype)